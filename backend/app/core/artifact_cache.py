@@ -0,0 +1,202 @@
+"""Content-addressed cache for rendered export artifacts (PDF, DOCX, TXT)"""
+
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from app.core.cache import RedisCache
+from app.core.config import settings
+from app.core.constants import ArtifactCacheConfig
+
+logger = logging.getLogger(__name__)
+
+
+def artifact_key(*parts) -> str:
+    """Build a stable key from a canonical JSON encoding of the parts"""
+    canonical = json.dumps(
+        parts, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ArtifactCache:
+    """Binary cache with in-process LRU, local disk and Redis tiers"""
+
+    REDIS_PREFIX = "artifact:"
+
+    def __init__(
+        self,
+        disk_dir: str,
+        memory_max_bytes: int = ArtifactCacheConfig.MEMORY_MAX_BYTES,
+        disk_max_bytes: int = ArtifactCacheConfig.DISK_MAX_BYTES,
+        redis_max_item_bytes: int = ArtifactCacheConfig.REDIS_MAX_ITEM_BYTES,
+        ttl: int = ArtifactCacheConfig.TTL,
+        redis: Optional[RedisCache] = None,
+    ):
+        self.disk_dir = disk_dir
+        self.memory_max_bytes = memory_max_bytes
+        self.disk_max_bytes = disk_max_bytes
+        self.redis_max_item_bytes = redis_max_item_bytes
+        self.ttl = ttl
+        self.redis = redis
+
+        self._memory: OrderedDict[str, bytes] = OrderedDict()
+        self._memory_bytes = 0
+        self._disk_bytes: Optional[int] = None
+        self._lock = threading.Lock()
+
+    # Memory tier
+
+    def _memory_get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            content = self._memory.get(key)
+            if content is not None:
+                self._memory.move_to_end(key)
+            return content
+
+    def _memory_set(self, key: str, content: bytes):
+        # Large artifacts would evict the whole tier for a single entry
+        if len(content) > self.memory_max_bytes // 4:
+            return
+        with self._lock:
+            previous = self._memory.pop(key, None)
+            if previous is not None:
+                self._memory_bytes -= len(previous)
+            self._memory[key] = content
+            self._memory_bytes += len(content)
+            while self._memory_bytes > self.memory_max_bytes:
+                _, evicted = self._memory.popitem(last=False)
+                self._memory_bytes -= len(evicted)
+
+    # Disk tier
+
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.disk_dir, key[:2], key)
+
+    def _disk_get(self, key: str) -> Optional[bytes]:
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as f:
+                content = f.read()
+            os.utime(path)  # Refresh recency for eviction
+            return content
+        except FileNotFoundError:
+            return None
+        except OSError as e:
+            logger.warning(f"Artifact disk read failed for {key}: {e}")
+            return None
+
+    def _disk_set(self, key: str, content: bytes):
+        path = self._disk_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Artifact disk write failed for {key}: {e}")
+            return
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = self._scan_disk_bytes()
+            else:
+                self._disk_bytes += len(content)
+            over_budget = self._disk_bytes > self.disk_max_bytes
+        if over_budget:
+            self._evict_disk()
+
+    def _disk_entries(self):
+        for root, _, files in os.walk(self.disk_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    def _scan_disk_bytes(self) -> int:
+        return sum(size for _, size, _ in self._disk_entries())
+
+    def _evict_disk(self):
+        """Remove least recently used files until the disk tier is under budget"""
+        entries = sorted(self._disk_entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.disk_max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+        with self._lock:
+            self._disk_bytes = total
+
+    # Redis tier
+
+    def _redis_get(self, key: str) -> Optional[bytes]:
+        if not self.redis or not self.redis.client:
+            return None
+        try:
+            return self.redis.client.get(self.REDIS_PREFIX + key)
+        except Exception as e:
+            logger.error(f"Artifact Redis get error: {e}")
+            return None
+
+    def _redis_set(self, key: str, content: bytes):
+        if not self.redis or not self.redis.client:
+            return
+        if len(content) > self.redis_max_item_bytes:
+            return
+        try:
+            self.redis.client.setex(self.REDIS_PREFIX + key, self.ttl, content)
+        except Exception as e:
+            logger.error(f"Artifact Redis set error: {e}")
+
+    # Public API
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get artifact bytes, promoting hits into the faster tiers"""
+        content = self._memory_get(key)
+        if content is not None:
+            return content
+
+        content = self._disk_get(key)
+        if content is not None:
+            self._memory_set(key, content)
+            return content
+
+        content = self._redis_get(key)
+        if content is not None:
+            self._disk_set(key, content)
+            self._memory_set(key, content)
+        return content
+
+    def set(self, key: str, content: bytes):
+        """Store artifact bytes in every tier"""
+        self._memory_set(key, content)
+        self._disk_set(key, content)
+        self._redis_set(key, content)
+
+    def clear_memory(self):
+        """Drop the in-process tier"""
+        with self._lock:
+            self._memory.clear()
+            self._memory_bytes = 0
+
+
+# Global artifact cache instance
+artifact_cache = ArtifactCache(
+    settings.artifact_cache_dir
+    or os.path.join(tempfile.gettempdir(), "resumade-artifacts"),
+    redis=RedisCache(decode_responses=False),
+)
@@ -31,8 +31,9 @@ def deserialize_from_cache(data):
 
 
 class RedisCache:
-    def __init__(self):
+    def __init__(self, decode_responses: bool = True):
         self.client = None
+        self.decode_responses = decode_responses
         self._connect()
 
     def _connect(self):
@@ -45,7 +46,7 @@ class RedisCache:
                 port=6379,
                 password=settings.upstash_redis_token,
                 ssl=True,
-                decode_responses=True,
+                decode_responses=self.decode_responses,
             )
             # Test connection
             self.client.ping()
@@ -0,0 +1,248 @@
+"""Negotiated gzip/brotli response compression and pre-compressed bodies"""
+
+import gzip
+import hashlib
+import threading
+import zlib
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional
+
+import brotli
+
+from app.core.constants import CompressionConfig
+
+# Preferred first when the client accepts both equally
+ENCODINGS = ("br", "gzip")
+
+
+def negotiate(accept_encoding: str) -> Optional[str]:
+    """Pick the best supported encoding from an Accept-Encoding header"""
+    weights = {}
+    for item in accept_encoding.lower().split(","):
+        coding, _, params = item.strip().partition(";")
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        weights[coding.strip()] = quality
+
+    best, best_quality = None, 0.0
+    for encoding in ENCODINGS:
+        quality = weights.get(encoding, weights.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
+
+
+def is_compressible(content_type: str) -> bool:
+    media_type = content_type.split(";")[0].strip().lower()
+    return media_type in CompressionConfig.COMPRESSIBLE_TYPES
+
+
+def compress(
+    content: bytes,
+    encoding: str,
+    gzip_level: int = CompressionConfig.GZIP_LEVEL,
+    brotli_quality: int = CompressionConfig.BROTLI_QUALITY,
+) -> bytes:
+    """Compress a whole body with the given content encoding"""
+    if encoding == "br":
+        return brotli.compress(content, quality=brotli_quality)
+    return gzip.compress(content, compresslevel=gzip_level, mtime=0)
+
+
+class CachedBody(NamedTuple):
+    """Response body with its strong ETag and pre-compressed variants"""
+
+    content: bytes
+    etag: str
+    encodings: Dict[str, bytes]
+
+    def variant(self, encoding: Optional[str]):
+        """Get (content, etag, encoding) to send, falling back to identity"""
+        if encoding not in self.encodings:
+            return self.content, self.etag, None
+        return self.encodings[encoding], f'{self.etag[:-1]}-{encoding}"', encoding
+
+
+def cached_body(content: bytes, etag: Optional[str] = None) -> CachedBody:
+    """Build a cached body, compressing it once with the best settings"""
+    if etag is None:
+        etag = '"' + hashlib.sha256(content).hexdigest()[:32] + '"'
+    encodings = {}
+    if len(content) >= CompressionConfig.MIN_SIZE:
+        encodings = {
+            "br": compress(
+                content,
+                "br",
+                brotli_quality=CompressionConfig.PRECOMPRESSED_BROTLI_QUALITY,
+            ),
+            "gzip": compress(content, "gzip", gzip_level=9),
+        }
+    return CachedBody(content, etag, encodings)
+
+
+class BodyCache:
+    """Bounded LRU of pre-compressed response bodies"""
+
+    def __init__(self, max_entries: int = CompressionConfig.MAX_CACHED_PAGES):
+        self.max_entries = max_entries
+        self._bodies: OrderedDict[tuple, CachedBody] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: tuple) -> Optional[CachedBody]:
+        with self._lock:
+            body = self._bodies.get(key)
+            if body is not None:
+                self._bodies.move_to_end(key)
+            return body
+
+    def set(self, key: tuple, content: bytes) -> CachedBody:
+        body = cached_body(content)
+        with self._lock:
+            self._bodies[key] = body
+            while len(self._bodies) > self.max_entries:
+                self._bodies.popitem(last=False)
+        return body
+
+
+class _Compressor:
+    """Incremental compressor for one response body"""
+
+    def __init__(self, encoding: str):
+        if encoding == "br":
+            self._brotli = brotli.Compressor(quality=CompressionConfig.BROTLI_QUALITY)
+            self._zlib = None
+        else:
+            self._brotli = None
+            # wbits=31 writes a gzip header and trailer
+            self._zlib = zlib.compressobj(CompressionConfig.GZIP_LEVEL, wbits=31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.process(chunk) + self._brotli.flush()
+        return self._zlib.compress(chunk) + self._zlib.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        if self._brotli is not None:
+            return self._brotli.finish()
+        return self._zlib.flush()
+
+
+class CompressionMiddleware:
+    """Compress text responses for clients that accept gzip or brotli
+
+    Only HTML, text and JSON bodies of at least MIN_SIZE bytes are
+    compressed; PDF and DOCX are already compressed formats and pass
+    through untouched, as do responses that set their own Content-Encoding
+    (pre-compressed cached bodies). Streamed bodies are compressed chunk by
+    chunk.
+    """
+
+    def __init__(self, app, min_size: int = CompressionConfig.MIN_SIZE):
+        self.app = app
+        self.min_size = min_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        encoding = negotiate(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        responder = _CompressingResponder(encoding, self.min_size, send)
+        await self.app(scope, receive, responder)
+
+
+class _CompressingResponder:
+    """ASGI send wrapper that decides per response whether to compress"""
+
+    def __init__(self, encoding: str, min_size: int, send):
+        self.encoding = encoding
+        self.min_size = min_size
+        self.send = send
+        self.start_message = None
+        self.active = None  # Undecided until the body size is known
+        self.buffer = b""
+        self.compressor: Optional[_Compressor] = None
+
+    async def __call__(self, message):
+        if message["type"] == "http.response.start":
+            headers = {key.lower(): value for key, value in message.get("headers", [])}
+            content_type = headers.get(b"content-type", b"").decode("latin-1")
+            if b"content-encoding" in headers or not is_compressible(content_type):
+                self.active = False
+                await self.send(message)
+            else:
+                self.start_message = message
+            return
+
+        if message["type"] != "http.response.body" or self.active is False:
+            await self.send(message)
+            return
+
+        body = message.get("body", b"")
+        more_body = message.get("more_body", False)
+
+        if self.active is None:
+            self.buffer += body
+            if more_body and len(self.buffer) < self.min_size:
+                return
+
+            body, self.buffer = self.buffer, b""
+            if not more_body:
+                # Whole body is known: send it with its length
+                self.active = False
+                if len(body) >= self.min_size:
+                    body = compress(body, self.encoding)
+                    await self._start(self.encoding, len(body))
+                else:
+                    await self._start(None, len(body))
+                await self.send({"type": "http.response.body", "body": body})
+                return
+
+            self.active = True
+            self.compressor = _Compressor(self.encoding)
+            await self._start(self.encoding, None)
+
+        chunk = self.compressor.compress(body)
+        if not more_body:
+            chunk += self.compressor.finish()
+        await self.send(
+            {"type": "http.response.body", "body": chunk, "more_body": more_body}
+        )
+
+    async def _start(self, encoding: Optional[str], length: Optional[int]):
+        message = self.start_message
+        headers = []
+        vary = [b"Accept-Encoding"]
+        for key, value in message.get("headers", []):
+            name = key.lower()
+            if name == b"content-length":
+                continue
+            if name == b"vary":
+                vary.insert(0, value)
+                continue
+            if name == b"etag" and encoding and not value.startswith(b"W/"):
+                # The compressed bytes differ from what a strong ETag names
+                value = b"W/" + value
+            headers.append((key, value))
+
+        headers.append((b"vary", b", ".join(vary)))
+        if length is not None:
+            headers.append((b"content-length", str(length).encode("latin-1")))
+        if encoding:
+            headers.append((b"content-encoding", encoding.encode("latin-1")))
+        message["headers"] = headers
+        await self.send(message)
+
+
+# Global cache of rendered shared resume pages
+shared_pages = BodyCache()
@@ -15,6 +15,10 @@ class Settings(BaseSettings):
     service_role: str = ""
     bucket_name: str = "resumes"
 
+    # Stored PDFs: "supabase", or "local" to keep them on this node's disk
+    storage_backend: str = "supabase"
+    storage_dir: str = ""  # Local backend root (defaults to system temp)
+
     # OAuth settings
     google_client_id: str = ""
     google_client_secret: str = ""
@@ -30,6 +34,15 @@ class Settings(BaseSettings):
     # gemini ai settings
     gemini_api_key: str = ""
 
+    # PDF rendering
+    pdf_render_workers: int = 2
+    pdf_import_workers: int = 1
+    template_cache_dir: str = ""  # Jinja bytecode cache (defaults to system temp)
+    artifact_cache_dir: str = ""  # Rendered exports (defaults to system temp)
+
+    # Bearer token Prometheus scrapes /metrics with (the endpoint is off when empty)
+    metrics_token: str = ""
+
     # Redis settings
     upstash_redis_url: str = ""
     upstash_redis_token: str = ""
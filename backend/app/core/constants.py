@@ -89,6 +89,18 @@ class RateLimitConfig:
     SCORE_CHECK_PER_HOUR = 30
 
 
+class RenderConfig:
+    """Out-of-process PDF rendering configuration"""
+
+    MAX_QUEUED_RENDERS = 8  # Jobs waiting beyond the busy workers
+    RENDER_TIMEOUT_SECONDS = 30
+    MAX_RENDERS_PER_WORKER = 50  # Recycle workers to cap memory growth
+    WORKER_MEMORY_LIMIT_MB = 1536
+    RETRY_AFTER_SECONDS = 5
+    MAX_PARSED_STYLESHEETS = 64  # Per worker; 14 templates plus edits in dev
+    SLOW_RENDER_SECONDS = 2  # Log a stage breakdown for renders slower than this
+
+
 class DatabaseConfig:
     """Database connection configuration"""
 
@@ -111,6 +123,17 @@ class ResponseMessages:
     INVALID_INPUT = "Invalid input data"
     RATE_LIMIT_EXCEEDED = "Rate limit exceeded. Please try again later"
     EXPORT_FAILED = "Failed to export resume"
+    RENDER_BUSY = "Too many exports in progress. Please try again shortly"
+    RENDER_TIMEOUT = "Export took too long to render"
+    RENDER_INTERRUPTED = "Export was interrupted. Please try again shortly"
+    EXPORT_JOB_NOT_FOUND = "Export job not found"
+    EXPORT_NOT_READY = "Export is not ready yet"
+    EXPORT_EXPIRED = "Export has expired. Please request it again"
+    NOT_A_PDF = "File must be a PDF"
+    IMPORT_BUSY = "Too many PDF imports in progress. Please try again shortly"
+    IMPORT_TOO_COMPLEX = "PDF is too large or complex to import"
+    IMPORT_INTERRUPTED = "PDF import was interrupted. Please try again shortly"
+    UPLOAD_TOO_LARGE = "File size exceeds 10MB limit"
     USER_CREATED = "User account created successfully"
     LOGIN_SUCCESS = "Login successful"
     INVALID_CREDENTIALS = "Invalid email or password"
@@ -162,6 +185,23 @@ class FileConstants:
     MAX_PDF_SIZE_MB = 10
     MAX_PDF_SIZE_BYTES = 10 * 1024 * 1024
     ALLOWED_EXTENSIONS = [".pdf"]
+    MULTIPART_OVERHEAD_BYTES = 64 * 1024  # Form boundaries and part headers
+
+
+class ImportConfig:
+    """Sandboxed PDF import configuration"""
+
+    MAX_PAGES = 10
+    MAX_TEXT_CHARS = 30000  # Extraction stops once a resume's worth is read
+    MAX_QUEUED_IMPORTS = 4
+    IMPORT_TIMEOUT_SECONDS = 20
+    CPU_LIMIT_SECONDS = 10  # Per import, enforced by the kernel
+    WORKER_MEMORY_LIMIT_MB = 512
+    MAX_IMPORTS_PER_WORKER = 20
+    DATE_CACHE_SIZE = 4096  # Parsed date strings per worker
+    PARSER_VERSION = 1  # Bump when extraction output changes for the same PDF
+    RESULT_CACHE_TTL = 86400  # 24 hours
+    RESULT_CACHE_SIZE = 256  # Extractions kept per process without Redis
 
 
 class CacheConstants:
@@ -174,3 +214,88 @@ class CacheConstants:
     KEYWORD_CACHE_TTL = 3600  # 1 hour
     USER_CACHE_TTL = 300  # 5 minutes
     RESUME_CACHE_TTL = 900  # 10 minutes
+
+
+class ArtifactCacheConfig:
+    """Export artifact cache configuration"""
+
+    RENDERER_VERSION = 2  # Bump when export output changes for the same input
+    MEMORY_MAX_BYTES = 64 * 1024 * 1024
+    DISK_MAX_BYTES = 1024 * 1024 * 1024
+    REDIS_MAX_ITEM_BYTES = 2 * 1024 * 1024
+    TTL = 86400  # 24 hours
+
+
+class CompressionConfig:
+    """HTTP response compression configuration"""
+
+    MIN_SIZE = 1024  # Smaller bodies are sent as is
+    GZIP_LEVEL = 6
+    BROTLI_QUALITY = 5  # Per-request bodies; cached bodies use the maximum
+    PRECOMPRESSED_BROTLI_QUALITY = 11
+    COMPRESSIBLE_TYPES = (
+        "text/html",
+        "text/plain",
+        "text/css",
+        "text/markdown",
+        "application/json",
+    )
+    MAX_CACHED_PAGES = 500  # Rendered shared resume pages per worker
+
+
+class ExportConfig:
+    """Streamed text export configuration"""
+
+    STREAM_CHUNK_SIZE = 16 * 1024  # Bytes per streamed chunk
+
+
+class ExportJobConfig:
+    """Asynchronous export job configuration"""
+
+    JOB_TTL = 3600  # 1 hour
+    MAX_LOCAL_JOBS = 1000  # Job records kept per process without Redis
+    SATURATED_RETRY_SECONDS = 2  # Wait before retrying when the render pool is full
+    MAX_SATURATED_RETRIES = 30
+
+
+class PreviewConfig:
+    """Live preview rendering configuration"""
+
+    MAX_FRAGMENTS = 5000  # Cached section fragments across all templates
+    MAX_SESSIONS = 200  # Live preview WebSocket connections per worker
+    COALESCE_SECONDS = 0.05  # Edits arriving this close together render once
+    MAX_MESSAGE_BYTES = 256 * 1024  # Keep uvicorn --ws-max-size in the Makefile equal
+    MIN_RENDER_INTERVAL_SECONDS = 0.25  # Per session, however fast edits arrive
+    RENDER_THREADS = 4  # Preview renders in flight per worker, across sessions
+    MAX_STYLESHEETS = 64  # Externalized template stylesheets per worker
+    STYLESHEET_MAX_AGE = 365 * 24 * 3600  # Fingerprinted URLs never change
+
+
+class PrerenderConfig:
+    """Speculative render-after-edit configuration"""
+
+    DEBOUNCE_SECONDS = 5  # Render once edits have been quiet this long
+    MAX_CONCURRENT = 1
+    MAX_PENDING = 500
+    RESERVED_POOL_SLOTS = 2  # Pool slots always left for interactive exports
+
+
+class UploadConfig:
+    """Background storage upload configuration"""
+
+    MAX_QUEUE_SIZE = 100
+    MAX_RETRIES = 4
+    BACKOFF_BASE_SECONDS = 0.5
+    BACKOFF_MAX_SECONDS = 30
+    DEDUP_CACHE_SIZE = 1024
+    SHUTDOWN_TIMEOUT_SECONDS = 10
+
+
+class StorageConfig:
+    """Stored artifact configuration"""
+
+    SIGNED_URL_TTL_SECONDS = 300  # 5 minutes
+    RESUME_PREFIX = "resumes"  # Objects are stored as resumes/<id>/<file>
+    MANIFEST_KEY = "storage:manifest"
+    LIST_PAGE_SIZE = 1000
+    RECONCILE_INTERVAL_SECONDS = 6 * 3600
@@ -0,0 +1,121 @@
+"""Bundled font pack and private fontconfig for PDF rendering"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+import threading
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(__file__)), "fonts")
+FONT_FILES_DIR = os.path.join(FONT_DIR, "files")
+FONTCONFIG_FILE = os.path.join(FONT_DIR, "fonts.conf")
+MANIFEST_FILE = os.path.join(FONT_DIR, "manifest.json")
+
+_font_config = None
+_lock = threading.Lock()
+
+
+def load_manifest() -> dict:
+    """Load the list of bundled font families"""
+    with open(MANIFEST_FILE) as f:
+        return json.load(f)
+
+
+def font_filename(font_id: str, weight: int, style: str) -> str:
+    """File name of one face of a bundled family"""
+    return f"{font_id}-{weight}-{style}.ttf"
+
+
+def font_faces(family: dict) -> List[Tuple[int, str]]:
+    """(weight, style) of every face of a manifest family"""
+    faces = [(weight, "normal") for weight in family["weights"]]
+    faces += [(weight, "italic") for weight in family.get("italic", [])]
+    return faces
+
+
+def expected_font_files() -> List[str]:
+    """File names of every face listed in the manifest"""
+    return [
+        font_filename(family["id"], weight, style)
+        for family in load_manifest()["families"]
+        for weight, style in font_faces(family)
+    ]
+
+
+def missing_font_files() -> List[str]:
+    """Faces listed in the manifest that have not been fetched"""
+    return [
+        name
+        for name in expected_font_files()
+        if not os.path.exists(os.path.join(FONT_FILES_DIR, name))
+    ]
+
+
+def configure_fontconfig() -> bool:
+    """Point fontconfig at the bundled pack, before any render initializes it
+
+    Falls back to the system configuration when the pack is incomplete, so
+    a checkout without fonts still renders. An explicit FONTCONFIG_FILE in
+    the environment always wins.
+    """
+    if "FONTCONFIG_FILE" in os.environ:
+        return os.environ["FONTCONFIG_FILE"] == FONTCONFIG_FILE
+
+    missing = missing_font_files()
+    if missing:
+        logger.warning(
+            f"Font pack incomplete ({len(missing)} faces missing), "
+            "using system fonts. Run scripts/fetch_fonts.py"
+        )
+        return False
+
+    os.environ["FONTCONFIG_FILE"] = FONTCONFIG_FILE
+    return True
+
+
+def build_font_cache() -> bool:
+    """Build the fontconfig cache for the pack so the first render skips the scan"""
+    if not configure_fontconfig():
+        return False
+
+    fc_cache = shutil.which("fc-cache")
+    if not fc_cache:
+        logger.warning("fc-cache not found, font cache will be built on first render")
+        return False
+
+    try:
+        subprocess.run([fc_cache, FONT_FILES_DIR], check=True, timeout=60)
+        logger.info("Font cache built")
+        return True
+    except (subprocess.SubprocessError, OSError) as e:
+        logger.warning(f"Font cache build failed: {e}")
+        return False
+
+
+def get_font_config():
+    """Get the FontConfiguration shared by every render in this process"""
+    global _font_config
+    from weasyprint.text.fonts import FontConfiguration
+
+    with _lock:
+        if _font_config is None:
+            configure_fontconfig()
+            _font_config = FontConfiguration()
+        return _font_config
+
+
+def warm_renderer():
+    """Load fonts and the layout engine in a new render worker"""
+    try:
+        from weasyprint import HTML
+
+        families = ", ".join(f"'{f['family']}'" for f in load_manifest()["families"])
+        HTML(string=f'<p style="font-family: {families}">Warm up</p>').write_pdf(
+            font_config=get_font_config()
+        )
+    except Exception as e:
+        logger.warning(f"Render worker warm-up failed: {e}")
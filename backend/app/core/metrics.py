@@ -0,0 +1,41 @@
+"""Prometheus metrics exposition, aggregated across worker processes
+
+Metrics are prometheus_client collectors on its default registry. With
+several uvicorn workers, start the server with PROMETHEUS_MULTIPROC_DIR set
+to an empty directory: every process then writes its samples there and a
+scrape answered by any one worker reports all of them.
+"""
+
+import os
+from typing import Optional
+
+from prometheus_client import REGISTRY, CollectorRegistry, generate_latest, multiprocess
+
+# Buckets of latency histograms, in seconds
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30)
+
+MULTIPROC_DIR_ENV = "PROMETHEUS_MULTIPROC_DIR"
+
+
+def multiprocess_enabled() -> bool:
+    return bool(os.environ.get(MULTIPROC_DIR_ENV))
+
+
+def render_latest() -> bytes:
+    """Render the metrics of every worker in the Prometheus text format"""
+    if not multiprocess_enabled():
+        return generate_latest(REGISTRY)
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return generate_latest(registry)
+
+
+def mark_worker_dead(pid: Optional[int] = None):
+    """Drop the live gauge samples of a worker that is exiting"""
+    if multiprocess_enabled():
+        multiprocess.mark_process_dead(pid or os.getpid())
+
+
+def sample_value(name: str, **labels) -> float:
+    """Value of one sample recorded by this process, 0 if never observed"""
+    return REGISTRY.get_sample_value(name, labels) or 0
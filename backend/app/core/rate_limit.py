@@ -15,6 +15,7 @@ RATE_LIMITS = {
     "pdf_generate": "11/minute",
     "pdf_upload": "5/minute",
     "export": "10/minute",
+    "export_job": "30/minute",
     "ats_score": "5/minute",
 }
 
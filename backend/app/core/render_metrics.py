@@ -0,0 +1,128 @@
+"""Per-stage timings and output sizes of export renders"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Optional
+
+from prometheus_client import Histogram
+
+from app.core.constants import RenderConfig
+from app.core.metrics import LATENCY_BUCKETS
+
+logger = logging.getLogger(__name__)
+
+render_stage_seconds = Histogram(
+    "resumade_render_stage_seconds",
+    "Export pipeline stage durations",
+    ["format", "template", "stage"],
+    buckets=LATENCY_BUCKETS,
+)
+render_output_bytes = Histogram(
+    "resumade_render_output_bytes",
+    "Rendered export sizes",
+    ["format", "template"],
+    buckets=(10_000, 25_000, 50_000, 100_000, 250_000, 500_000, 1_000_000, 5_000_000),
+)
+
+# Resume fields whose size drives render cost
+RESUME_FIELDS = (
+    "personal_info",
+    "experience",
+    "education",
+    "skills",
+    "certifications",
+    "projects",
+    "custom_sections",
+)
+
+
+def template_label(fmt: str, template: str) -> str:
+    """Only PDFs depend on the template; other formats share one label
+
+    Names come from request parameters, so anything but a known template
+    is recorded as "unknown" to keep the label set bounded.
+    """
+    if fmt != "pdf":
+        return "default"
+    # Imported here: the PDF service imports this module
+    from app.services.pdf_service import PDFService
+
+    return template if template in PDFService.TEMPLATES else "unknown"
+
+
+def observe_stage(fmt: str, template: str, stage: str, seconds: float):
+    """Record one stage measured outside a RenderTrace"""
+    render_stage_seconds.labels(
+        format=fmt, template=template_label(fmt, template), stage=stage
+    ).observe(seconds)
+
+
+def resume_size(resume: Any) -> int:
+    """Approximate size of the resume content in bytes"""
+    if isinstance(resume, dict):
+        content = {field: resume.get(field) for field in RESUME_FIELDS}
+    else:
+        content = {field: getattr(resume, field, None) for field in RESUME_FIELDS}
+    return len(json.dumps(content, default=str))
+
+
+class RenderTrace:
+    """Stage timings of one render, recorded as metrics when finished"""
+
+    def __init__(self, fmt: str, template: str = "default", resume: Any = None):
+        self.fmt = fmt
+        self.template = template_label(fmt, template)
+        self.resume = resume
+        self.stages: Dict[str, float] = {}
+        self._started = time.perf_counter()
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time the with-block as the named stage"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add(self, name: str, seconds: float):
+        """Record a stage measured elsewhere, e.g. in a pool worker"""
+        self.stages[name] = self.stages.get(name, 0) + seconds
+
+    def finish(self, output: Optional[bytes] = None, size: Optional[int] = None):
+        """Observe every stage and the output size, logging slow renders
+
+        Streamed exports pass the number of bytes sent as ``size`` instead
+        of the output.
+        """
+        total = time.perf_counter() - self._started
+        for name, seconds in self.stages.items():
+            render_stage_seconds.labels(
+                format=self.fmt, template=self.template, stage=name
+            ).observe(seconds)
+        render_stage_seconds.labels(
+            format=self.fmt, template=self.template, stage="total"
+        ).observe(total)
+        if output is not None:
+            size = len(output)
+        if size is not None:
+            render_output_bytes.labels(format=self.fmt, template=self.template).observe(
+                size
+            )
+
+        if total >= RenderConfig.SLOW_RENDER_SECONDS:
+            fields = {
+                "format": self.fmt,
+                "template": self.template,
+                "total_seconds": round(total, 3),
+                "output_bytes": size or 0,
+                "resume_bytes": resume_size(self.resume) if self.resume else 0,
+                **{f"{name}_seconds": round(s, 3) for name, s in self.stages.items()},
+            }
+            logger.warning(
+                "Slow render "
+                + " ".join(f"{key}={value}" for key, value in fields.items()),
+                extra={"render": fields},
+            )
@@ -0,0 +1,236 @@
+"""Out-of-process worker pools for CPU-bound rendering"""
+
+import asyncio
+import importlib
+import logging
+import multiprocessing
+import os
+import resource
+import signal
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, List, Optional
+
+from app.core.config import settings
+from app.core.constants import ImportConfig, RenderConfig
+from app.core.fonts import warm_renderer
+
+logger = logging.getLogger(__name__)
+
+
+class PoolSaturatedError(Exception):
+    """Raised when a pool already has its maximum number of jobs queued"""
+
+
+class PoolTimeoutError(Exception):
+    """Raised when a job exceeds the pool's per-job timeout"""
+
+
+class PoolCpuLimitError(Exception):
+    """Raised in a worker when a job uses up its CPU time budget"""
+
+
+def _init_worker(
+    memory_limit_mb: Optional[int], preload: List[str], warmup: Optional[Callable]
+):
+    """Apply the address-space ceiling and warm up a freshly started worker"""
+    if memory_limit_mb:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    # Already loaded in forkserver children; imported here for spawned ones
+    for module in preload:
+        importlib.import_module(module)
+    if warmup:
+        warmup()
+
+
+def _cpu_limit_exceeded(signum, frame):
+    raise PoolCpuLimitError("Job exceeded its CPU time limit")
+
+
+def _call_with_cpu_limit(cpu_seconds: int, func: Callable, *args) -> Any:
+    """Run func(*args) with at most cpu_seconds more CPU time for this process
+
+    The kernel sends SIGXCPU once the budget is spent, which raises
+    PoolCpuLimitError in the job and leaves the worker, and the other jobs
+    of its pool, running.
+    """
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    used = int(usage.ru_utime + usage.ru_stime)
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    previous = signal.signal(signal.SIGXCPU, _cpu_limit_exceeded)
+    resource.setrlimit(resource.RLIMIT_CPU, (used + cpu_seconds, hard))
+    try:
+        return func(*args)
+    finally:
+        resource.setrlimit(resource.RLIMIT_CPU, (hard, hard))
+        signal.signal(signal.SIGXCPU, previous)
+
+
+class ProcessWorkerPool:
+    """Bounded process pool with timeouts, resource ceilings and worker recycling
+
+    Workers are forked from the process-wide forkserver by default. Its
+    preload list is shared by every pool using it, and the first pool to
+    start sets it. Only one pool should use the forkserver with a preload
+    list. Other pools use the "spawn" start method and import their modules
+    when each worker starts.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queue: int,
+        timeout: float,
+        max_tasks_per_child: Optional[int] = None,
+        memory_limit_mb: Optional[int] = None,
+        cpu_limit_seconds: Optional[int] = None,
+        preload: Optional[List[str]] = None,
+        warmup: Optional[Callable] = None,
+        start_method: str = "forkserver",
+    ):
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout = timeout
+        self.max_tasks_per_child = max_tasks_per_child
+        self.memory_limit_mb = memory_limit_mb
+        self.cpu_limit_seconds = cpu_limit_seconds
+        self.preload = preload or []
+        self.warmup = warmup
+        self.start_method = start_method
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of jobs currently running or waiting for a worker"""
+        return self._in_flight
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of jobs accepted at once (running + queued)"""
+        return self.max_workers + self.max_queue
+
+    def has_capacity(self, reserve: int = 0) -> bool:
+        """Check whether a job can be accepted while keeping `reserve` slots free"""
+        return self._in_flight + reserve < self.capacity
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        """Create the executor on first use"""
+        with self._lock:
+            if self._executor is None:
+                # Worker recycling is not supported with the fork start method
+                context = multiprocessing.get_context(self.start_method)
+                if self.preload and self.start_method == "forkserver":
+                    context.set_forkserver_preload(self.preload)
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.max_workers,
+                    mp_context=context,
+                    initializer=_init_worker,
+                    initargs=(self.memory_limit_mb, self.preload, self.warmup),
+                    max_tasks_per_child=self.max_tasks_per_child,
+                )
+                logger.info(f"Started {self.name} pool with {self.max_workers} workers")
+            return self._executor
+
+    def start(self):
+        """Spin up workers ahead of the first job so requests skip the start-up cost"""
+        executor = self._get_executor()
+        for _ in range(self.max_workers):
+            executor.submit(os.getpid)
+
+    def _discard_executor(self, executor: ProcessPoolExecutor):
+        """Kill an executor whose workers are hung or dead
+
+        Jobs still running on its other workers fail with BrokenProcessPool
+        and are retried once by run().
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+
+        # A running job cannot be cancelled, so terminate its process directly
+        for process in list((executor._processes or {}).values()):
+            process.terminate()
+        executor.shutdown(wait=False, cancel_futures=True)
+
+    async def _submit(self, func: Callable, *args) -> Any:
+        """Run one attempt of a job on the current executor"""
+        executor = self._get_executor()
+        try:
+            loop = asyncio.get_running_loop()
+            return await asyncio.wait_for(
+                loop.run_in_executor(executor, func, *args), self.timeout
+            )
+        except asyncio.TimeoutError:
+            logger.error(f"{self.name} job timed out after {self.timeout}s")
+            self._discard_executor(executor)
+            raise PoolTimeoutError(f"{self.name} job timed out")
+        except BrokenProcessPool:
+            logger.error(f"{self.name} worker died, restarting pool")
+            self._discard_executor(executor)
+            raise
+
+    async def run(self, func: Callable, *args) -> Any:
+        """Run func(*args) in a worker process without blocking the event loop
+
+        A hung or dead worker takes its whole executor down, so a job that
+        fails with BrokenProcessPool is usually collateral damage and is
+        retried once on a fresh executor. Raises PoolTimeoutError for the job
+        that hung and BrokenProcessPool if the retry fails too.
+        """
+        if self._in_flight >= self.capacity:
+            raise PoolSaturatedError(f"{self.name} pool is saturated")
+
+        if self.cpu_limit_seconds:
+            func, args = _call_with_cpu_limit, (self.cpu_limit_seconds, func, *args)
+
+        self._in_flight += 1
+        try:
+            try:
+                return await self._submit(func, *args)
+            except BrokenProcessPool:
+                logger.warning(f"Retrying {self.name} job on a fresh executor")
+                return await self._submit(func, *args)
+        finally:
+            self._in_flight -= 1
+
+    def shutdown(self):
+        """Stop all workers"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            logger.info(f"Stopped {self.name} pool")
+
+
+# Global PDF render pool
+render_pool = ProcessWorkerPool(
+    name="pdf-render",
+    max_workers=settings.pdf_render_workers,
+    max_queue=RenderConfig.MAX_QUEUED_RENDERS,
+    timeout=RenderConfig.RENDER_TIMEOUT_SECONDS,
+    max_tasks_per_child=RenderConfig.MAX_RENDERS_PER_WORKER,
+    memory_limit_mb=RenderConfig.WORKER_MEMORY_LIMIT_MB,
+    preload=["weasyprint"],
+    warmup=warm_renderer,
+)
+
+# Global PDF import pool; untrusted uploads are parsed here, away from renders.
+# Spawned rather than forked from the render pool's forkserver, so workers
+# start clean without WeasyPrint and Pango loaded.
+import_pool = ProcessWorkerPool(
+    name="pdf-import",
+    max_workers=settings.pdf_import_workers,
+    max_queue=ImportConfig.MAX_QUEUED_IMPORTS,
+    timeout=ImportConfig.IMPORT_TIMEOUT_SECONDS,
+    max_tasks_per_child=ImportConfig.MAX_IMPORTS_PER_WORKER,
+    memory_limit_mb=ImportConfig.WORKER_MEMORY_LIMIT_MB,
+    cpu_limit_seconds=ImportConfig.CPU_LIMIT_SECONDS,
+    preload=["PyPDF2", "dateutil.parser"],
+    start_method="spawn",
+)
@@ -0,0 +1,61 @@
+"""Request body size limits enforced while the body is received"""
+
+from typing import Mapping
+
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+
+from app.core.constants import ResponseMessages
+
+
+class BodyTooLargeError(HTTPException):
+    """Raised from receive once a body goes over its limit
+
+    An HTTPException, so FastAPI's body parsing passes it through and the
+    client gets a 413 rather than a generic parse error.
+    """
+
+    def __init__(self):
+        super().__init__(status_code=413, detail=ResponseMessages.UPLOAD_TOO_LARGE)
+
+
+class UploadLimitMiddleware:
+    """Refuse request bodies over a per-path limit before they are buffered
+
+    Starlette receives a whole multipart body before the endpoint runs, so
+    limits checked in the endpoint come too late. A declared Content-Length
+    over the limit is refused without reading the body. Otherwise the bytes
+    are counted as they arrive and receiving stops at the limit.
+    """
+
+    def __init__(self, app, limits: Mapping[str, int]):
+        self.app = app
+        self.limits = dict(limits)
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        length = headers.get(b"content-length", b"")
+        if length.isdigit() and int(length) > limit:
+            response = JSONResponse(
+                {"detail": ResponseMessages.UPLOAD_TOO_LARGE}, status_code=413
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    raise BodyTooLargeError()
+            return message
+
+        await self.app(scope, limited_receive, send)
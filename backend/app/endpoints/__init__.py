@@ -3,6 +3,7 @@ from .resumes import router as resumes_router
 from .auth import router as auth_router
 from .admin import router as admin_router
 from .ai_content import router as ai_content_router
+from .exports import router as exports_router
 
 __all__ = [
     "users_router",
@@ -10,4 +11,5 @@ __all__ = [
     "auth_router",
     "admin_router",
     "ai_content_router",
+    "exports_router",
 ]
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import Optional
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import FileResponse, RedirectResponse, Response
+
+from app.core.auth import get_current_user_optional
+from app.core.constants import ResponseMessages, StorageConfig
+from app.models import User
+from app.schemas.response import APIResponse
+from app.services import ExportService, ExportJobService
+from app.services.export_job_service import ExportJobStatus
+from app.services.storage_service import StorageService
+
+router = APIRouter(prefix="/exports", tags=["Exports"])
+logger = logging.getLogger(__name__)
+
+
+def _get_job(job_id: str, current_user: Optional[User]) -> dict:
+    """Load a job and check it belongs to the caller"""
+    job = ExportJobService().store.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=404, detail=ResponseMessages.EXPORT_JOB_NOT_FOUND
+        )
+
+    if current_user and job["user_id"] not in (None, current_user.id):
+        raise HTTPException(status_code=403, detail=ResponseMessages.UNAUTHORIZED)
+
+    return job
+
+
+@router.get("/{job_id}", response_model=APIResponse[dict])
+def get_export_job(
+    job_id: str,
+    current_user: Optional[User] = Depends(get_current_user_optional),
+):
+    """Get the status and timings of an export job"""
+    job = _get_job(job_id, current_user)
+    job.pop("artifact_key", None)
+    job.pop("stored_filename", None)
+    if job["status"] == ExportJobStatus.DONE:
+        job["download_url"] = f"/api/exports/{job_id}/download"
+
+    return APIResponse(success=True, message="Export job retrieved", data=job)
+
+
+@router.get("/{job_id}/download")
+async def download_export(
+    job_id: str,
+    current_user: Optional[User] = Depends(get_current_user_optional),
+):
+    """Download the artifact of a finished export job"""
+    job = _get_job(job_id, current_user)
+    if job["status"] == ExportJobStatus.FAILED and job.get("retry_after"):
+        raise HTTPException(
+            status_code=503,
+            detail=job["error"],
+            headers={"Retry-After": str(job["retry_after"])},
+        )
+    if job["status"] != ExportJobStatus.DONE:
+        raise HTTPException(status_code=409, detail=ResponseMessages.EXPORT_NOT_READY)
+
+    fmt = job["format"]
+    filename = f"resume_{job['resume_id']}.{fmt}"
+
+    # Stored PDFs are reachable from every worker, whichever one rendered them
+    if job.get("stored_filename"):
+        storage = StorageService()
+        path = await asyncio.to_thread(storage.local_path, job["stored_filename"])
+        if path:
+            return FileResponse(
+                path, media_type=ExportService.MEDIA_TYPES[fmt], filename=filename
+            )
+        url = await asyncio.to_thread(
+            storage.create_signed_url,
+            job["stored_filename"],
+            StorageConfig.SIGNED_URL_TTL_SECONDS,
+        )
+        if url:
+            return RedirectResponse(url, status_code=307)
+
+    content = await asyncio.to_thread(ExportJobService.get_artifact, job)
+    if content is None:
+        logger.warning(f"Artifact for export job {job_id} was evicted")
+        raise HTTPException(status_code=410, detail=ResponseMessages.EXPORT_EXPIRED)
+
+    return Response(
+        content=content,
+        media_type=ExportService.MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
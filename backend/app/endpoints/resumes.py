@@ -8,20 +8,40 @@ from fastapi import (
     UploadFile,
     File,
     BackgroundTasks,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.responses import (
+    Response,
+    HTMLResponse,
+    RedirectResponse,
+    FileResponse,
+    StreamingResponse,
 )
-from fastapi.responses import Response, HTMLResponse
 from sqlalchemy.orm import joinedload, Session
 from sqlalchemy import func
 from typing import Optional
 from datetime import datetime, timedelta
+import asyncio
+import json
 import logging
+import time
+from concurrent.futures.process import BrokenProcessPool
 
 from app.core.database import get_db
 from app.core.auth import get_current_user_optional, get_current_user
-from app.core.constants import ResponseMessages, CacheConstants
+from app.core.constants import (
+    ResponseMessages,
+    CacheConstants,
+    PreviewConfig,
+    RenderConfig,
+    StorageConfig,
+)
 from app.core.rate_limit import limiter, RATE_LIMITS
-from app.core.constants import FileConstants
 from app.core.cache import cached
+from app.core.compression import negotiate, shared_pages
+from app.core.render_metrics import observe_stage
+from app.core.render_pool import PoolSaturatedError, PoolTimeoutError
 from app.models import Resume, User, ResumeVersion, ShareLink
 from app.schemas import (
     Resume as ResumeSchema,
@@ -30,8 +50,27 @@ from app.schemas import (
     ResumeVersion as ResumeVersionSchema,
 )
 from app.schemas.response import APIResponse, PaginatedResponse
-from app.services import PDFService, ATSService, DOCXService
-from app.services.pdf_parser_service import PDFParserService
+from app.services import (
+    PDFService,
+    ATSService,
+    ExportService,
+    ExportJobService,
+    StorageService,
+)
+from app.services import exporters
+from app.services.pdf_import import import_pdf
+from app.services.pdf_parser_service import PDFImportError
+from app.services.prerender_service import speculative_renderer
+from app.services.resume_document import ResumeDocument
+from app.services.preview_session import (
+    PreviewSession,
+    preview_executor,
+    preview_resume,
+    preview_sessions,
+)
+from app.services.template_gallery import template_gallery
+from app.services.template_registry import template_registry
+from app.services.template_stylesheets import template_stylesheets
 
 router = APIRouter(prefix="/resumes", tags=["Resumes"])
 logger = logging.getLogger(__name__)
@@ -48,6 +87,55 @@ def _get_resume_by_id(resume_id: int, db: Session) -> Resume:
     )
 
 
+def _delete_stored_pdfs(resume_id: int):
+    """Remove a deleted resume's stored PDFs; runs after the response"""
+    try:
+        StorageService().delete_resume_pdfs(resume_id)
+    except Exception as e:
+        logger.error(f"Failed to delete stored PDFs of resume {resume_id}: {str(e)}")
+
+
+def _render_unavailable(exc: Exception) -> HTTPException:
+    """Map render pool backpressure and worker failures to HTTP errors"""
+    if isinstance(exc, (PoolSaturatedError, BrokenProcessPool)):
+        detail = (
+            ResponseMessages.RENDER_BUSY
+            if isinstance(exc, PoolSaturatedError)
+            else ResponseMessages.RENDER_INTERRUPTED
+        )
+        return HTTPException(
+            status_code=503,
+            detail=detail,
+            headers={"Retry-After": str(RenderConfig.RETRY_AFTER_SECONDS)},
+        )
+    return HTTPException(status_code=504, detail=ResponseMessages.RENDER_TIMEOUT)
+
+
+def _import_unavailable(exc: Exception) -> HTTPException:
+    """Map import pool backpressure and lost workers to a retryable 503"""
+    detail = (
+        ResponseMessages.IMPORT_BUSY
+        if isinstance(exc, PoolSaturatedError)
+        else ResponseMessages.IMPORT_INTERRUPTED
+    )
+    return HTTPException(
+        status_code=503,
+        detail=detail,
+        headers={"Retry-After": str(RenderConfig.RETRY_AFTER_SECONDS)},
+    )
+
+
+def _stored_artifact_response(request: Request, url: str):
+    """Redirect to a signed storage URL, or return it as JSON for API clients"""
+    if "application/json" in request.headers.get("accept", ""):
+        return APIResponse(
+            success=True,
+            message="Export available",
+            data={"url": url, "expires_in": StorageConfig.SIGNED_URL_TTL_SECONDS},
+        )
+    return RedirectResponse(url, status_code=status.HTTP_307_TEMPORARY_REDIRECT)
+
+
 @router.post(
     "/", response_model=APIResponse[ResumeSchema], status_code=status.HTTP_201_CREATED
 )
@@ -62,15 +150,7 @@ def create_resume(
     user_info = f"user: {current_user.email}" if current_user else "guest"
     logger.info(f"Creating resume '{resume.title}' by {user_info}")
 
-    resume_dict = {
-        "personal_info": resume.personal_info.dict(),
-        "experience": [e.dict() for e in resume.experience],
-        "education": [e.dict() for e in resume.education],
-        "skills": [s.dict() for s in resume.skills],
-        "certifications": [c.dict() for c in resume.certifications],
-        "projects": [p.dict() for p in resume.projects],
-    }
-    ats_result = ATSService.calculate_ats_score(resume_dict)
+    ats_result = ATSService.calculate_ats_score(ResumeDocument.of(resume.dict()))
 
     db_resume = Resume(
         user_id=current_user.id if current_user else None,
@@ -95,6 +175,7 @@ def create_resume(
     logger.info(
         f"Resume created with ID: {db_resume.id}, ATS Score: {ats_result['percentage']}%"
     )
+    speculative_renderer.schedule(db_resume, current_user.id if current_user else None)
     return APIResponse(
         success=True, message=ResponseMessages.RESUME_CREATED, data=db_resume
     )
@@ -203,12 +284,14 @@ def update_resume(
 
     db.commit()
     db.refresh(resume)
+    speculative_renderer.schedule(resume, current_user.id if current_user else None)
     return resume
 
 
 @router.delete("/{resume_id}")
 def delete_resume(
     resume_id: int,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_user),
 ):
@@ -230,159 +313,57 @@ def delete_resume(
 
     db.delete(resume)
     db.commit()
+    background_tasks.add_task(_delete_stored_pdfs, resume_id)
     return {"message": "Resume deleted"}
 
 
 @router.post("/generate-pdf")
 @limiter.limit(RATE_LIMITS["pdf_generate"])
-def generate_guest_pdf(
+async def generate_guest_pdf(
     request: Request,
     resume_data: dict,
     template: str = Query("professional-blue"),
 ):
     """Generate PDF for guest users (no authentication required)"""
     try:
-        # Create a mock Resume object with required attributes
-        class MockResume:
-            def __init__(self, data, template_name):
-                self.id = 0  # Mock ID for guest resumes
-                self.title = data.get("title", "Resume")
-                self.template = template_name
-                self.personal_info = data.get("personal_info", {})
-                self.experience = data.get("experience", [])
-                self.education = data.get("education", [])
-                self.skills = data.get("skills", [])
-                self.certifications = data.get("certifications", [])
-                self.projects = data.get("projects", [])
-
-        resume_obj = MockResume(resume_data, template)
-        pdf_service = PDFService()
-        content = pdf_service.generate_resume_pdf(resume_obj, template)
+        resume_obj = ResumeDocument.of(dict(resume_data, id=0, template_name=template))
+        content = await ExportService().export(resume_obj, "pdf", template)
 
         return Response(
             content=content,
             media_type="application/pdf",
             headers={"Content-Disposition": "attachment; filename=resume.pdf"},
         )
+    except (PoolSaturatedError, PoolTimeoutError, BrokenProcessPool) as e:
+        raise _render_unavailable(e)
     except Exception as e:
         logger.error(f"Guest PDF generation failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"PDF generation failed: {str(e)}")
 
 
-def _generate_txt_resume(resume) -> bytes:
-    """Generate plain text resume"""
-    lines = []
-
-    # Personal Info
-    if resume.personal_info:
-        pi = resume.personal_info
-        if pi.get("full_name"):
-            lines.append(pi["full_name"].upper())
-            lines.append("=" * len(pi["full_name"]))
-            lines.append("")
-
-        contact = []
-        if pi.get("email"):
-            contact.append(f"Email: {pi['email']}")
-        if pi.get("phone"):
-            contact.append(f"Phone: {pi['phone']}")
-        if pi.get("location"):
-            contact.append(f"Location: {pi['location']}")
-        if pi.get("linkedin"):
-            contact.append(f"LinkedIn: {pi['linkedin']}")
-        if pi.get("website"):
-            contact.append(f"Website: {pi['website']}")
-
-        if contact:
-            lines.extend(contact)
-            lines.append("")
-
-        if pi.get("summary"):
-            lines.append("PROFESSIONAL SUMMARY")
-            lines.append("-" * 20)
-            lines.append(pi["summary"])
-            lines.append("")
-
-    # Experience
-    if resume.experience:
-        lines.append("EXPERIENCE")
-        lines.append("-" * 10)
-        for exp in resume.experience:
-            lines.append(f"{exp.get('position', '')} | {exp.get('company', '')}")
-            dates = f"{exp.get('start_date', '')} - {exp.get('end_date', 'Present') if not exp.get('current') else 'Present'}"
-            lines.append(dates)
-            if exp.get("location"):
-                lines.append(exp["location"])
-            if exp.get("description"):
-                lines.append(exp["description"])
-            lines.append("")
-
-    # Education
-    if resume.education:
-        lines.append("EDUCATION")
-        lines.append("-" * 9)
-        for edu in resume.education:
-            lines.append(f"{edu.get('degree', '')} in {edu.get('field_of_study', '')}")
-            lines.append(edu.get("institution", ""))
-            dates = f"{edu.get('start_date', '')} - {edu.get('end_date', '')}"
-            lines.append(dates)
-            if edu.get("gpa"):
-                lines.append(f"GPA: {edu['gpa']}")
-            lines.append("")
-
-    # Skills
-    if resume.skills:
-        lines.append("SKILLS")
-        lines.append("-" * 6)
-        for skill in resume.skills:
-            skill_line = skill.get("name", "")
-            if skill.get("level"):
-                skill_line += f" ({skill['level']})"
-            lines.append(skill_line)
-        lines.append("")
-
-    # Projects
-    if resume.projects:
-        lines.append("PROJECTS")
-        lines.append("-" * 8)
-        for project in resume.projects:
-            lines.append(project.get("name", ""))
-            if project.get("description"):
-                lines.append(project["description"])
-            if project.get("technologies"):
-                lines.append(f"Technologies: {', '.join(project['technologies'])}")
-            if project.get("url"):
-                lines.append(f"URL: {project['url']}")
-            lines.append("")
-
-    # Certifications
-    if resume.certifications:
-        lines.append("CERTIFICATIONS")
-        lines.append("-" * 14)
-        for cert in resume.certifications:
-            lines.append(f"{cert.get('name', '')} | {cert.get('issuer', '')}")
-            if cert.get("date"):
-                lines.append(cert["date"])
-            lines.append("")
-
-    return "\n".join(lines).encode("utf-8")
-
-
 @router.get("/{resume_id}/export")
 @limiter.limit(RATE_LIMITS["export"])
 async def export_resume(
     request: Request,
     resume_id: int,
-    format: str = Query("pdf", regex="^(pdf|docx|txt)$"),
+    format: str = Query("pdf", regex=ExportService.FORMAT_PATTERN),
     template: Optional[str] = None,
     background_tasks: BackgroundTasks = BackgroundTasks(),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """Export resume as PDF, DOCX, or TXT"""
+    """Export resume as PDF, DOCX, TXT, Markdown or JSON Resume"""
+    fetch_started = time.perf_counter()
     resume = db.query(Resume).filter(Resume.id == resume_id).first()
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
+    template_name = PDFService.canonical_template(template or resume.template)
+    observe_stage(
+        format,
+        template_name,
+        "db_fetch",
+        time.perf_counter() - fetch_started,
+    )
 
     if current_user and resume.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized")
@@ -393,41 +374,91 @@ async def export_resume(
     )
 
     try:
+        document = ResumeDocument.of(resume)
+        export_service = ExportService()
+
+        # Serve PDFs already in storage straight from disk or the bucket
         if format == "pdf":
-            pdf_service = PDFService()
-            template_name = template or resume.template
-            content = pdf_service.generate_resume_pdf(resume, template_name)
-            media_type = "application/pdf"
-            filename = f"resume_{resume_id}.pdf"
-        elif format == "docx":
-            docx_service = DOCXService()
-            content = docx_service.generate_resume_docx(
-                {
-                    "personal_info": resume.personal_info,
-                    "experience": resume.experience,
-                    "education": resume.education,
-                    "skills": resume.skills,
-                    "certifications": resume.certifications,
-                    "projects": resume.projects,
-                }
+            path = await asyncio.to_thread(
+                export_service.stored_pdf_path, document, template_name
+            )
+            if path:
+                # Streamed from disk; servers with zero-copy send use sendfile
+                return FileResponse(
+                    path,
+                    media_type=ExportService.MEDIA_TYPES[format],
+                    filename=f"resume_{resume_id}.{format}",
+                )
+            url = await asyncio.to_thread(
+                export_service.stored_pdf_url, document, template_name
+            )
+            if url:
+                return _stored_artifact_response(request, url)
+
+        # Text formats are cheap to render, so they stream without caching
+        if format in exporters.EXPORTERS:
+            return StreamingResponse(
+                exporters.stream(document, format),
+                media_type=ExportService.MEDIA_TYPES[format],
+                headers={
+                    "Content-Disposition": f"attachment; filename=resume_{resume_id}.{format}"
+                },
             )
-            media_type = "application/vnd.openxmlformats-officedocument.wordprocessingml.document"
-            filename = f"resume_{resume_id}.docx"
-        else:  # txt
-            content = _generate_txt_resume(resume)
-            media_type = "text/plain"
-            filename = f"resume_{resume_id}.txt"
+
+        content = await export_service.export(document, format, template_name)
 
         return Response(
             content=content,
-            media_type=media_type,
-            headers={"Content-Disposition": f"attachment; filename={filename}"},
+            media_type=ExportService.MEDIA_TYPES[format],
+            headers={
+                "Content-Disposition": f"attachment; filename=resume_{resume_id}.{format}"
+            },
         )
+    except (PoolSaturatedError, PoolTimeoutError, BrokenProcessPool) as e:
+        raise _render_unavailable(e)
     except Exception as e:
         logger.error(f"Export failed: {str(e)}")
         raise HTTPException(status_code=500, detail=f"Export failed: {str(e)}")
 
 
+@router.post(
+    "/{resume_id}/exports",
+    response_model=APIResponse[dict],
+    status_code=status.HTTP_202_ACCEPTED,
+)
+@limiter.limit(RATE_LIMITS["export_job"])
+def create_export_job(
+    request: Request,
+    resume_id: int,
+    background_tasks: BackgroundTasks,
+    format: str = Query("pdf", regex=ExportService.FORMAT_PATTERN),
+    template: Optional[str] = None,
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional),
+):
+    """Queue a resume export and return a job id to poll"""
+    resume = db.query(Resume).filter(Resume.id == resume_id).first()
+    if not resume:
+        raise HTTPException(status_code=404, detail=ResponseMessages.RESUME_NOT_FOUND)
+
+    if current_user and resume.user_id != current_user.id:
+        raise HTTPException(status_code=403, detail=ResponseMessages.UNAUTHORIZED)
+
+    job_service = ExportJobService()
+    job = job_service.submit(
+        resume,
+        format,
+        PDFService.canonical_template(template or resume.template),
+        current_user.id if current_user else None,
+    )
+    background_tasks.add_task(job_service.run, job["id"], job_service.snapshot(resume))
+
+    resume.downloads += 1
+    db.commit()
+
+    return APIResponse(success=True, message="Export queued", data=job)
+
+
 @router.get("/{resume_id}/score")
 @limiter.limit(RATE_LIMITS["ats_score"])
 def get_resume_score(
@@ -453,18 +484,8 @@ def get_resume_score(
         raise HTTPException(status_code=403, detail="Not authorized")
 
     # Calculate score with job description if provided
-    resume_dict = {
-        "personal_info": resume.personal_info,
-        "experience": resume.experience,
-        "education": resume.education,
-        "skills": resume.skills,
-        "certifications": resume.certifications,
-        "projects": resume.projects,
-    }
-
-    ats_result = ATSService.calculate_ats_score(
-        resume_dict, job_description, role_level
-    )
+    document = ResumeDocument.of(resume)
+    ats_result = ATSService.calculate_ats_score(document, job_description, role_level)
 
     return {
         "resume_id": resume.id,
@@ -475,7 +496,7 @@ def get_resume_score(
         "ai_suggestions": ats_result.get("ai_suggestions", []),
         "section_breakdown": ats_result["section_breakdown"],
         "formatting_check": ats_result["formatting_check"],
-        "suggestions": ATSService.get_keyword_suggestions(resume_dict, job_description),
+        "suggestions": ATSService.get_keyword_suggestions(document, job_description),
         "role_level": role_level,
         "job_matched": job_description is not None,
     }
@@ -514,141 +535,82 @@ async def parse_pdf_resume(request: Request, file: UploadFile = File(...)):
     logger.info(f"Parsing PDF file: {file.filename}")
 
     if not file.filename.lower().endswith(".pdf"):
-        raise HTTPException(status_code=400, detail="File must be a PDF")
-
-    # Check file size
-    content = await file.read()
-    if len(content) > FileConstants.MAX_PDF_SIZE_BYTES:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File size exceeds {FileConstants.MAX_PDF_SIZE_MB}MB limit",
-        )
+        raise HTTPException(status_code=400, detail=ResponseMessages.NOT_A_PDF)
 
     try:
-        # Parse PDF using PDFParserService
-        parser = PDFParserService()
-        extracted_data = parser.parse_resume_pdf(content)
+        # Spooled with a size cutoff and parsed in a sandboxed worker
+        extracted_data = await import_pdf(file)
 
         logger.info(f"Successfully parsed PDF: {file.filename}")
         return APIResponse(
             success=True, message="PDF parsed successfully", data=extracted_data
         )
 
+    except (PoolSaturatedError, BrokenProcessPool) as e:
+        raise _import_unavailable(e)
+    except PDFImportError as e:
+        logger.warning(f"Rejected PDF {file.filename}: {str(e)}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Failed to parse PDF {file.filename}: {str(e)}")
         raise HTTPException(status_code=400, detail=f"Failed to parse PDF: {str(e)}")
 
 
-@router.get("/templates/list")
-def list_templates():
-    """Get available resume templates organized by category"""
-    templates = PDFService.get_available_templates()
+def _gallery_response(
+    request: Request,
+    body,
+    media_type: str,
+    cache_control: str = f"public, max-age={CacheConstants.TEMPLATE_LIST_CACHE_TTL}",
+) -> Response:
+    """Serve a prebuilt body in the negotiated encoding, answering 304 on a match"""
+    content, etag, encoding = body.variant(
+        negotiate(request.headers.get("accept-encoding", ""))
+    )
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Vary": "Accept-Encoding"}
+    cached_etags = {
+        tag.strip().removeprefix("W/")
+        for tag in request.headers.get("if-none-match", "").split(",")
+    }
+    if etag in cached_etags or "*" in cached_etags:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    return Response(content=content, media_type=media_type, headers=headers)
 
-    # Organize templates by category
-    categorized = {}
-    for template in templates:
-        category = template["category"]
-        if category not in categorized:
-            categorized[category] = []
-        categorized[category].append(template)
 
-    return APIResponse(
-        success=True,
-        message="Templates retrieved",
-        data={"categories": categorized, "all_templates": templates},
-    )
+@router.get("/templates/list")
+def list_templates(request: Request):
+    """Get available resume templates organized by category"""
+    return _gallery_response(request, template_gallery.catalog(), "application/json")
 
 
 @router.get("/templates/preview", response_class=HTMLResponse)
-def preview_template(template: str = Query(default="professional-blue")):
+def preview_template(
+    request: Request, template: str = Query(default="professional-blue")
+):
     """Render HTML preview of a template with sample data"""
-    from types import SimpleNamespace
-
-    # Sample resume data as simple object
-    sample_data = SimpleNamespace(
-        id=0,
-        title="Sample Resume",
-        template=template,
-        personal_info={
-            "full_name": "John Doe",
-            "email": "john.doe@email.com",
-            "phone": "(555) 123-4567",
-            "location": "New York, NY",
-            "linkedin": "https://linkedin.com/in/johndoe",
-            "website": "https://johndoe.com",
-            "summary": "Results-driven professional with 5+ years of experience in delivering innovative solutions. Proven track record of leading cross-functional teams and driving business growth through strategic initiatives.",
-        },
-        experience=[
-            {
-                "company": "Tech Solutions Inc",
-                "position": "Senior Software Engineer",
-                "location": "New York, NY",
-                "start_date": "2021",
-                "end_date": "",
-                "current": True,
-                "description": "Led development of microservices architecture serving 1M+ users\nMentored team of 5 junior developers and improved deployment efficiency by 40%\nImplemented CI/CD pipelines reducing release time by 60%",
-            },
-            {
-                "company": "Digital Innovations",
-                "position": "Software Engineer",
-                "location": "Boston, MA",
-                "start_date": "2019",
-                "end_date": "2021",
-                "current": False,
-                "description": "Developed RESTful APIs and React applications\nCollaborated with product team to deliver features on time\nOptimized database queries improving performance by 35%",
-            },
-        ],
-        education=[
-            {
-                "institution": "Massachusetts Institute of Technology",
-                "degree": "Bachelor of Science",
-                "field_of_study": "Computer Science",
-                "location": "Cambridge, MA",
-                "start_date": "2015",
-                "end_date": "2019",
-                "gpa": "3.8/4.0",
-            }
-        ],
-        skills=[
-            {"name": "JavaScript", "level": "Expert"},
-            {"name": "Python", "level": "Advanced"},
-            {"name": "React", "level": "Expert"},
-            {"name": "Node.js", "level": "Advanced"},
-            {"name": "AWS", "level": "Intermediate"},
-            {"name": "Docker", "level": "Intermediate"},
-        ],
-        certifications=[
-            {
-                "name": "AWS Certified Solutions Architect",
-                "issuer": "Amazon Web Services",
-                "date": "2022",
-            },
-            {
-                "name": "Professional Scrum Master",
-                "issuer": "Scrum.org",
-                "date": "2021",
-            },
-        ],
-        projects=[
-            {
-                "name": "E-Commerce Platform",
-                "description": "Built scalable e-commerce platform handling 10K+ daily transactions with real-time inventory management",
-                "technologies": ["React", "Node.js", "MongoDB", "Stripe"],
-                "url": "https://github.com/johndoe/ecommerce",
-            },
-            {
-                "name": "Analytics Dashboard",
-                "description": "Created data visualization dashboard processing 1M+ events daily with custom reporting features",
-                "technologies": ["Python", "Django", "PostgreSQL", "D3.js"],
-                "url": "https://github.com/johndoe/analytics",
-            },
-        ],
+    return _gallery_response(
+        request, template_gallery.preview(template), "text/html; charset=utf-8"
     )
 
-    pdf_service = PDFService()
-    html_content = pdf_service.render_resume_html(sample_data, template)
 
-    return HTMLResponse(content=html_content)
+@router.get("/templates/styles/{fingerprint}.css")
+def template_stylesheet(request: Request, fingerprint: str):
+    """Serve a template's static CSS under its content fingerprint"""
+    body = template_stylesheets.get(fingerprint)
+    if body is None:
+        # Rendered by another worker or an older template version
+        template_gallery.build()
+        body = template_stylesheets.get(fingerprint)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Stylesheet not found")
+
+    return _gallery_response(
+        request,
+        body,
+        "text/css; charset=utf-8",
+        f"public, max-age={PreviewConfig.STYLESHEET_MAX_AGE}, immutable",
+    )
 
 
 @router.get("/{resume_id}/preview", response_class=HTMLResponse)
@@ -672,55 +634,90 @@ def preview_resume_by_id(resume_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Resume not found")
 
     pdf_service = PDFService()
-    html_content = pdf_service.render_resume_html(resume, resume.template_name)
+    html_content = pdf_service.render_resume_html(
+        ResumeDocument.of(resume), resume.template_name
+    )
 
-    return HTMLResponse(content=html_content)
+    return HTMLResponse(content=template_stylesheets.externalize(html_content))
 
 
 @router.post("/preview", response_class=HTMLResponse)
 async def preview_resume_live(request: Request):
     """Render HTML preview with user's live data"""
-    from types import SimpleNamespace
-    import json
-
     # Get form data
     form_data = await request.form()
     resume_json = form_data.get("resume_data")
 
-    if resume_json:
-        resume_data = json.loads(resume_json)
-    else:
-        # Fallback to empty data
-        resume_data = {
-            "template_name": "professional-blue",
-            "personal_info": {},
-            "experience": [],
-            "education": [],
-            "skills": [],
-            "certifications": [],
-            "projects": [],
-        }
-
-    # Convert dict to object for template rendering
-    resume_obj = SimpleNamespace(
-        id=resume_data.get("id", 0),
-        title=resume_data.get("title", "Resume"),
-        template=resume_data.get("template_name", "professional-blue"),
-        personal_info=resume_data.get("personal_info", {}),
-        experience=resume_data.get("experience", []),
-        education=resume_data.get("education", []),
-        skills=resume_data.get("skills", []),
-        certifications=resume_data.get("certifications", []),
-        projects=resume_data.get("projects", []),
-        customization=resume_data.get("customization", {}),
-        section_names=resume_data.get("section_names", {}),
-        custom_sections=resume_data.get("custom_sections", []),
-    )
+    # Fallback to empty data
+    resume_data = json.loads(resume_json) if resume_json else {}
+    resume_obj = preview_resume(resume_data)
 
     pdf_service = PDFService()
-    html_content = pdf_service.render_resume_html(resume_obj, resume_obj.template)
+    html_content = pdf_service.render_resume_preview(resume_obj, resume_obj.template)
+
+    return HTMLResponse(content=template_stylesheets.externalize(html_content))
+
+
+@router.websocket("/preview/ws")
+async def preview_resume_socket(websocket: WebSocket):
+    """Live preview channel: JSON merge patches in, changed HTML fragments out
+
+    Client messages are {"type": "init", "resume": {...}} and
+    {"type": "patch", "patch": {...}}. The server answers with a full
+    "document" first and then "fragments" holding only changed sections.
+    """
+    if not preview_sessions.acquire():
+        await websocket.close(code=status.WS_1013_TRY_AGAIN_LATER)
+        return
+
+    await websocket.accept()
+    session = PreviewSession()
+    dirty = asyncio.Event()
+    loop = asyncio.get_running_loop()
+
+    async def push_updates():
+        while True:
+            await dirty.wait()
+            # Let a burst of keystrokes land before rendering once
+            await asyncio.sleep(PreviewConfig.COALESCE_SECONDS)
+            dirty.clear()
+            started = loop.time()
+            try:
+                message = await loop.run_in_executor(preview_executor, session.render)
+            except Exception as e:
+                logger.error(f"Live preview render failed: {str(e)}")
+                message = {"type": "error", "detail": "Preview render failed"}
+            if message:
+                await websocket.send_json(message)
+            # Edits arriving meanwhile coalesce into the session's next render
+            await asyncio.sleep(
+                started + PreviewConfig.MIN_RENDER_INTERVAL_SECONDS - loop.time()
+            )
 
-    return HTMLResponse(content=html_content)
+    pusher = asyncio.create_task(push_updates())
+    try:
+        while True:
+            text = await websocket.receive_text()
+            if len(text.encode()) > PreviewConfig.MAX_MESSAGE_BYTES:
+                await websocket.close(code=status.WS_1009_MESSAGE_TOO_BIG)
+                break
+            try:
+                message = json.loads(text)
+                if message.get("type") == "init":
+                    session.reset(message.get("resume", {}))
+                elif message.get("type") == "patch":
+                    session.apply(message.get("patch", {}))
+                else:
+                    raise ValueError("Unknown message type")
+            except (ValueError, AttributeError) as e:
+                await websocket.send_json({"type": "error", "detail": str(e)})
+                continue
+            dirty.set()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        pusher.cancel()
+        preview_sessions.release()
 
 
 # Version History
@@ -939,10 +936,8 @@ def create_share_link(
 
 
 @router.get("/shared/{slug:path}/preview", response_class=HTMLResponse)
-def preview_shared_resume(slug: str, db: Session = Depends(get_db)):
+def preview_shared_resume(slug: str, request: Request, db: Session = Depends(get_db)):
     """Render shared resume with its template"""
-    from types import SimpleNamespace
-
     share_link = (
         db.query(ShareLink).filter(ShareLink.slug == slug, ShareLink.is_active).first()
     )
@@ -975,22 +970,24 @@ def preview_shared_resume(slug: str, db: Session = Depends(get_db)):
     resume.views += 1
     db.commit()
 
-    resume_obj = SimpleNamespace(
-        id=resume.id,
-        title=resume.title,
-        template=resume.template,
-        personal_info=resume.personal_info,
-        experience=resume.experience,
-        education=resume.education,
-        skills=resume.skills,
-        certifications=resume.certifications,
-        projects=resume.projects,
+    document = ResumeDocument.of(resume)
+    template_file = PDFService._get_template_file(resume.template)
+    page_key = (
+        template_file,
+        template_registry.version(template_file),
+        document.content_hash,
     )
+    body = shared_pages.get(page_key)
+    if body is None:
+        pdf_service = PDFService()
+        html_content = pdf_service.render_resume_html(document, resume.template)
+        body = shared_pages.set(
+            page_key, template_stylesheets.externalize(html_content).encode("utf-8")
+        )
 
-    pdf_service = PDFService()
-    html_content = pdf_service.render_resume_html(resume_obj, resume.template)
-
-    return HTMLResponse(content=html_content)
+    return _gallery_response(
+        request, body, "text/html; charset=utf-8", "private, no-cache"
+    )
 
 
 @router.get("/shared/{slug:path}", response_model=APIResponse[ResumeSchema])
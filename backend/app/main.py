@@ -1,6 +1,9 @@
 import asyncio
-from fastapi import FastAPI
+import hmac
+from fastapi import FastAPI, Header, HTTPException
+from fastapi.responses import Response
 from fastapi.middleware.cors import CORSMiddleware
+from prometheus_client import CONTENT_TYPE_LATEST
 from sqlalchemy.exc import IntegrityError
 import logging
 
@@ -10,6 +13,7 @@ from app.endpoints import (
     auth_router,
     admin_router,
     ai_content_router,
+    exports_router,
 )
 from app.endpoints.analytics import router as analytics_router
 from app.core.exceptions import (
@@ -18,7 +22,18 @@ from app.core.exceptions import (
     integrity_error_handler,
     general_exception_handler,
 )
+from app.core.compression import CompressionMiddleware
+from app.core.config import settings
+from app.core.constants import FileConstants
 from app.core.logging import setup_logging
+from app.core.fonts import build_font_cache
+from app.core.metrics import mark_worker_dead, render_latest
+from app.core.render_pool import import_pool, render_pool
+from app.core.upload_limit import UploadLimitMiddleware
+from app.services.template_gallery import template_gallery
+from app.services.template_registry import template_registry
+from app.services.prerender_service import speculative_renderer
+from app.services.upload_service import background_uploader
 
 setup_logging()
 logger = logging.getLogger(__name__)
@@ -40,6 +55,18 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress HTML, text and JSON responses
+app.add_middleware(CompressionMiddleware)
+
+# Refuse oversized uploads while they arrive, before they are buffered
+app.add_middleware(
+    UploadLimitMiddleware,
+    limits={
+        "/api/resumes/parse-pdf": FileConstants.MAX_PDF_SIZE_BYTES
+        + FileConstants.MULTIPART_OVERHEAD_BYTES
+    },
+)
+
 app.add_exception_handler(ResumadeException, resumade_exception_handler)
 app.add_exception_handler(IntegrityError, integrity_error_handler)
 app.add_exception_handler(Exception, general_exception_handler)
@@ -49,6 +76,7 @@ app.include_router(users_router, prefix="/api")
 app.include_router(resumes_router, prefix="/api")
 app.include_router(admin_router, prefix="/api")
 app.include_router(ai_content_router, prefix="/api")
+app.include_router(exports_router, prefix="/api")
 app.include_router(analytics_router)
 
 
@@ -89,16 +117,41 @@ async def preload_heavy_imports():
     logger.info("Heavy dependencies pre-loaded")
 
 
+async def reconcile_storage_manifest():
+    """Periodically repair the storage manifest against the bucket"""
+    from app.core.constants import StorageConfig
+    from app.services.storage_service import StorageService
+
+    while True:
+        try:
+            await asyncio.to_thread(StorageService().reconcile_manifest)
+        except Exception as e:
+            logger.warning(f"Storage manifest reconciliation failed: {e}")
+        await asyncio.sleep(StorageConfig.RECONCILE_INTERVAL_SECONDS)
+
+
 @app.on_event("startup")
 async def startup_event():
     logger.info("Resumade API starting up...")
+    template_registry.compile_all()
+    template_gallery.build()
+    # Build the font cache before workers start so none of them scans fonts
+    await asyncio.to_thread(build_font_cache)
+    render_pool.start()
+    speculative_renderer.start()
     # Start background task to load heavy imports
     asyncio.create_task(preload_heavy_imports())
+    asyncio.create_task(reconcile_storage_manifest())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("Resumade API shutting down...")
+    speculative_renderer.shutdown()
+    render_pool.shutdown()
+    import_pool.shutdown()
+    await asyncio.to_thread(background_uploader.shutdown)
+    mark_worker_dead()
 
 
 @app.api_route("/", methods=["GET", "HEAD"])
@@ -111,3 +164,18 @@ def root():
 def health_check():
     """Health check endpoint for monitoring"""
     return {"status": "healthy", "database": "connected"}
+
+
+@app.get("/metrics", include_in_schema=False)
+def metrics_endpoint(authorization: str = Header(default="")):
+    """Prometheus metrics of every worker, for scrapers holding the metrics token"""
+    if not settings.metrics_token:
+        raise HTTPException(status_code=404, detail="Not Found")
+    expected = f"Bearer {settings.metrics_token}"
+    if not hmac.compare_digest(authorization.encode(), expected.encode()):
+        raise HTTPException(
+            status_code=401,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    return Response(render_latest(), media_type=CONTENT_TYPE_LATEST)
@@ -1,13 +1,28 @@
-from .pdf_service import PDFService
-from .storage_service import StorageService
-from .ats import ATSService
-from .docx_service import DOCXService
-from .ai_content_service import AIContentService
-
-__all__ = [
-    "PDFService",
-    "StorageService",
-    "ATSService",
-    "DOCXService",
-    "AIContentService",
-]
+"""Application services
+
+Services are imported on first attribute access, so importing a light
+submodule (e.g. the PDF parser in an import worker) does not pull in
+WeasyPrint, Supabase, Gemini or the Redis cache.
+"""
+
+import importlib
+
+_SERVICES = {
+    "PDFService": ".pdf_service",
+    "StorageService": ".storage_service",
+    "ATSService": ".ats",
+    "DOCXService": ".docx_service",
+    "AIContentService": ".ai_content_service",
+    "ExportService": ".export_service",
+    "ExportJobService": ".export_job_service",
+}
+
+__all__ = list(_SERVICES)
+
+
+def __getattr__(name: str):
+    if name not in _SERVICES:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    service = getattr(importlib.import_module(_SERVICES[name], __name__), name)
+    globals()[name] = service
+    return service
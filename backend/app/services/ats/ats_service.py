@@ -4,10 +4,10 @@ from typing import Dict
 from app.core.constants import ATSConstants, CacheConstants
 from app.core.cache import cached
 from .keywords import (
-    normalize_text,
     extract_keywords_from_job_description,
     get_keyword_suggestions,
 )
+from app.services.resume_document import ResumeDocument
 from .validators import check_formatting_issues
 from .gemini_service import GeminiService
 from .scorers import (
@@ -29,9 +29,14 @@ class ATSService:
     @staticmethod
     @cached(CacheConstants.ATS_SCORE_CACHE_TTL)
     def calculate_ats_score(
-        resume_data: dict, job_description: str = None, role_level: str = "mid"
+        resume_data, job_description: str = None, role_level: str = "mid"
     ) -> Dict:
-        """Calculate comprehensive ATS score with dynamic weighting"""
+        """Calculate comprehensive ATS score with dynamic weighting
+
+        Accepts a ResumeDocument or resume data; callers that also need
+        keyword suggestions should build the document once and pass it.
+        """
+        resume = ResumeDocument.of(resume_data)
 
         # Get weights based on role level
         weight_set = ATSConstants.ROLE_WEIGHTS.get(
@@ -40,14 +45,12 @@ class ATSService:
 
         # Score each section
         section_scores = {
-            "personal_info": score_personal_info(resume_data.get("personal_info", {})),
-            "experience": score_experience(resume_data.get("experience", [])),
-            "education": score_education(resume_data.get("education", [])),
-            "skills": score_skills(resume_data.get("skills", []), job_description),
-            "certifications": score_certifications(
-                resume_data.get("certifications", [])
-            ),
-            "projects": score_projects(resume_data.get("projects", [])),
+            "personal_info": score_personal_info(resume.personal_info),
+            "experience": score_experience(resume.experience),
+            "education": score_education(resume.education),
+            "skills": score_skills(resume.skills, job_description),
+            "certifications": score_certifications(resume.certifications),
+            "projects": score_projects(resume.projects),
         }
 
         # Calculate weighted score
@@ -74,7 +77,7 @@ class ATSService:
         all_feedback = all_feedback[: ATSConstants.MAX_FEEDBACK_ITEMS]
 
         # Check formatting
-        formatting = check_formatting_issues(resume_data)
+        formatting = check_formatting_issues(resume)
         if formatting["has_issues"]:
             all_feedback.extend(formatting["issues"])
             total_weighted_score -= 5
@@ -87,8 +90,7 @@ class ATSService:
         # Job description matching bonus
         if job_description:
             jd_keywords = extract_keywords_from_job_description(job_description)
-            resume_text = normalize_text(str(resume_data))
-            matches = sum(1 for kw in jd_keywords if kw in resume_text)
+            matches = sum(1 for kw in jd_keywords if kw in resume.text)
             match_bonus = min(matches * 0.5, 5)
             total_weighted_score += match_bonus
 
@@ -101,7 +103,7 @@ class ATSService:
 
         # Get AI-enhanced feedback
         ai_feedback = _gemini_service.enhance_feedback(
-            resume_data, final_score, all_feedback
+            resume, final_score, all_feedback
         )
 
         return {
@@ -142,6 +144,6 @@ class ATSService:
             return "F"
 
     @staticmethod
-    def get_keyword_suggestions(resume_data: dict, job_description: str = None) -> list:
+    def get_keyword_suggestions(resume_data, job_description: str = None) -> list:
         """Suggest keywords to improve ATS compatibility"""
-        return get_keyword_suggestions(resume_data, job_description)
+        return get_keyword_suggestions(ResumeDocument.of(resume_data), job_description)
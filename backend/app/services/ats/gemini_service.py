@@ -6,6 +6,7 @@ import google.generativeai as genai
 from app.core.config import settings
 from app.core.cache import cached
 from app.core.constants import CacheConstants
+from app.services.resume_document import ResumeDocument
 
 logger = logging.getLogger(__name__)
 
@@ -23,15 +24,15 @@ class GeminiService:
             logger.warning("Gemini API key not found. AI-enhanced feedback disabled.")
 
     @cached(CacheConstants.ATS_SCORE_CACHE_TTL)
-    def enhance_feedback(
-        self, resume_data: dict, base_score: float, base_feedback: list
-    ) -> Dict:
+    def enhance_feedback(self, resume, base_score: float, base_feedback: list) -> Dict:
         """Enhance ATS feedback with AI-generated insights"""
         if not self.enabled:
             return {"enhanced_feedback": None, "ai_suggestions": []}
 
         try:
-            prompt = self._build_prompt(resume_data, base_score, base_feedback)
+            prompt = self._build_prompt(
+                ResumeDocument.of(resume), base_score, base_feedback
+            )
             response = self.model.generate_content(prompt)
 
             return {
@@ -42,14 +43,14 @@ class GeminiService:
             logger.error(f"Gemini API error: {str(e)}")
             return {"enhanced_feedback": None, "ai_suggestions": []}
 
-    def _build_prompt(self, resume_data: dict, score: float, feedback: list) -> str:
-        """Build prompt for Gemini"""
-        personal_info = resume_data.get("personal_info", {})
-        experience_count = len(resume_data.get("experience", []))
-        education_count = len(resume_data.get("education", []))
-        skills_count = len(resume_data.get("skills", []))
-        certifications_count = len(resume_data.get("certifications", []))
-        projects_count = len(resume_data.get("projects", []))
+    def _build_prompt(self, resume, score: float, feedback: list) -> str:
+        """Build prompt for Gemini from a ResumeDocument"""
+        personal_info = resume.personal_info
+        experience_count = len(resume.experience)
+        education_count = len(resume.education)
+        skills_count = len(resume.skills)
+        certifications_count = len(resume.certifications)
+        projects_count = len(resume.projects)
 
         return f"""Analyze this resume for ATS optimization. Current ATS score: {score}%
 
@@ -98,15 +98,11 @@ def fuzzy_match(
     return ratio >= threshold
 
 
-def get_keyword_suggestions(
-    resume_data: dict, job_description: str = None
-) -> List[str]:
-    """Suggest keywords to improve ATS compatibility"""
+def get_keyword_suggestions(resume, job_description: str = None) -> List[str]:
+    """Suggest keywords to improve ATS compatibility for a ResumeDocument"""
     suggestions = []
 
-    current_skills = [
-        normalize_text(s.get("name", "")) for s in resume_data.get("skills", [])
-    ]
+    current_skills = [normalize_text(s.get("name", "")) for s in resume.skills]
 
     if job_description:
         jd_keywords = extract_keywords_from_job_description(job_description)
@@ -6,10 +6,10 @@ from typing import Dict
 PROBLEMATIC_CHARS = r"[★☆♥♦●○◆◇■□▪▫]"
 
 
-def check_formatting_issues(resume_data: dict) -> Dict:
-    """Check for ATS-unfriendly formatting"""
+def check_formatting_issues(resume) -> Dict:
+    """Check a ResumeDocument for ATS-unfriendly formatting"""
     issues = []
-    personal_info = resume_data.get("personal_info", {})
+    personal_info = resume.personal_info
 
     # Check name
     name = personal_info.get("full_name", "")
@@ -2,32 +2,199 @@ from docx import Document
 from docx.shared import Pt
 from docx.enum.text import WD_ALIGN_PARAGRAPH
 from io import BytesIO
+from typing import Dict, Iterator, NamedTuple, Optional, Tuple
+from xml.sax.saxutils import escape
 import logging
-from app.core.cache import cached
-from app.core.constants import CacheConstants
+import re
+import threading
+import zipfile
+
+from app.core.render_metrics import RenderTrace
+from app.services.resume_document import ResumeDocument
 
 logger = logging.getLogger(__name__)
 
+DOCUMENT_PART = "word/document.xml"
+# Run text is split into <w:t> segments at tabs and line breaks, as python-docx does
+RUN_BREAKS = re.compile(r"(\t|\r|\n)")
+# Characters XML 1.0 cannot carry
+INVALID_XML_CHARS = re.compile("[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+
+class Run(NamedTuple):
+    text: Optional[str]
+    bold: bool = False
+    italic: bool = False
+
+
+class Paragraph(NamedTuple):
+    runs: Tuple[Run, ...] = ()
+    style: Optional[str] = None
+    centered: bool = False
+
+
+def _text_paragraph(text, style=None, centered=False, italic=False) -> Paragraph:
+    """Paragraph with a single run, or none for empty text (as add_paragraph)"""
+    return Paragraph((Run(text, italic=italic),) if text else (), style, centered)
+
+
+def _base_document():
+    """python-docx's default document with the resume styles applied"""
+    doc = Document()
+
+    # Set default font
+    style = doc.styles["Normal"]
+    font = style.font
+    font.name = "Calibri"
+    font.size = Pt(11)
+    return doc
+
+
+class DOCXPackage:
+    """The restyled base package, prepared once, with document.xml written per resume
+
+    Every part except ``word/document.xml`` is the same for all resumes, so
+    they are compressed into a base zip once. An export copies that zip and
+    streams its paragraphs straight into a new ``document.xml`` entry.
+    """
+
+    def __init__(self):
+        self._base: Optional[bytes] = None
+        self._head = b""
+        self._tail = b""
+        self._style_ids: Dict[str, str] = {}
+        self._lock = threading.Lock()
+
+    def _prepare(self):
+        doc = _base_document()
+        style_ids = {style.name: style.style_id for style in doc.styles}
+        buffer = BytesIO()
+        doc.save(buffer)
+
+        base = BytesIO()
+        with zipfile.ZipFile(buffer) as source, zipfile.ZipFile(
+            base, "w", zipfile.ZIP_DEFLATED
+        ) as target:
+            for info in source.infolist():
+                if info.filename == DOCUMENT_PART:
+                    document = source.read(info)
+                else:
+                    target.writestr(info, source.read(info))
+
+        # The default body holds only the section properties
+        body = document.index(b"<w:body>") + len(b"<w:body>")
+        self._head = document[:body]
+        self._tail = document[document.index(b"<w:sectPr", body) :]
+        self._style_ids = style_ids
+        self._base = base.getvalue()
+
+    def _ensure_prepared(self):
+        if self._base is None:
+            with self._lock:
+                if self._base is None:
+                    self._prepare()
+
+    @staticmethod
+    def _run_xml(run: Run) -> str:
+        properties = ("<w:b/>" if run.bold else "") + ("<w:i/>" if run.italic else "")
+        content = []
+        if run.text:
+            text = INVALID_XML_CHARS.sub("", str(run.text))
+            for segment in RUN_BREAKS.split(text):
+                if segment == "\t":
+                    content.append("<w:tab/>")
+                elif segment in ("\r", "\n"):
+                    content.append("<w:br/>")
+                elif segment:
+                    space = (
+                        ' xml:space="preserve"'
+                        if len(segment.strip()) < len(segment)
+                        else ""
+                    )
+                    content.append(f"<w:t{space}>{escape(segment)}</w:t>")
+
+        if not properties and not content:
+            return "<w:r/>"
+        if properties:
+            properties = f"<w:rPr>{properties}</w:rPr>"
+        return f"<w:r>{properties}{''.join(content)}</w:r>"
+
+    def _paragraph_xml(self, paragraph: Paragraph) -> str:
+        properties = ""
+        if paragraph.style:
+            properties += f'<w:pStyle w:val="{self._style_ids[paragraph.style]}"/>'
+        if paragraph.centered:
+            properties += '<w:jc w:val="center"/>'
+
+        runs = "".join(self._run_xml(run) for run in paragraph.runs)
+        if not properties and not runs:
+            return "<w:p/>"
+        if properties:
+            properties = f"<w:pPr>{properties}</w:pPr>"
+        return f"<w:p>{properties}{runs}</w:p>"
+
+    def write(self, paragraphs) -> bytes:
+        """Build a .docx from the base package and the given paragraphs"""
+        self._ensure_prepared()
+
+        buffer = BytesIO(self._base)
+        with zipfile.ZipFile(buffer, "a", zipfile.ZIP_DEFLATED) as package:
+            with package.open(DOCUMENT_PART, "w") as part:
+                part.write(self._head)
+                for paragraph in paragraphs:
+                    part.write(self._paragraph_xml(paragraph).encode("utf-8"))
+                part.write(self._tail)
+        return buffer.getvalue()
+
+
+# Global DOCX base package
+docx_package = DOCXPackage()
+
 
 class DOCXService:
     """Service for generating DOCX resumes"""
 
     @staticmethod
-    @cached(CacheConstants.TEMPLATE_CACHE_TTL)
-    def generate_resume_docx(resume_data: dict) -> bytes:
-        """Generate a DOCX file from resume data"""
-        doc = Document()
+    def generate_resume_docx(resume) -> bytes:
+        """Generate a DOCX file from a resume document (or resume data)"""
+        resume = ResumeDocument.of(resume)
+        trace = RenderTrace("docx", resume=resume)
+        with trace.stage("build"):
+            paragraphs = list(DOCXService._layout(resume))
 
-        # Set default font
-        style = doc.styles["Normal"]
-        font = style.font
-        font.name = "Calibri"
-        font.size = Pt(11)
+        with trace.stage("serialize"):
+            content = docx_package.write(paragraphs)
 
+        trace.finish(content)
+        return content
+
+    @staticmethod
+    def _build_document(resume):
+        """Lay out the resume through python-docx's object layer
+
+        Reference for the lean writer above; used by tests and benchmarks.
+        """
+        doc = _base_document()
+        for paragraph in DOCXService._layout(ResumeDocument.of(resume)):
+            p = doc.add_paragraph(style=paragraph.style)
+            if paragraph.centered:
+                p.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            for run in paragraph.runs:
+                r = p.add_run(run.text)
+                if run.bold:
+                    r.bold = True
+                if run.italic:
+                    r.italic = True
+        return doc
+
+    @staticmethod
+    def _layout(resume: ResumeDocument) -> Iterator[Paragraph]:
+        """Paragraphs of the resume document, in order"""
         # Personal Info Header
-        personal_info = resume_data.get("personal_info", {})
-        name = doc.add_heading(personal_info.get("full_name", ""), level=1)
-        name.alignment = WD_ALIGN_PARAGRAPH.CENTER
+        personal_info = resume.personal_info
+        yield _text_paragraph(
+            personal_info.get("full_name", ""), style="Heading 1", centered=True
+        )
 
         # Contact Info
         contact_parts = []
@@ -39,94 +206,86 @@ class DOCXService:
             contact_parts.append(personal_info["location"])
 
         if contact_parts:
-            contact = doc.add_paragraph(" | ".join(contact_parts))
-            contact.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            yield _text_paragraph(" | ".join(contact_parts), centered=True)
 
         if personal_info.get("linkedin"):
-            linkedin = doc.add_paragraph(personal_info["linkedin"])
-            linkedin.alignment = WD_ALIGN_PARAGRAPH.CENTER
+            yield _text_paragraph(personal_info["linkedin"], centered=True)
 
         # Summary
         if personal_info.get("summary"):
-            doc.add_heading("Professional Summary", level=2)
-            doc.add_paragraph(personal_info["summary"])
+            yield _text_paragraph("Professional Summary", style="Heading 2")
+            yield _text_paragraph(personal_info["summary"])
 
         # Experience
-        experience = resume_data.get("experience", [])
+        experience = resume.experience
         if experience:
-            doc.add_heading("Experience", level=2)
+            yield _text_paragraph("Experience", style="Heading 2")
             for exp in experience:
                 # Position and Company
-                p = doc.add_paragraph()
-                p.add_run(exp.get("position", "")).bold = True
-                p.add_run(f" | {exp.get('company', '')}")
+                yield Paragraph(
+                    (
+                        Run(exp.get("position", ""), bold=True),
+                        Run(f" | {exp.get('company', '')}"),
+                    )
+                )
 
                 # Dates
                 dates = (
                     f"{exp.get('start_date', '')} - {exp.get('end_date', 'Present')}"
                 )
-                date_p = doc.add_paragraph(dates)
-                date_p.runs[0].italic = True
+                yield _text_paragraph(dates, italic=True)
 
                 # Description
                 if exp.get("description"):
-                    doc.add_paragraph(exp["description"])
+                    yield _text_paragraph(exp["description"])
 
                 # Achievements
                 if exp.get("achievements"):
                     for achievement in exp["achievements"]:
-                        doc.add_paragraph(achievement, style="List Bullet")
+                        yield _text_paragraph(achievement, style="List Bullet")
 
         # Education
-        education = resume_data.get("education", [])
+        education = resume.education
         if education:
-            doc.add_heading("Education", level=2)
+            yield _text_paragraph("Education", style="Heading 2")
             for edu in education:
-                p = doc.add_paragraph()
-                p.add_run(
-                    f"{edu.get('degree', '')} in {edu.get('field', '')}"
-                ).bold = True
-                doc.add_paragraph(edu.get("institution", ""))
+                degree = f"{edu.get('degree', '')} in {edu.get('field', '')}"
+                yield Paragraph((Run(degree, bold=True),))
+                yield _text_paragraph(edu.get("institution", ""))
                 dates = (
                     f"{edu.get('start_date', '')} - {edu.get('end_date', 'Present')}"
                 )
-                date_p = doc.add_paragraph(dates)
-                date_p.runs[0].italic = True
+                yield _text_paragraph(dates, italic=True)
                 if edu.get("gpa"):
-                    doc.add_paragraph(f"GPA: {edu['gpa']}")
+                    yield _text_paragraph(f"GPA: {edu['gpa']}")
 
         # Skills
-        skills = resume_data.get("skills", [])
+        skills = resume.skills
         if skills:
-            doc.add_heading("Skills", level=2)
+            yield _text_paragraph("Skills", style="Heading 2")
             skill_names = [s.get("name", "") for s in skills]
-            doc.add_paragraph(", ".join(skill_names))
+            yield _text_paragraph(", ".join(skill_names))
 
         # Projects
-        projects = resume_data.get("projects", [])
+        projects = resume.projects
         if projects:
-            doc.add_heading("Projects", level=2)
+            yield _text_paragraph("Projects", style="Heading 2")
             for project in projects:
-                p = doc.add_paragraph()
-                p.add_run(project.get("name", "")).bold = True
-                doc.add_paragraph(project.get("description", ""))
+                yield Paragraph((Run(project.get("name", ""), bold=True),))
+                yield _text_paragraph(project.get("description", ""))
                 if project.get("technologies"):
                     tech = ", ".join(project["technologies"])
-                    doc.add_paragraph(f"Technologies: {tech}")
+                    yield _text_paragraph(f"Technologies: {tech}")
 
         # Certifications
-        certifications = resume_data.get("certifications", [])
+        certifications = resume.certifications
         if certifications:
-            doc.add_heading("Certifications", level=2)
+            yield _text_paragraph("Certifications", style="Heading 2")
             for cert in certifications:
-                p = doc.add_paragraph()
-                p.add_run(cert.get("name", "")).bold = True
-                p.add_run(f" | {cert.get('issuer', '')}")
-                doc.add_paragraph(cert.get("date", ""))
-
-        # Save to BytesIO
-        buffer = BytesIO()
-        doc.save(buffer)
-        buffer.seek(0)
-
-        return buffer.getvalue()
+                yield Paragraph(
+                    (
+                        Run(cert.get("name", ""), bold=True),
+                        Run(f" | {cert.get('issuer', '')}"),
+                    )
+                )
+                yield _text_paragraph(cert.get("date", ""))
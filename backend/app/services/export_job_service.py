@@ -0,0 +1,224 @@
+"""Asynchronous export jobs with state shared through Redis"""
+
+import asyncio
+import copy
+import logging
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from typing import Optional, Tuple
+
+from app.core.artifact_cache import artifact_cache
+from app.core.cache import RedisCache, redis_cache
+from app.core.config import settings
+from app.core.constants import ExportJobConfig, RenderConfig, ResponseMessages
+from app.core.render_pool import PoolSaturatedError
+from app.services.export_service import ExportService
+from app.services.resume_document import ResumeDocument
+
+logger = logging.getLogger(__name__)
+
+
+class ExportJobStatus:
+    """Export job lifecycle states"""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    DONE = "done"
+    FAILED = "failed"
+
+
+class ExportJobStore:
+    """Job records in Redis, or a bounded LRU in process memory without Redis"""
+
+    KEY_PREFIX = "export_job:"
+
+    def __init__(
+        self,
+        redis: Optional[RedisCache] = None,
+        ttl: int = ExportJobConfig.JOB_TTL,
+        max_entries: int = ExportJobConfig.MAX_LOCAL_JOBS,
+    ):
+        self.redis = redis
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._local: OrderedDict[str, Tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _use_redis(self) -> bool:
+        return self.redis is not None and self.redis.client is not None
+
+    def save(self, job: dict):
+        """Persist a job record"""
+        if self._use_redis() and self.redis.set(
+            self.KEY_PREFIX + job["id"], job, self.ttl
+        ):
+            return
+        with self._lock:
+            self._local.pop(job["id"], None)
+            self._local[job["id"]] = (time.monotonic() + self.ttl, copy.deepcopy(job))
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        """Get a job record by id"""
+        if self._use_redis():
+            job = self.redis.get(self.KEY_PREFIX + job_id)
+            if job is not None:
+                return job
+        with self._lock:
+            entry = self._local.get(job_id)
+            if entry is None:
+                return None
+            expires, job = entry
+            if expires <= time.monotonic():
+                del self._local[job_id]
+                return None
+            self._local.move_to_end(job_id)
+        return copy.deepcopy(job)
+
+    def update(self, job_id: str, **fields) -> Optional[dict]:
+        """Merge fields into a job record"""
+        job = self.get(job_id)
+        if job is None:
+            return None
+        job.update(fields)
+        self.save(job)
+        return job
+
+
+class ExportJobService:
+    """Queue exports and run them outside the request"""
+
+    # Limits concurrently rendering jobs so the rest wait as "queued"
+    # instead of failing when the render pool is saturated
+    _slots = asyncio.Semaphore(settings.pdf_render_workers)
+
+    def __init__(self, store: Optional[ExportJobStore] = None):
+        self.store = store or export_job_store
+
+    @staticmethod
+    def snapshot(resume) -> ResumeDocument:
+        """Copy the render inputs so the job does not need a DB session"""
+        return ResumeDocument.of(resume)
+
+    def submit(self, resume, fmt: str, template: str, user_id: Optional[int]) -> dict:
+        """Create a queued job record"""
+        job = {
+            "id": uuid.uuid4().hex,
+            "resume_id": resume.id,
+            "user_id": user_id,
+            "format": fmt,
+            "template": template,
+            "status": ExportJobStatus.QUEUED,
+            "created_at": datetime.utcnow().isoformat(),
+            "started_at": None,
+            "finished_at": None,
+            "queue_seconds": None,
+            "render_seconds": None,
+            "artifact_key": None,
+            "stored_filename": None,
+            "error": None,
+            "retry_after": None,
+        }
+        self.store.save(job)
+        logger.info(f"Queued {fmt} export job {job['id']} for resume {resume.id}")
+        return job
+
+    async def _export(self, service: ExportService, resume, fmt: str, template: str):
+        """Export, waiting for render pool capacity instead of failing"""
+        retries = 0
+        while True:
+            try:
+                return await service.export(resume, fmt, template)
+            except PoolSaturatedError:
+                retries += 1
+                if retries > ExportJobConfig.MAX_SATURATED_RETRIES:
+                    raise
+                await asyncio.sleep(ExportJobConfig.SATURATED_RETRY_SECONDS)
+
+    @staticmethod
+    async def _persist(
+        service: ExportService, resume, fmt: str, template: str, content: bytes
+    ) -> Optional[str]:
+        """Store a finished PDF where every worker can serve its download
+
+        The artifact cache shares artifacts across workers only through
+        Redis, which skips large ones, and the download may reach any worker.
+        """
+        if fmt != "pdf":
+            return None
+        try:
+            return await asyncio.to_thread(service.store_pdf, resume, template, content)
+        except Exception as e:
+            logger.warning(f"Could not store the PDF of an export job: {str(e)}")
+            return None
+
+    async def run(self, job_id: str, resume):
+        """Render a queued job and record the outcome"""
+        job = self.store.get(job_id)
+        if job is None:
+            logger.error(f"Export job {job_id} disappeared before running")
+            return
+
+        async with self._slots:
+            started_at = time.monotonic()
+            now = datetime.utcnow()
+            queued_for = now - datetime.fromisoformat(job["created_at"])
+            self.store.update(
+                job_id,
+                status=ExportJobStatus.RUNNING,
+                started_at=now.isoformat(),
+                queue_seconds=round(queued_for.total_seconds(), 3),
+            )
+
+            try:
+                service = ExportService()
+                fmt, template = job["format"], job["template"]
+                content = await self._export(service, resume, fmt, template)
+                stored_filename = await self._persist(
+                    service, resume, fmt, template, content
+                )
+                self.store.update(
+                    job_id,
+                    status=ExportJobStatus.DONE,
+                    artifact_key=service.cache_key(resume, fmt, template),
+                    stored_filename=stored_filename,
+                    finished_at=datetime.utcnow().isoformat(),
+                    render_seconds=round(time.monotonic() - started_at, 3),
+                )
+                logger.info(f"Export job {job_id} finished")
+            except BrokenProcessPool:
+                # A render worker died under this job; asking again can succeed
+                logger.error(f"Export job {job_id} lost its render worker")
+                self.store.update(
+                    job_id,
+                    status=ExportJobStatus.FAILED,
+                    error=ResponseMessages.RENDER_INTERRUPTED,
+                    retry_after=RenderConfig.RETRY_AFTER_SECONDS,
+                    finished_at=datetime.utcnow().isoformat(),
+                    render_seconds=round(time.monotonic() - started_at, 3),
+                )
+            except Exception as e:
+                logger.error(f"Export job {job_id} failed: {str(e)}")
+                self.store.update(
+                    job_id,
+                    status=ExportJobStatus.FAILED,
+                    error=str(e),
+                    finished_at=datetime.utcnow().isoformat(),
+                    render_seconds=round(time.monotonic() - started_at, 3),
+                )
+
+    @staticmethod
+    def get_artifact(job: dict) -> Optional[bytes]:
+        """Get the rendered bytes of a finished job"""
+        if not job.get("artifact_key"):
+            return None
+        return artifact_cache.get(job["artifact_key"])
+
+
+# Global export job store
+export_job_store = ExportJobStore(redis_cache)
@@ -0,0 +1,104 @@
+import asyncio
+import logging
+from typing import Optional
+
+from app.core.artifact_cache import artifact_cache, artifact_key
+from app.core.constants import ArtifactCacheConfig, StorageConfig
+from app.services.pdf_service import PDFService
+from app.services.docx_service import DOCXService
+from app.services import exporters
+from app.services.resume_document import ResumeDocument
+
+logger = logging.getLogger(__name__)
+
+
+class ExportService:
+    """Render resume exports through the shared artifact cache"""
+
+    MEDIA_TYPES = {
+        "pdf": "application/pdf",
+        "docx": "application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        **{fmt: e.media_type for fmt, e in exporters.EXPORTERS.items()},
+    }
+    FORMAT_PATTERN = f"^({'|'.join(MEDIA_TYPES)})$"
+
+    def __init__(self):
+        self.pdf_service = PDFService()
+
+    def cache_key(self, resume, fmt: str, template: str) -> str:
+        """Content-addressed key for an export artifact"""
+        resume = ResumeDocument.of(resume)
+        if fmt == "pdf":
+            # Unknown names render the default, so they share its key
+            template = self.pdf_service.canonical_template(template)
+            template_part = (template, self.pdf_service.get_template_version(template))
+        else:
+            template_part = None
+        return artifact_key(
+            fmt,
+            ArtifactCacheConfig.RENDERER_VERSION,
+            template_part,
+            resume.content_hash,
+        )
+
+    async def _render(self, resume, fmt: str, template: str, key: str) -> bytes:
+        if fmt == "pdf":
+            return await self.pdf_service.generate_resume_pdf_async(
+                resume, template, content_key=key
+            )
+        if fmt == "docx":
+            return await asyncio.to_thread(DOCXService.generate_resume_docx, resume)
+        return await asyncio.to_thread(exporters.render, resume, fmt)
+
+    async def export(self, resume, fmt: str, template: str) -> bytes:
+        """Get export bytes from the artifact cache, rendering on a miss"""
+        resume = ResumeDocument.of(resume)
+        template = self.pdf_service.canonical_template(template)
+        key = self.cache_key(resume, fmt, template)
+
+        content = await asyncio.to_thread(artifact_cache.get, key)
+        if content is not None:
+            logger.info(f"Export cache hit: {fmt} {key[:12]}")
+            return content
+
+        content = await self._render(resume, fmt, template, key)
+        await asyncio.to_thread(artifact_cache.set, key, content)
+        return content
+
+    def _stored_pdf_filename(self, resume, template: str) -> Optional[str]:
+        """Storage filename of the PDF for the resume's current content"""
+        if not resume.id:
+            return None
+        template = self.pdf_service.canonical_template(template)
+        return self.pdf_service.storage.generate_pdf_filename(
+            resume.id, template, self.cache_key(resume, "pdf", template)
+        )
+
+    def store_pdf(self, resume, template: str, content: bytes) -> Optional[str]:
+        """Put a rendered PDF in storage now unless it is already there
+
+        Returns:
+            str: Storage filename, None for guest resumes or a failed upload
+        """
+        filename = self._stored_pdf_filename(resume, template)
+        if not filename:
+            return None
+        storage = self.pdf_service.storage
+        if storage.pdf_exists(filename) or storage.upload_pdf(content, filename):
+            return filename
+        return None
+
+    def stored_pdf_url(self, resume, template: str) -> Optional[str]:
+        """Signed storage URL of the PDF for the resume's current content, if stored"""
+        filename = self._stored_pdf_filename(resume, template)
+        storage = self.pdf_service.storage
+        if not filename or not storage.pdf_exists(filename):
+            return None
+        return storage.create_signed_url(filename, StorageConfig.SIGNED_URL_TTL_SECONDS)
+
+    def stored_pdf_path(self, resume, template: str) -> Optional[str]:
+        """Local file of the PDF for the resume's current content, if on this disk"""
+        filename = self._stored_pdf_filename(resume, template)
+        if not filename:
+            return None
+        return self.pdf_service.storage.local_path(filename)
@@ -0,0 +1,76 @@
+"""Streaming text exporters, one module per format
+
+Each module in this package registers a generator with ``@exporter``;
+importing the package imports them all, so adding a format means adding
+a module.
+"""
+
+import importlib
+import pkgutil
+from typing import Callable, Dict, Iterable, Iterator, NamedTuple
+
+from app.core.constants import ExportConfig
+from app.core.render_metrics import RenderTrace
+from app.services.resume_document import ResumeDocument
+
+
+class Exporter(NamedTuple):
+    format: str
+    media_type: str
+    render: Callable[[ResumeDocument], Iterator[str]]
+
+
+EXPORTERS: Dict[str, Exporter] = {}
+
+
+def exporter(fmt: str, media_type: str):
+    """Register a generator of text pieces as the exporter for a format"""
+
+    def register(render):
+        EXPORTERS[fmt] = Exporter(fmt, media_type, render)
+        return render
+
+    return register
+
+
+def encode(
+    pieces: Iterable[str], chunk_size: int = ExportConfig.STREAM_CHUNK_SIZE
+) -> Iterator[bytes]:
+    """UTF-8 encode text pieces, batched into chunks of about chunk_size bytes"""
+    buffer, size = [], 0
+    for piece in pieces:
+        data = piece.encode("utf-8")
+        buffer.append(data)
+        size += len(data)
+        if size >= chunk_size:
+            yield b"".join(buffer)
+            buffer, size = [], 0
+    if buffer:
+        yield b"".join(buffer)
+
+
+def stream(resume, fmt: str) -> Iterator[bytes]:
+    """Encoded chunks of the resume in a text format, rendered as they are read"""
+    resume = ResumeDocument.of(resume)
+    trace = RenderTrace(fmt, resume=resume)
+    chunks = encode(EXPORTERS[fmt].render(resume))
+    size = 0
+    while True:
+        # Time rendering only, not the wait for the client to read
+        with trace.stage("render"):
+            chunk = next(chunks, None)
+        if chunk is None:
+            break
+        size += len(chunk)
+        yield chunk
+    trace.finish(size=size)
+
+
+def render(resume, fmt: str) -> bytes:
+    """The whole export at once, for callers that store it"""
+    return b"".join(stream(resume, fmt))
+
+
+# Register every format module in this package
+for _module in pkgutil.iter_modules(__path__):
+    importlib.import_module(f"{__name__}.{_module.name}")
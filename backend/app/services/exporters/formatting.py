@@ -0,0 +1,70 @@
+"""Formatting helpers shared by the text exporters"""
+
+from typing import Iterable, Iterator, List, Tuple
+
+# Section headings, in export order
+SECTION_TITLES = {
+    "summary": "Professional Summary",
+    "experience": "Experience",
+    "education": "Education",
+    "skills": "Skills",
+    "projects": "Projects",
+    "certifications": "Certifications",
+}
+CONTACT_FIELDS = (
+    ("email", "Email"),
+    ("phone", "Phone"),
+    ("location", "Location"),
+    ("linkedin", "LinkedIn"),
+    ("website", "Website"),
+)
+
+
+def join_lines(lines: Iterable[str]) -> Iterator[str]:
+    """Newline-separated lines, streamed one piece at a time"""
+    separator = ""
+    for line in lines:
+        yield separator + line
+        separator = "\n"
+
+
+def contact_items(personal_info) -> List[Tuple[str, str]]:
+    """(label, value) pairs of the contact details that are set"""
+    return [
+        (label, personal_info[field])
+        for field, label in CONTACT_FIELDS
+        if personal_info.get(field)
+    ]
+
+
+def experience_dates(exp) -> str:
+    end = "Present" if exp.get("current") else exp.get("end_date", "Present")
+    return f"{exp.get('start_date', '')} - {end}"
+
+
+def education_dates(edu) -> str:
+    return f"{edu.get('start_date', '')} - {edu.get('end_date', '')}"
+
+
+def position_line(exp) -> str:
+    return f"{exp.get('position', '')} | {exp.get('company', '')}"
+
+
+def degree_line(edu) -> str:
+    return f"{edu.get('degree', '')} in {edu.get('field_of_study', '')}"
+
+
+def skill_label(skill) -> str:
+    label = skill.get("name", "")
+    if skill.get("level"):
+        label += f" ({skill['level']})"
+    return label
+
+
+def certification_line(cert) -> str:
+    return f"{cert.get('name', '')} | {cert.get('issuer', '')}"
+
+
+def project_url(project) -> str:
+    # The editor stores "link"; older resumes use "url"
+    return project.get("url") or project.get("link") or ""
@@ -0,0 +1,98 @@
+"""JSON Resume export (https://jsonresume.org/schema)"""
+
+import json
+from typing import Iterator
+
+from app.services.exporters import exporter
+from app.services.exporters.formatting import project_url
+
+_encoder = json.JSONEncoder(ensure_ascii=False, indent=2)
+
+
+def _compact(entry: dict) -> dict:
+    """Drop unset values; JSON Resume omits fields rather than nulling them"""
+    return {key: value for key, value in entry.items() if value not in (None, "", ())}
+
+
+def _basics(pi) -> dict:
+    basics = _compact(
+        {
+            "name": pi.get("full_name"),
+            "label": pi.get("tagline"),
+            "email": pi.get("email"),
+            "phone": pi.get("phone"),
+            "url": pi.get("website"),
+            "summary": pi.get("summary"),
+        }
+    )
+    if pi.get("location"):
+        basics["location"] = {"address": pi["location"]}
+    if pi.get("linkedin"):
+        basics["profiles"] = [{"network": "LinkedIn", "url": pi["linkedin"]}]
+    return basics
+
+
+def _work(exp) -> dict:
+    return _compact(
+        {
+            "name": exp.get("company"),
+            "position": exp.get("position"),
+            "location": exp.get("location"),
+            "startDate": exp.get("start_date"),
+            # An ongoing role has no end date
+            "endDate": None if exp.get("current") else exp.get("end_date"),
+            "summary": exp.get("description"),
+            "highlights": exp.get("achievements"),
+        }
+    )
+
+
+def _education(edu) -> dict:
+    return _compact(
+        {
+            "institution": edu.get("institution"),
+            "area": edu.get("field_of_study"),
+            "studyType": edu.get("degree"),
+            "startDate": edu.get("start_date"),
+            "endDate": edu.get("end_date"),
+            "score": edu.get("gpa"),
+        }
+    )
+
+
+def _skill(skill) -> dict:
+    return _compact({"name": skill.get("name"), "level": skill.get("level")})
+
+
+def _project(project) -> dict:
+    return _compact(
+        {
+            "name": project.get("name"),
+            "description": project.get("description"),
+            "keywords": project.get("technologies"),
+            "url": project_url(project),
+        }
+    )
+
+
+def _certificate(cert) -> dict:
+    return _compact(
+        {
+            "name": cert.get("name"),
+            "issuer": cert.get("issuer"),
+            "date": cert.get("date"),
+        }
+    )
+
+
+@exporter("json", "application/json")
+def render_json_resume(resume) -> Iterator[str]:
+    document = {
+        "basics": _basics(resume.personal_info),
+        "work": [_work(exp) for exp in resume.experience],
+        "education": [_education(edu) for edu in resume.education],
+        "skills": [_skill(skill) for skill in resume.skills],
+        "projects": [_project(project) for project in resume.projects],
+        "certificates": [_certificate(cert) for cert in resume.certifications],
+    }
+    return _encoder.iterencode(document)
@@ -0,0 +1,111 @@
+"""Markdown export"""
+
+from typing import Iterator
+
+from app.services.exporters import exporter
+from app.services.exporters.formatting import (
+    SECTION_TITLES,
+    certification_line,
+    contact_items,
+    degree_line,
+    education_dates,
+    experience_dates,
+    join_lines,
+    position_line,
+    project_url,
+    skill_label,
+)
+
+
+def _heading(section: str) -> Iterator[str]:
+    yield f"## {SECTION_TITLES[section]}"
+    yield ""
+
+
+def _lines(resume) -> Iterator[str]:
+    # Personal Info
+    pi = resume.personal_info
+    if pi.get("full_name"):
+        yield f"# {pi['full_name']}"
+        yield ""
+
+    contact = contact_items(pi)
+    if contact:
+        yield " | ".join(f"**{label}:** {value}" for label, value in contact)
+        yield ""
+
+    if pi.get("summary"):
+        yield from _heading("summary")
+        yield pi["summary"]
+        yield ""
+
+    # Experience
+    if resume.experience:
+        yield from _heading("experience")
+        for exp in resume.experience:
+            yield f"### {position_line(exp)}"
+            yield ""
+            details = experience_dates(exp)
+            if exp.get("location"):
+                details += f" | {exp['location']}"
+            yield f"*{details}*"
+            yield ""
+            if exp.get("description"):
+                yield exp["description"]
+                yield ""
+            if exp.get("achievements"):
+                for achievement in exp["achievements"]:
+                    yield f"- {achievement}"
+                yield ""
+
+    # Education
+    if resume.education:
+        yield from _heading("education")
+        for edu in resume.education:
+            yield f"### {degree_line(edu)}"
+            yield ""
+            yield edu.get("institution", "")
+            yield ""
+            yield f"*{education_dates(edu)}*"
+            yield ""
+            if edu.get("gpa"):
+                yield f"GPA: {edu['gpa']}"
+                yield ""
+
+    # Skills
+    if resume.skills:
+        yield from _heading("skills")
+        for skill in resume.skills:
+            yield f"- {skill_label(skill)}"
+        yield ""
+
+    # Projects
+    if resume.projects:
+        yield from _heading("projects")
+        for project in resume.projects:
+            yield f"### {project.get('name', '')}"
+            yield ""
+            if project.get("description"):
+                yield project["description"]
+                yield ""
+            if project.get("technologies"):
+                yield f"**Technologies:** {', '.join(project['technologies'])}"
+                yield ""
+            if project_url(project):
+                yield f"<{project_url(project)}>"
+                yield ""
+
+    # Certifications
+    if resume.certifications:
+        yield from _heading("certifications")
+        for cert in resume.certifications:
+            line = f"- {certification_line(cert)}"
+            if cert.get("date"):
+                line += f" ({cert['date']})"
+            yield line
+        yield ""
+
+
+@exporter("md", "text/markdown")
+def render_markdown(resume) -> Iterator[str]:
+    return join_lines(_lines(resume))
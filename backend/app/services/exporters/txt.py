@@ -0,0 +1,100 @@
+"""Plain text export"""
+
+from typing import Iterator
+
+from app.services.exporters import exporter
+from app.services.exporters.formatting import (
+    SECTION_TITLES,
+    certification_line,
+    contact_items,
+    degree_line,
+    education_dates,
+    experience_dates,
+    join_lines,
+    position_line,
+    project_url,
+    skill_label,
+)
+
+
+def _heading(section: str) -> Iterator[str]:
+    title = SECTION_TITLES[section]
+    yield title.upper()
+    yield "-" * len(title)
+
+
+def _lines(resume) -> Iterator[str]:
+    # Personal Info
+    pi = resume.personal_info
+    if pi.get("full_name"):
+        yield pi["full_name"].upper()
+        yield "=" * len(pi["full_name"])
+        yield ""
+
+    contact = contact_items(pi)
+    if contact:
+        for label, value in contact:
+            yield f"{label}: {value}"
+        yield ""
+
+    if pi.get("summary"):
+        yield from _heading("summary")
+        yield pi["summary"]
+        yield ""
+
+    # Experience
+    if resume.experience:
+        yield from _heading("experience")
+        for exp in resume.experience:
+            yield position_line(exp)
+            yield experience_dates(exp)
+            if exp.get("location"):
+                yield exp["location"]
+            if exp.get("description"):
+                yield exp["description"]
+            yield ""
+
+    # Education
+    if resume.education:
+        yield from _heading("education")
+        for edu in resume.education:
+            yield degree_line(edu)
+            yield edu.get("institution", "")
+            yield education_dates(edu)
+            if edu.get("gpa"):
+                yield f"GPA: {edu['gpa']}"
+            yield ""
+
+    # Skills
+    if resume.skills:
+        yield from _heading("skills")
+        for skill in resume.skills:
+            yield skill_label(skill)
+        yield ""
+
+    # Projects
+    if resume.projects:
+        yield from _heading("projects")
+        for project in resume.projects:
+            yield project.get("name", "")
+            if project.get("description"):
+                yield project["description"]
+            if project.get("technologies"):
+                yield f"Technologies: {', '.join(project['technologies'])}"
+            if project_url(project):
+                yield f"URL: {project_url(project)}"
+            yield ""
+
+    # Certifications
+    if resume.certifications:
+        yield from _heading("certifications")
+        for cert in resume.certifications:
+            yield certification_line(cert)
+            if cert.get("date"):
+                yield cert["date"]
+            yield ""
+
+
+@exporter("txt", "text/plain")
+def render_txt(resume) -> Iterator[str]:
+    return join_lines(_lines(resume))
@@ -0,0 +1,136 @@
+"""Sandboxed import of uploaded resume PDFs"""
+
+import asyncio
+import copy
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from fastapi import UploadFile
+
+from app.core.cache import RedisCache, redis_cache
+from app.core.constants import FileConstants, ImportConfig, ResponseMessages
+from app.core.render_pool import PoolCpuLimitError, PoolTimeoutError, import_pool
+from app.services.pdf_parser_service import PDFImportError, parse_resume_upload
+
+logger = logging.getLogger(__name__)
+
+
+class ReceivedUpload(NamedTuple):
+    """An uploaded PDF's bytes and their SHA-256"""
+
+    content: bytes
+    sha256: str
+
+
+class ImportResultStore:
+    """Extractions by PDF hash in Redis, or a bounded LRU without Redis
+
+    Keys include the parser version, so upgrading the parser ignores
+    results stored by the previous one.
+    """
+
+    KEY_PREFIX = "pdf_import:"
+
+    def __init__(
+        self,
+        redis: Optional[RedisCache] = None,
+        ttl: int = ImportConfig.RESULT_CACHE_TTL,
+        max_entries: int = ImportConfig.RESULT_CACHE_SIZE,
+        version: int = ImportConfig.PARSER_VERSION,
+    ):
+        self.redis = redis
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.version = version
+        self._local: OrderedDict[str, Tuple[float, dict]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _use_redis(self) -> bool:
+        return self.redis is not None and self.redis.client is not None
+
+    def _key(self, sha256: str) -> str:
+        return f"{self.KEY_PREFIX}v{self.version}:{sha256}"
+
+    def get(self, sha256: str) -> Optional[dict]:
+        """Get the stored extraction for a PDF hash"""
+        key = self._key(sha256)
+        if self._use_redis():
+            result = self.redis.get(key)
+            if result is not None:
+                return result
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires, result = entry
+            if expires <= time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+        return copy.deepcopy(result)
+
+    def save(self, sha256: str, result: dict):
+        """Store an extraction for a PDF hash"""
+        key = self._key(sha256)
+        if self._use_redis() and self.redis.set(key, result, self.ttl):
+            return
+        with self._lock:
+            self._local.pop(key, None)
+            self._local[key] = (time.monotonic() + self.ttl, copy.deepcopy(result))
+            while len(self._local) > self.max_entries:
+                self._local.popitem(last=False)
+
+
+async def read_upload(
+    file: UploadFile, max_bytes: int = FileConstants.MAX_PDF_SIZE_BYTES
+) -> ReceivedUpload:
+    """Read an upload Starlette has already received and check it is a PDF
+
+    Oversized request bodies are refused by UploadLimitMiddleware while
+    they arrive; the size is checked again here against the file itself.
+    """
+    if file.size is not None and file.size > max_bytes:
+        raise PDFImportError(ResponseMessages.UPLOAD_TOO_LARGE)
+    # Read in a thread once Starlette has rolled the upload over to disk
+    content = await file.read()
+    if len(content) > max_bytes:
+        raise PDFImportError(ResponseMessages.UPLOAD_TOO_LARGE)
+    if b"%PDF-" not in content[:1024]:
+        raise PDFImportError(ResponseMessages.NOT_A_PDF)
+    digest = await asyncio.to_thread(hashlib.sha256, content)
+    return ReceivedUpload(content, digest.hexdigest())
+
+
+async def import_pdf(
+    file: UploadFile, store: Optional[ImportResultStore] = None
+) -> Dict:
+    """Extract resume data from an uploaded PDF in the import worker pool
+
+    A PDF whose bytes were imported before gets the stored extraction
+    without being parsed again. Raises PDFImportError for uploads that are
+    rejected or that a worker could not finish within its time or CPU
+    limits, PoolSaturatedError when the pool is busy and BrokenProcessPool
+    when the import was lost with a worker that died under it.
+    """
+    store = store or import_result_store
+    content, sha256 = await read_upload(file)
+    try:
+        result = await asyncio.to_thread(store.get, sha256)
+        if result is not None:
+            logger.info(f"PDF import of {file.filename} served from cache")
+            return result
+
+        result = await import_pool.run(parse_resume_upload, content)
+        await asyncio.to_thread(store.save, sha256, result)
+        return result
+    except (PoolTimeoutError, PoolCpuLimitError):
+        logger.warning(f"PDF import of {file.filename} hit a worker limit")
+        raise PDFImportError(ResponseMessages.IMPORT_TOO_COMPLEX)
+
+
+# Global import result store
+import_result_store = ImportResultStore(redis_cache)
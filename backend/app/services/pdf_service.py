@@ -1,12 +1,17 @@
 import os
-from jinja2 import Environment, FileSystemLoader
-from weasyprint import HTML
 import logging
+from functools import lru_cache
+from typing import Optional
 
 from app.models import Resume
 from app.services.storage_service import StorageService
-from app.core.cache import cached
-from app.core.constants import CacheConstants
+from app.services.preview_fragments import fragment_renderer
+from app.services.resume_document import DEFAULT_TEMPLATE, ResumeDocument
+from app.services.template_registry import template_registry
+from app.services.upload_service import background_uploader
+from app.core.render_metrics import RenderTrace
+from app.core.render_pool import render_pool
+from app.services.pdf_stylesheets import render_pdf_timed, split_stylesheet
 
 logger = logging.getLogger(__name__)
 
@@ -33,7 +38,14 @@ class PDFService:
     }
 
     def __init__(self):
-        self.storage = StorageService()
+        self._storage: Optional[StorageService] = None
+
+    @property
+    def storage(self) -> StorageService:
+        # Created on first use, so rendering needs no storage configured
+        if self._storage is None:
+            self._storage = StorageService()
+        return self._storage
 
     @staticmethod
     def get_template_path() -> str:
@@ -42,9 +54,9 @@ class PDFService:
         return os.path.join(current_dir, "templates")
 
     @staticmethod
-    @cached(CacheConstants.TEMPLATE_LIST_CACHE_TTL)
+    @lru_cache(maxsize=None)
     def get_available_templates() -> list:
-        """Get list of available templates with categories"""
+        """Get list of available templates with categories (static, built once)"""
         templates = [
             # Technology Templates
             {
@@ -169,20 +181,28 @@ class PDFService:
         ]
         return templates
 
+    @classmethod
+    def canonical_template(cls, template: Optional[str]) -> str:
+        """The template name itself if known, otherwise the default it renders as"""
+        return template if template in cls.TEMPLATES else DEFAULT_TEMPLATE
+
+    @classmethod
+    def _get_template_file(cls, template: str) -> str:
+        """Resolve a template name to its file, falling back to the default"""
+        return cls.TEMPLATES[cls.canonical_template(template)]
+
     def _get_template(self, template: str):
-        """Get template object (not cached due to serialization issues)"""
-        template_file = self.TEMPLATES.get(
-            template, self.TEMPLATES["professional-blue"]
-        )
-        template_path = self.get_template_path()
-        env = Environment(loader=FileSystemLoader(template_path))
-        return env.get_template(template_file)
+        """Get compiled template object from the process-wide registry"""
+        return template_registry.get(self._get_template_file(template))
 
-    def render_resume_html(
-        self, resume: Resume, template: str = "professional-blue"
-    ) -> str:
-        """Render resume HTML from template"""
-        template_obj = self._get_template(template)
+    def get_template_version(self, template: str) -> str:
+        """Get content hash of a template, for cache keys"""
+        return template_registry.version(self._get_template_file(template))
+
+    @staticmethod
+    def _template_context(resume: Resume) -> dict:
+        """Variables passed to resume templates"""
+        resume = ResumeDocument.of(resume)
 
         # Prepare section order (default order if not specified)
         default_order = [
@@ -193,24 +213,80 @@ class PDFService:
             "certifications",
             "projects",
         ]
-        section_order = getattr(resume, "section_order", default_order)
+        section_order = resume.section_order
+        if section_order is None:
+            section_order = default_order
 
         # Add custom sections to the data
-        custom_sections = getattr(resume, "custom_sections", [])
+        custom_sections = resume.custom_sections or ()
+
+        return {
+            "resume": resume,
+            "section_order": section_order,
+            "custom_sections": custom_sections,
+        }
+
+    def render_resume_html(
+        self, resume: Resume, template: str = "professional-blue"
+    ) -> str:
+        """Render resume HTML from template"""
+        template_obj = self._get_template(template)
+        return template_obj.render(**self._template_context(resume))
 
-        return template_obj.render(
-            resume=resume, section_order=section_order, custom_sections=custom_sections
+    def render_resume_preview(
+        self, resume: Resume, template: str = "professional-blue"
+    ) -> str:
+        """Render resume HTML for live preview, re-rendering only changed sections"""
+        return fragment_renderer.render(
+            self._get_template_file(template), self._template_context(resume)
         )
 
+    def _queue_upload(
+        self,
+        resume: Resume,
+        template: str,
+        pdf_bytes: bytes,
+        content_key: Optional[str] = None,
+    ):
+        """Hand the PDF to the background uploader (guest resumes are not stored)"""
+        if not resume.id:
+            return
+        filename = StorageService.generate_pdf_filename(
+            resume.id, self.canonical_template(template), content_key
+        )
+        background_uploader.enqueue(pdf_bytes, filename)
+
     def generate_resume_pdf(
-        self, resume: Resume, template: str = "professional-blue"
+        self,
+        resume: Resume,
+        template: str = "professional-blue",
+        content_key: Optional[str] = None,
     ) -> bytes:
         """Generate PDF from resume"""
-        html_content = self.render_resume_html(resume, template)
-        pdf_bytes = HTML(string=html_content).write_pdf()
-
-        # Upload to storage
-        filename = self.storage.generate_pdf_filename(resume.id, template)
-        self.storage.upload_pdf(pdf_bytes, filename)
+        trace = RenderTrace("pdf", template, resume)
+        with trace.stage("template"):
+            parts = split_stylesheet(self.render_resume_html(resume, template))
+        pdf_bytes, stages = render_pdf_timed(*parts)
+        for name, seconds in stages.items():
+            trace.add(name, seconds)
+        self._queue_upload(resume, template, pdf_bytes, content_key)
+        trace.finish(pdf_bytes)
+        return pdf_bytes
 
+    async def generate_resume_pdf_async(
+        self,
+        resume: Resume,
+        template: str = "professional-blue",
+        content_key: Optional[str] = None,
+    ) -> bytes:
+        """Generate PDF in the render pool without blocking the event loop"""
+        trace = RenderTrace("pdf", template, resume)
+        with trace.stage("template"):
+            parts = split_stylesheet(self.render_resume_html(resume, template))
+        with trace.stage("pool"):
+            pdf_bytes, stages = await render_pool.run(render_pdf_timed, *parts)
+        for name, seconds in stages.items():
+            trace.add(name, seconds)
+        self._queue_upload(resume, template, pdf_bytes, content_key)
+        trace.finish(pdf_bytes)
         return pdf_bytes
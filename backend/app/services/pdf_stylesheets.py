@@ -0,0 +1,92 @@
+"""Pre-parsed template stylesheets and shared font configuration for WeasyPrint"""
+
+import hashlib
+import re
+import threading
+import time
+from typing import Dict, Tuple
+
+from app.core.constants import RenderConfig
+from app.core.fonts import get_font_config
+
+STYLE_BLOCK = re.compile(r"<style>(.*?)</style>", re.DOTALL)
+# Every template opens its stylesheet with the customization custom properties
+ROOT_BLOCK = re.compile(r":root\s*\{.*?\n\s*\}", re.DOTALL)
+
+_stylesheets: Dict[str, object] = {}
+_lock = threading.Lock()
+
+
+def split_stylesheet(html_content: str) -> Tuple[str, str, str]:
+    """Split rendered HTML into (markup, static CSS, customization CSS)
+
+    The static CSS is identical for every resume using the same template,
+    so it can be parsed once and reused. Only the small `:root` block
+    carrying `resume.customization` changes between renders.
+    """
+    match = STYLE_BLOCK.search(html_content)
+    if not match:
+        return html_content, "", ""
+
+    css = match.group(1)
+    root = ROOT_BLOCK.search(css)
+    if root:
+        override_css = root.group(0)
+        static_css = css[: root.start()] + css[root.end() :]
+    else:
+        override_css, static_css = "", css
+
+    markup = html_content[: match.start()] + html_content[match.end() :]
+    return markup, static_css, override_css
+
+
+def get_stylesheet(css: str):
+    """Get a parsed CSS object, parsing each distinct stylesheet only once"""
+    from weasyprint import CSS
+
+    key = hashlib.sha256(css.encode("utf-8")).hexdigest()
+    stylesheet = _stylesheets.get(key)
+    if stylesheet is None:
+        stylesheet = CSS(string=css, font_config=get_font_config())
+        with _lock:
+            # Template edits leave stale entries behind; start over when full
+            if len(_stylesheets) >= RenderConfig.MAX_PARSED_STYLESHEETS:
+                _stylesheets.clear()
+            _stylesheets[key] = stylesheet
+    return stylesheet
+
+
+def render_pdf_timed(
+    markup: str, static_css: str, override_css: str
+) -> Tuple[bytes, Dict[str, float]]:
+    """Render PDF bytes and report layout and serialization time
+
+    Runs in a pool worker, whose own metrics are never scraped, so the
+    timings travel back with the result.
+    """
+    from weasyprint import CSS, HTML
+
+    start = time.perf_counter()
+    font_config = get_font_config()
+    stylesheets = [get_stylesheet(static_css)]
+    if override_css:
+        # Keep the customization block ahead of the static rules, as in the template
+        stylesheets.insert(0, CSS(string=override_css, font_config=font_config))
+
+    # Embed only the glyphs each document uses to keep bundled fonts small
+    options = {"stylesheets": stylesheets, "full_fonts": False, "hinting": False}
+    document = HTML(string=markup).render(font_config=font_config, **options)
+    laid_out = time.perf_counter()
+    pdf_bytes = document.write_pdf(**options)
+
+    return pdf_bytes, {
+        "layout": laid_out - start,
+        "serialize": time.perf_counter() - laid_out,
+    }
+
+
+def render_pdf_with_stylesheets(
+    markup: str, static_css: str, override_css: str
+) -> bytes:
+    """Render PDF bytes using a cached template stylesheet (runs in a pool worker)"""
+    return render_pdf_timed(markup, static_css, override_css)[0]
@@ -0,0 +1,117 @@
+"""Speculative PDF renders after edits, so the next download is a cache hit"""
+
+import asyncio
+import logging
+from typing import Dict, Optional
+
+from prometheus_client import Counter
+
+from app.core.constants import PrerenderConfig
+from app.core.render_pool import ProcessWorkerPool, render_pool
+from app.services.export_job_service import ExportJobService
+from app.services.export_service import ExportService
+
+logger = logging.getLogger(__name__)
+
+prerenders_total = Counter(
+    "resumade_prerenders_total", "Speculative render outcomes", ["result"]
+)
+
+
+class SpeculativeRenderer:
+    """Debounced background renders of a resume's current template
+
+    Edits are coalesced per user: every schedule() restarts that user's timer,
+    so a burst of autosaves renders once after the last one. Speculative work
+    is capped and only runs while the render pool keeps spare slots for
+    interactive exports.
+    """
+
+    def __init__(
+        self,
+        pool: ProcessWorkerPool = render_pool,
+        debounce_seconds: float = PrerenderConfig.DEBOUNCE_SECONDS,
+        max_concurrent: int = PrerenderConfig.MAX_CONCURRENT,
+        max_pending: int = PrerenderConfig.MAX_PENDING,
+        reserved_slots: int = PrerenderConfig.RESERVED_POOL_SLOTS,
+    ):
+        self.pool = pool
+        self.debounce_seconds = debounce_seconds
+        self.max_concurrent = max_concurrent
+        self.max_pending = max_pending
+        self.reserved_slots = reserved_slots
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: Dict[str, asyncio.Task] = {}
+        self._running = 0
+
+    def start(self, loop: Optional[asyncio.AbstractEventLoop] = None):
+        """Bind to the event loop that will run renders (call at startup)"""
+        self._loop = loop or asyncio.get_running_loop()
+
+    @property
+    def pending(self) -> int:
+        """Number of users with a render waiting for their edits to settle"""
+        return len(self._pending)
+
+    def schedule(self, resume, user_id: Optional[int] = None) -> bool:
+        """Schedule a render of the resume's template; safe from any thread
+
+        Returns:
+            bool: False if speculative rendering is not running
+        """
+        if self._loop is None or self._loop.is_closed() or not resume.id:
+            return False
+
+        coalesce_key = f"user:{user_id}" if user_id else f"resume:{resume.id}"
+        snapshot = ExportJobService.snapshot(resume)
+        template = resume.template
+        self._loop.call_soon_threadsafe(
+            self._reschedule, coalesce_key, snapshot, template
+        )
+        return True
+
+    def _reschedule(self, coalesce_key: str, snapshot, template: str):
+        """Replace any render pending for this key with a fresh timer"""
+        previous = self._pending.pop(coalesce_key, None)
+        if previous is not None:
+            previous.cancel()
+            prerenders_total.labels(result="coalesced").inc()
+        elif len(self._pending) >= self.max_pending:
+            prerenders_total.labels(result="dropped").inc()
+            return
+
+        self._pending[coalesce_key] = asyncio.ensure_future(
+            self._render_later(coalesce_key, snapshot, template)
+        )
+
+    async def _render_later(self, coalesce_key: str, snapshot, template: str):
+        await asyncio.sleep(self.debounce_seconds)
+        self._pending.pop(coalesce_key, None)
+
+        if self._running >= self.max_concurrent or not self.pool.has_capacity(
+            self.reserved_slots
+        ):
+            prerenders_total.labels(result="skipped").inc()
+            return
+
+        self._running += 1
+        try:
+            await ExportService().export(snapshot, "pdf", template)
+            prerenders_total.labels(result="rendered").inc()
+        except Exception as e:
+            prerenders_total.labels(result="failed").inc()
+            logger.warning(f"Speculative render of resume {snapshot.id} failed: {e}")
+        finally:
+            self._running -= 1
+
+    def shutdown(self):
+        """Cancel renders that have not started"""
+        for task in self._pending.values():
+            task.cancel()
+        self._pending.clear()
+        self._loop = None
+
+
+# Global speculative renderer
+speculative_renderer = SpeculativeRenderer()
@@ -0,0 +1,160 @@
+"""Live preview pages assembled from per-section fragments cached by their inputs"""
+
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from jinja2 import nodes
+from prometheus_client import Counter
+
+from app.core.constants import PreviewConfig
+from app.services.template_registry import TemplateRegistry, template_registry
+
+fragments_total = Counter(
+    "resumade_preview_fragments_total", "Preview section fragment lookups", ["result"]
+)
+
+# Block name -> resume attributes it reads (None: the whole resume) and the
+# other template variables it reads
+BlockInputs = Tuple[Optional[Tuple[str, ...]], Tuple[str, ...]]
+
+
+def _block_inputs(block: nodes.Block, variables: Tuple[str, ...]) -> BlockInputs:
+    """Find which template inputs a section block reads"""
+    attributes = set()
+    attribute_reads = 0
+    for node in block.find_all((nodes.Getattr, nodes.Getitem)):
+        if isinstance(node.node, nodes.Name) and node.node.name == "resume":
+            if isinstance(node, nodes.Getattr):
+                attributes.add(node.attr)
+            elif isinstance(node.arg, nodes.Const):
+                attributes.add(str(node.arg.value))
+            else:
+                continue
+            attribute_reads += 1
+
+    names = {node.name for node in block.find_all(nodes.Name)}
+    resume_reads = sum(
+        1 for node in block.find_all(nodes.Name) if node.name == "resume"
+    )
+    # `resume` used other than through a fixed attribute: depend on all of it
+    resume_attributes = (
+        tuple(sorted(attributes)) if resume_reads == attribute_reads else None
+    )
+    others = tuple(sorted(name for name in names & set(variables) if name != "resume"))
+    return resume_attributes, others
+
+
+class FragmentRenderer:
+    """Render templates section by section, re-rendering only changed sections
+
+    Resume templates wrap each section in a ``{% block %}``. A section's
+    fragment is cached under the template version and the inputs the block
+    reads, and the page is assembled by substituting cached fragments for
+    the blocks.
+    """
+
+    def __init__(
+        self,
+        registry: TemplateRegistry = template_registry,
+        max_fragments: int = PreviewConfig.MAX_FRAGMENTS,
+    ):
+        self.registry = registry
+        self.max_fragments = max_fragments
+        self._inputs: Dict[Tuple[str, str], Dict[str, BlockInputs]] = {}
+        self._fragments: OrderedDict[str, str] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _template_inputs(
+        self, template_file: str, version: str, variables: Tuple[str, ...]
+    ) -> Dict[str, BlockInputs]:
+        """Analyze a template's section blocks once per template version"""
+        cached = self._inputs.get((template_file, version))
+        if cached is not None:
+            return cached
+
+        env = self.registry.env
+        source = env.loader.get_source(env, template_file)[0]
+        inputs = {
+            block.name: _block_inputs(block, variables)
+            for block in env.parse(source).find_all(nodes.Block)
+        }
+        self._inputs[(template_file, version)] = inputs
+        return inputs
+
+    @staticmethod
+    def _fragment_key(
+        template_file: str, version: str, block: str, inputs: BlockInputs, context: dict
+    ) -> str:
+        resume = context["resume"]
+        attributes, others = inputs
+        if attributes is None:
+            resume_inputs = [resume.id, resume.content_hash]
+        else:
+            resume_inputs = {name: getattr(resume, name, None) for name in attributes}
+        payload = {
+            "template": [template_file, version, block],
+            "resume": resume_inputs,
+            "variables": {name: context.get(name) for name in others},
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._lock:
+            fragment = self._fragments.get(key)
+            if fragment is not None:
+                self._fragments.move_to_end(key)
+            return fragment
+
+    def _set(self, key: str, fragment: str):
+        with self._lock:
+            self._fragments[key] = fragment
+            while len(self._fragments) > self.max_fragments:
+                self._fragments.popitem(last=False)
+
+    def fragments(self, template_file: str, context: dict) -> Dict[str, str]:
+        """Render every section block, reusing cached fragments"""
+        template = self.registry.get(template_file)
+        version = self.registry.version(template_file)
+        inputs = self._template_inputs(template_file, version, tuple(context))
+
+        fragments = {}
+        for block, block_inputs in inputs.items():
+            key = self._fragment_key(
+                template_file, version, block, block_inputs, context
+            )
+            fragment = self._get(key)
+            if fragment is None:
+                fragments_total.labels(result="miss").inc()
+                render_block = template.blocks[block]
+                fragment = template.environment.concat(
+                    render_block(template.new_context(context))
+                )
+                self._set(key, fragment)
+            else:
+                fragments_total.labels(result="hit").inc()
+            fragments[block] = fragment
+        return fragments
+
+    def assemble(
+        self, template_file: str, context: dict, fragments: Dict[str, str]
+    ) -> str:
+        """Render the page around the blocks, substituting the given fragments"""
+        template = self.registry.get(template_file)
+        page = template.new_context(context)
+        for block, fragment in fragments.items():
+            page.blocks[block] = [lambda _context, fragment=fragment: iter((fragment,))]
+        return template.environment.concat(template.root_render_func(page))
+
+    def render(self, template_file: str, context: dict) -> str:
+        """Render a template, reusing cached section fragments"""
+        return self.assemble(
+            template_file, context, self.fragments(template_file, context)
+        )
+
+
+# Global preview fragment renderer
+fragment_renderer = FragmentRenderer()
@@ -0,0 +1,136 @@
+"""Per-connection live preview state that answers edits with changed fragments"""
+
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from app.core.constants import PreviewConfig
+from app.services.pdf_service import PDFService
+from app.services.preview_fragments import FragmentRenderer, fragment_renderer
+from app.services.resume_document import ResumeDocument
+
+# Fragments in the pushed document are delimited so the client can swap them
+FRAGMENT_START = "<!--fragment:{}-->"
+FRAGMENT_END = "<!--/fragment:{}-->"
+
+
+def preview_resume(resume_data: dict) -> ResumeDocument:
+    """Convert editor resume JSON to the document templates render"""
+    return ResumeDocument.of(resume_data)
+
+
+def merge_patch(target, patch):
+    """Apply a JSON Merge Patch (RFC 7396): objects merge, null deletes"""
+    if not isinstance(patch, dict):
+        return copy.deepcopy(patch)
+    result = dict(target) if isinstance(target, dict) else {}
+    for key, value in patch.items():
+        if value is None:
+            result.pop(key, None)
+        else:
+            result[key] = merge_patch(result.get(key), value)
+    return result
+
+
+class PreviewSession:
+    """Resume state of one live preview connection
+
+    The first render sends the whole document with every section fragment
+    delimited by comments. After that, only fragments whose HTML changed are
+    sent, unless something outside the fragments changed (template, contact
+    block, customization), in which case the document is sent again.
+    """
+
+    def __init__(self, renderer: FragmentRenderer = fragment_renderer):
+        self.renderer = renderer
+        self.resume_data: dict = {}
+        self.version = 0
+        self._fragments: Dict[str, str] = {}
+        self._skeleton: Optional[str] = None
+
+    def reset(self, resume_data: dict):
+        """Replace the whole resume; raises ValueError unless it is an object"""
+        if not isinstance(resume_data, dict):
+            raise ValueError("Resume must be a JSON object")
+        self.resume_data = dict(resume_data)
+
+    def apply(self, patch: dict):
+        """Apply an editor change as a JSON merge patch
+
+        Only object patches are accepted: any other JSON value would replace
+        the whole resume. Raises ValueError otherwise.
+        """
+        if not isinstance(patch, dict):
+            raise ValueError("Patch must be a JSON object")
+        self.resume_data = merge_patch(self.resume_data, patch)
+
+    def render(self) -> Optional[dict]:
+        """Render the current state and describe what changed since last time
+
+        Returns:
+            dict: A "document" or "fragments" message, None if nothing changed
+        """
+        resume = preview_resume(self.resume_data)
+        template_file = PDFService._get_template_file(resume.template)
+        context = PDFService._template_context(resume)
+
+        fragments = self.renderer.fragments(template_file, context)
+        skeleton = self.renderer.assemble(
+            template_file, context, {block: "" for block in fragments}
+        )
+
+        if skeleton != self._skeleton:
+            message = {
+                "type": "document",
+                "html": self.renderer.assemble(
+                    template_file,
+                    context,
+                    {
+                        block: FRAGMENT_START.format(block)
+                        + html
+                        + FRAGMENT_END.format(block)
+                        for block, html in fragments.items()
+                    },
+                ),
+            }
+        else:
+            changed = {
+                block: html
+                for block, html in fragments.items()
+                if self._fragments.get(block) != html
+            }
+            if not changed:
+                return None
+            message = {"type": "fragments", "fragments": changed}
+
+        self._skeleton = skeleton
+        self._fragments = fragments
+        self.version += 1
+        message["version"] = self.version
+        return message
+
+
+class SessionLimiter:
+    """Cap on concurrent live preview connections in this worker"""
+
+    def __init__(self, limit: int = PreviewConfig.MAX_SESSIONS):
+        self.limit = limit
+        self.active = 0
+
+    def acquire(self) -> bool:
+        if self.active >= self.limit:
+            return False
+        self.active += 1
+        return True
+
+    def release(self):
+        self.active = max(0, self.active - 1)
+
+
+# Live preview connections of this worker
+preview_sessions = SessionLimiter()
+
+# Live preview renders of this worker, kept off the default executor
+preview_executor = ThreadPoolExecutor(
+    max_workers=PreviewConfig.RENDER_THREADS, thread_name_prefix="preview-render"
+)
@@ -0,0 +1,95 @@
+"""Date and date-range recognition for imported resumes"""
+
+import re
+from datetime import date, datetime, time
+from functools import lru_cache
+from typing import Optional, Tuple
+
+from dateutil import parser as date_parser
+
+from app.core.constants import ImportConfig
+
+# Month names and abbreviations, as dateutil spells them
+MONTHS = {
+    name.lower(): number
+    for number, names in enumerate(date_parser.parserinfo.MONTHS, 1)
+    for name in names
+}
+YEAR = re.compile(r"\b(19|20)\d{2}\b")
+# The layouts resumes use; anything else goes to dateutil
+MONTH_YEAR = re.compile(r"([a-z]+)\.?,?\s+((?:19|20)\d{2})", re.IGNORECASE)
+YEAR_MONTH = re.compile(r"((?:19|20)\d{2})\s+([a-z]+)", re.IGNORECASE)
+NUMERIC_MONTH_YEAR = re.compile(r"(\d{1,2})/((?:19|20)\d{2})")
+BARE_YEAR = re.compile(r"(?:19|20)\d{2}")
+# A dash or the word "to"; a character class would also split on "t" and "o"
+RANGE_SEPARATOR = re.compile(r"\s*(?:[-–—]|\bto\b)\s*", re.IGNORECASE)
+
+
+def _recognize(text: str, today: date) -> Optional[date]:
+    """Match the common layouts exactly as dateutil would read them"""
+    match = MONTH_YEAR.fullmatch(text)
+    if match and match.group(1).lower() in MONTHS:
+        return date(int(match.group(2)), MONTHS[match.group(1).lower()], 1)
+
+    match = YEAR_MONTH.fullmatch(text)
+    if match and match.group(2).lower() in MONTHS:
+        return date(int(match.group(1)), MONTHS[match.group(2).lower()], 1)
+
+    match = NUMERIC_MONTH_YEAR.fullmatch(text)
+    if match and 1 <= int(match.group(1)) <= 12:
+        return date(int(match.group(2)), int(match.group(1)), 1)
+
+    # dateutil takes the missing month from today
+    if BARE_YEAR.fullmatch(text):
+        return date(int(text), today.month, 1)
+    return None
+
+
+@lru_cache(maxsize=ImportConfig.DATE_CACHE_SIZE)
+def _parse_date(text: str, today: date) -> Optional[date]:
+    # Keyed on today because dateutil fills missing fields from it
+    recognized = _recognize(text, today)
+    if recognized is not None:
+        return recognized
+    try:
+        parsed = date_parser.parse(
+            text, fuzzy=True, default=datetime.combine(today, time())
+        )
+    except Exception:
+        return None
+    return parsed.date().replace(day=1)
+
+
+def parse_date(text: str) -> Optional[date]:
+    """Year and month of the date in free text (day set to 1), or None"""
+    return _parse_date(text.strip(), date.today())
+
+
+def date_text(text: str, fmt: str = "%Y-%m") -> str:
+    """Format the date in text, falling back to a bare year, or "" if none"""
+    parsed = parse_date(text)
+    if parsed is not None:
+        return parsed.strftime(fmt)
+    year_match = YEAR.search(text)
+    return year_match.group() if year_match else ""
+
+
+def parse_date_range(text: str) -> Tuple[str, str, bool]:
+    """Parse date range from text like 'Jan 2020 - Present' or '2020-2022'"""
+    text = text.strip()
+    text_lower = text.lower()
+    is_current = (
+        "present" in text_lower or "current" in text_lower or "now" in text_lower
+    )
+
+    # Split by common separators
+    parts = RANGE_SEPARATOR.split(text, maxsplit=1)
+
+    start_date = date_text(parts[0])
+    end_date = ""
+    if len(parts) > 1:
+        end_date = "Present" if is_current else date_text(parts[1])
+    elif is_current:
+        end_date = "Present"
+
+    return start_date, end_date, is_current
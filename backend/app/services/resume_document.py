@@ -0,0 +1,139 @@
+"""Compact, immutable resume representation shared by renderers and scorers"""
+
+from collections.abc import Mapping
+from typing import Any
+
+from app.core.artifact_cache import artifact_key
+
+# Attributes that affect rendered output and scores
+CONTENT_FIELDS = (
+    "title",
+    "personal_info",
+    "experience",
+    "education",
+    "skills",
+    "certifications",
+    "projects",
+    "customization",
+    "section_names",
+    "section_order",
+    "custom_sections",
+)
+SECTIONS = ("experience", "education", "skills", "certifications", "projects")
+# Absent or null fields of these kinds become empty tuples and records
+LIST_FIELDS = SECTIONS + ("custom_sections",)
+MAPPING_FIELDS = ("personal_info", "customization", "section_names")
+DEFAULT_TEMPLATE = "professional-blue"
+
+
+class Record(dict):
+    """Read-only resume entry
+
+    Still a dict, so templates, JSON encoding and ``.get`` lookups treat it
+    as the plain data it was built from.
+    """
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError("Resume records are read-only")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return Record, (dict(self),)
+
+
+def freeze(value: Any) -> Any:
+    """Convert nested dicts and lists to records and tuples"""
+    if isinstance(value, Mapping):
+        return Record((key, freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def _text_values(value: Any):
+    """Every string and number in a nested value, in order"""
+    if isinstance(value, Mapping):
+        for item in value.values():
+            yield from _text_values(item)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _text_values(item)
+    elif value is not None and not isinstance(value, bool):
+        yield str(value)
+
+
+class ResumeDocument:
+    """One resume's content, normalized once per request
+
+    Built from an ORM ``Resume``, an editor/API dict or any object with the
+    resume attributes. Sections are tuples of read-only records, and the
+    content hash is computed up front so every cache keys on the same value.
+    """
+
+    __slots__ = (
+        "id",
+        "template",
+        *CONTENT_FIELDS,
+        "content_hash",
+        "_text",
+    )
+
+    def __init__(self, id: int = 0, template: str = DEFAULT_TEMPLATE, **content):
+        set_field = object.__setattr__
+        set_field(self, "id", id or 0)
+        set_field(self, "template", template or DEFAULT_TEMPLATE)
+        for field in CONTENT_FIELDS:
+            value = freeze(content.get(field))
+            if value is None and field in LIST_FIELDS:
+                value = ()
+            elif value is None and field in MAPPING_FIELDS:
+                value = Record()
+            set_field(self, field, value)
+        set_field(self, "content_hash", artifact_key(self.content()))
+        set_field(self, "_text", None)
+
+    @classmethod
+    def of(cls, source: Any) -> "ResumeDocument":
+        """Build a document from a resume-like source (documents pass through)"""
+        if isinstance(source, cls):
+            return source
+        if isinstance(source, Mapping):
+            return cls(
+                id=source.get("id"),
+                template=source.get("template_name") or source.get("template"),
+                **{field: source.get(field) for field in CONTENT_FIELDS},
+            )
+        return cls(
+            id=getattr(source, "id", 0),
+            template=getattr(source, "template", None),
+            **{field: getattr(source, field, None) for field in CONTENT_FIELDS},
+        )
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ResumeDocument is immutable")
+
+    def __repr__(self) -> str:
+        # Stable and short, so function-argument cache keys stay small
+        return f"ResumeDocument({self.content_hash})"
+
+    def content(self) -> dict:
+        """The content fields as a dict"""
+        return {field: getattr(self, field) for field in CONTENT_FIELDS}
+
+    @property
+    def text(self) -> str:
+        """All resume values as normalized text, for keyword matching"""
+        if self._text is None:
+            # Imported here: the ATS package imports this module
+            from app.services.ats.keywords import normalize_text
+
+            object.__setattr__(
+                self,
+                "_text",
+                normalize_text(" ".join(_text_values(self.content()))),
+            )
+        return self._text
@@ -0,0 +1,123 @@
+"""Single-pass line tagging for imported resume text"""
+
+import re
+from functools import cached_property
+from typing import List, Optional
+
+# Header keywords per section, in the order they are tried
+SECTION_KEYWORDS = {
+    "experience": ["experience", "work", "employment", "professional"],
+    "education": ["education", "academic", "university", "college"],
+    "skills": ["skills", "technical", "competencies", "technologies"],
+    "projects": ["projects", "portfolio", "personal projects"],
+    "certifications": [
+        "certifications",
+        "certificates",
+        "licenses",
+        "credentials",
+    ],
+}
+SECTION_PATTERNS = [
+    (section, re.compile("|".join(re.escape(keyword) for keyword in keywords)))
+    for section, keywords in SECTION_KEYWORDS.items()
+]
+ANY_SECTION_KEYWORD = re.compile(
+    "|".join(
+        re.escape(keyword)
+        for keywords in SECTION_KEYWORDS.values()
+        for keyword in keywords
+    )
+)
+DEGREE_KEYWORDS = [
+    "bachelor",
+    "master",
+    "phd",
+    "b.s.",
+    "m.s.",
+    "b.a.",
+    "m.a.",
+    "degree",
+]
+DEGREE = re.compile("|".join(re.escape(keyword) for keyword in DEGREE_KEYWORDS))
+MAX_HEADER_WORDS = 4
+
+YEAR = re.compile(r"\b(19|20)\d{2}\b")
+THREE_DIGITS = re.compile(r"\d{3}")
+FOUR_DIGITS = re.compile(r"\d{4}")
+# Separators that mark a line as a date range. Only "to" ignores case, as the
+# date parser does; a capitalized "Current" more often starts a sentence.
+RANGE_SEPARATOR = re.compile(r"[-–—]|(?i:\bto\b)|present|current")
+SHORT_RANGE_SEPARATOR = re.compile(r"[-–]|(?i:\bto\b)")
+URL = re.compile(r"https?://[^\s]+")
+EMAIL = re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b")
+
+
+def _header_section(lower: str) -> Optional[str]:
+    # Most lines mention no keyword at all; rule those out with one search
+    if not ANY_SECTION_KEYWORD.search(lower):
+        return None
+    for section, pattern in SECTION_PATTERNS:
+        if pattern.search(lower):
+            return section
+    return None
+
+
+class Line:
+    """One non-empty line of resume text, tagged with what the extractors read
+
+    The word count and header section are found when the line is tagged,
+    since every line needs them. The other features only matter to the
+    section a line belongs to, so each is computed the first time it is read
+    and then kept.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.words = len(text.split())
+        self.section = (
+            _header_section(text.lower()) if self.words <= MAX_HEADER_WORDS else None
+        )
+
+    def __repr__(self) -> str:
+        return f"Line({self.text!r})"
+
+    @cached_property
+    def has_year(self) -> bool:
+        return YEAR.search(self.text) is not None
+
+    @cached_property
+    def has_three_digits(self) -> bool:
+        return THREE_DIGITS.search(self.text) is not None
+
+    @cached_property
+    def has_four_digits(self) -> bool:
+        return FOUR_DIGITS.search(self.text) is not None
+
+    @cached_property
+    def has_range_separator(self) -> bool:
+        """A dash, the word "to", "present" or "current" appear in the line"""
+        return RANGE_SEPARATOR.search(self.text) is not None
+
+    @cached_property
+    def has_short_range_separator(self) -> bool:
+        """-, – or the word "to" appear in the line"""
+        return SHORT_RANGE_SEPARATOR.search(self.text) is not None
+
+    @cached_property
+    def is_degree(self) -> bool:
+        return DEGREE.search(self.text.lower()) is not None
+
+    @cached_property
+    def url(self) -> str:
+        match = URL.search(self.text)
+        return match.group() if match else ""
+
+    @cached_property
+    def email(self) -> str:
+        match = EMAIL.search(self.text) if "@" in self.text else None
+        return match.group() if match else ""
+
+
+def tag_lines(text: str) -> List[Line]:
+    """Tag every non-empty line of extracted text, in order"""
+    return [Line(line) for line in map(str.strip, text.split("\n")) if line]
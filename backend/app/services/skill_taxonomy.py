@@ -0,0 +1,294 @@
+"""Skill vocabulary and the matcher compiled from it for the PDF importer"""
+
+import re
+from typing import Iterable, List, Mapping
+
+# Common technical skills database for validation
+KNOWN_SKILLS = {
+    # Programming Languages
+    "python",
+    "javascript",
+    "java",
+    "c++",
+    "c#",
+    "ruby",
+    "php",
+    "swift",
+    "kotlin",
+    "go",
+    "rust",
+    "typescript",
+    "scala",
+    "r",
+    "matlab",
+    "perl",
+    "shell",
+    "bash",
+    "powershell",
+    # Web Technologies
+    "html",
+    "css",
+    "react",
+    "angular",
+    "vue",
+    "node.js",
+    "express",
+    "django",
+    "flask",
+    "fastapi",
+    "spring",
+    "asp.net",
+    "jquery",
+    "bootstrap",
+    "tailwind",
+    "sass",
+    "webpack",
+    "next.js",
+    "nuxt",
+    # Databases
+    "sql",
+    "mysql",
+    "postgresql",
+    "mongodb",
+    "redis",
+    "oracle",
+    "sqlite",
+    "cassandra",
+    "dynamodb",
+    "elasticsearch",
+    "firebase",
+    "mariadb",
+    "neo4j",
+    "couchdb",
+    # Cloud & DevOps
+    "aws",
+    "azure",
+    "gcp",
+    "docker",
+    "kubernetes",
+    "jenkins",
+    "gitlab",
+    "github",
+    "terraform",
+    "ansible",
+    "chef",
+    "puppet",
+    "circleci",
+    "travis",
+    "heroku",
+    "netlify",
+    "vercel",
+    # Data Science & ML
+    "tensorflow",
+    "pytorch",
+    "keras",
+    "scikit-learn",
+    "pandas",
+    "numpy",
+    "matplotlib",
+    "seaborn",
+    "jupyter",
+    "spark",
+    "hadoop",
+    "tableau",
+    "power bi",
+    "excel",
+    "spss",
+    "sas",
+    # Mobile
+    "ios",
+    "android",
+    "react native",
+    "flutter",
+    "xamarin",
+    "ionic",
+    "cordova",
+    # Tools & Others
+    "git",
+    "jira",
+    "confluence",
+    "slack",
+    "trello",
+    "asana",
+    "figma",
+    "sketch",
+    "photoshop",
+    "illustrator",
+    "xd",
+    "linux",
+    "unix",
+    "windows",
+    "macos",
+    "agile",
+    "scrum",
+    "kanban",
+    "rest",
+    "graphql",
+    "soap",
+    "api",
+    "microservices",
+    "ci/cd",
+    "tdd",
+    "bdd",
+    # Soft Skills (common ones)
+    "leadership",
+    "communication",
+    "teamwork",
+    "problem solving",
+    "critical thinking",
+    "project management",
+    "time management",
+    "analytical",
+    "creative",
+}
+
+# Common noise words to filter out
+NOISE_WORDS = {
+    "and",
+    "or",
+    "with",
+    "the",
+    "a",
+    "an",
+    "in",
+    "on",
+    "at",
+    "to",
+    "for",
+    "of",
+    "by",
+    "from",
+    "as",
+    "is",
+    "was",
+    "are",
+    "were",
+    "be",
+    "been",
+    "being",
+    "have",
+    "has",
+    "had",
+    "do",
+    "does",
+    "did",
+    "will",
+    "would",
+    "should",
+    "could",
+    "may",
+    "might",
+    "must",
+    "can",
+    "etc",
+    "including",
+    "such",
+    "like",
+    "using",
+    "used",
+}
+# Common alternative spellings and the skill name they are imported as
+SKILL_SYNONYMS = {
+    "js": "JavaScript",
+    "ts": "TypeScript",
+    "golang": "Go",
+    "k8s": "Kubernetes",
+    "postgres": "PostgreSQL",
+    "nodejs": "Node.js",
+    "reactjs": "React",
+    "vuejs": "Vue",
+    "nextjs": "Next.js",
+    "sklearn": "scikit-learn",
+    "gcloud": "GCP",
+    "mongo": "MongoDB",
+}
+
+# Characters that can separate items in a skills section
+SKILL_SEPARATORS = re.compile(r"[,;•·\n\t|]")
+# Anything but letters, digits and " .+#/-" counts as a special character
+SPECIAL_CHARS = re.compile(r"[^\w .+#/-]|_")
+# Version numbers and the punctuation of names like Node.js, C++ and C#
+TECH_MARKERS = re.compile(r"[\d.+#]")
+
+
+class SkillMatcher:
+    """Skill vocabulary compiled once into set and scan indexes
+
+    Exact and synonym lookups are set and dict lookups, and a synonym is
+    returned as the skill it stands for. Whether an item is part of a
+    known skill is a lookup in the set of every substring of the vocabulary,
+    and whether it contains one is a single scan with one compiled regex of
+    all skills, so no check loops over the vocabulary per item.
+    """
+
+    def __init__(
+        self,
+        skills: Iterable[str],
+        synonyms: Mapping[str, str],
+        noise_words: Iterable[str],
+    ):
+        skills = frozenset(skills)
+        self.synonyms = dict(synonyms)
+        self.exact = skills | frozenset(synonyms)
+        self.fragments = frozenset(
+            skill[start:end]
+            for skill in skills
+            for start in range(len(skill))
+            for end in range(start + 1, len(skill) + 1)
+        )
+        self.contains = re.compile("|".join(re.escape(skill) for skill in skills))
+        self.noise_words = frozenset(noise_words)
+
+    def classify(self, text: str) -> List[str]:
+        """Valid, de-duplicated skill items of a skills section, in order
+
+        One loop over the section's items, with the lookups bound once
+        rather than per item.
+        """
+        exact, fragments, noise_words = self.exact, self.fragments, self.noise_words
+        canonical = self.synonyms.get
+        contains = self.contains.search
+        has_special, find_special = SPECIAL_CHARS.search, SPECIAL_CHARS.findall
+        has_tech_marker = TECH_MARKERS.search
+
+        skills = []
+        seen = set()  # Lowercased, for duplicate detection
+        for item in SKILL_SEPARATORS.split(text):
+            item = item.strip()
+            if not item:
+                continue
+            item_lower = item.lower()
+            # "k8s" is kept as "Kubernetes", and then deduplicated as such
+            synonym_of = canonical(item_lower)
+            if synonym_of is not None:
+                item, item_lower = synonym_of, synonym_of.lower()
+            if item_lower in seen:
+                continue
+
+            # Filter out noise words and very short or very long strings
+            if item_lower in noise_words or not 2 <= len(item) <= 50:
+                continue
+
+            # Filter out strings with too many special characters
+            if has_special(item) and len(find_special(item)) > 2:
+                continue
+
+            if not (
+                # Known skills, synonyms, and partial matches ("Node.js", "Java 17")
+                item_lower in exact
+                or item_lower in fragments
+                or contains(item_lower)
+                # Looks like a technology (version numbers, dots, etc.)
+                or has_tech_marker(item)
+                # Capitalized and reasonable length (likely a proper noun)
+                or (item[0].isupper() and 3 <= len(item) <= 30)
+            ):
+                continue
+
+            seen.add(item_lower)
+            skills.append(item)
+        return skills
+
+
+# Global skill matcher
+skill_matcher = SkillMatcher(KNOWN_SKILLS, SKILL_SYNONYMS, NOISE_WORDS)
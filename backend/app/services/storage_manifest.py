@@ -0,0 +1,181 @@
+"""Index of stored objects, so existence checks never list the bucket"""
+
+import json
+import logging
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+from app.core.cache import RedisCache, redis_cache
+from app.core.constants import StorageConfig
+
+logger = logging.getLogger(__name__)
+
+
+def _recorded_before(entry: dict, cutoff: datetime) -> bool:
+    """Whether an entry was recorded before cutoff (naive UTC)
+
+    Entries without a readable timestamp count as old.
+    """
+    try:
+        recorded = datetime.fromisoformat(entry["created_at"].replace("Z", "+00:00"))
+    except (KeyError, AttributeError, ValueError):
+        return True
+    if recorded.tzinfo is not None:
+        recorded = recorded.astimezone(timezone.utc).replace(tzinfo=None)
+    return recorded < cutoff
+
+
+class StorageManifest:
+    """Redis hash of filename -> {content_hash, size, created_at[, etag]}
+
+    ``content_hash`` is always the SHA-256 of the stored bytes, or None when
+    only a listing has seen the object. Backend checksums such as the
+    Supabase eTag (MD5 or a multipart digest) are kept apart as ``etag``.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[RedisCache] = None,
+        key: str = StorageConfig.MANIFEST_KEY,
+    ):
+        self.redis = redis
+        self.key = key
+
+    @property
+    def available(self) -> bool:
+        """Whether the index can be consulted at all"""
+        return self.redis is not None and self.redis.client is not None
+
+    def record(
+        self,
+        filename: str,
+        content_hash: Optional[str],
+        size: int,
+        created_at: Optional[str] = None,
+        etag: Optional[str] = None,
+    ):
+        """Add or replace the entry for a stored object"""
+        if not self.available:
+            return
+        entry = {
+            "content_hash": content_hash,
+            "size": size,
+            "created_at": created_at or datetime.utcnow().isoformat(),
+        }
+        if etag:
+            entry["etag"] = etag
+        try:
+            self.redis.client.hset(self.key, filename, json.dumps(entry))
+        except Exception as e:
+            logger.error(f"Manifest record error for {filename}: {e}")
+
+    def remove(self, *filenames: str):
+        """Drop entries for deleted objects"""
+        if not self.available or not filenames:
+            return
+        try:
+            self.redis.client.hdel(self.key, *filenames)
+        except Exception as e:
+            logger.error(f"Manifest remove error: {e}")
+
+    def get(self, filename: str) -> Optional[dict]:
+        """Get the entry for an object, None if unknown"""
+        if not self.available:
+            return None
+        try:
+            entry = self.redis.client.hget(self.key, filename)
+            return json.loads(entry) if entry else None
+        except Exception as e:
+            logger.error(f"Manifest get error for {filename}: {e}")
+            return None
+
+    def contains(self, filename: str) -> Optional[bool]:
+        """Check an object is stored; None when the index is unavailable"""
+        if not self.available:
+            return None
+        try:
+            return bool(self.redis.client.hexists(self.key, filename))
+        except Exception as e:
+            logger.error(f"Manifest lookup error for {filename}: {e}")
+            return None
+
+    def entries(self) -> Dict[str, dict]:
+        """Every indexed object"""
+        if not self.available:
+            return {}
+        raw = self.redis.client.hgetall(self.key)
+        return {name: json.loads(entry) for name, entry in raw.items()}
+
+    def reconcile(
+        self, stored: Dict[str, dict], listed_at: Optional[datetime] = None
+    ) -> Dict[str, int]:
+        """Make the index match the objects actually in storage
+
+        Entries recorded after the listing started describe uploads the
+        listing may have missed, so they are neither removed nor replaced.
+
+        Args:
+            stored: filename -> entry for every object found in storage
+            listed_at: When the listing started (naive UTC); defaults to now
+
+        Returns:
+            dict: number of entries added, updated and removed
+        """
+        if not self.available:
+            return {"added": 0, "updated": 0, "removed": 0}
+
+        listed_at = listed_at or datetime.utcnow()
+        indexed = self.entries()
+        stale = [
+            name
+            for name, entry in indexed.items()
+            if name not in stored and _recorded_before(entry, listed_at)
+        ]
+        added = updated = 0
+        for name, entry in stored.items():
+            current = indexed.get(name)
+            if current is None:
+                added += 1
+            elif _recorded_before(current, listed_at) and self._differs(current, entry):
+                updated += 1
+            else:
+                continue
+            self.record(
+                name,
+                entry.get("content_hash"),
+                entry["size"],
+                entry["created_at"],
+                entry.get("etag"),
+            )
+
+        self.remove(*stale)
+        logger.info(
+            f"Storage manifest reconciled: {added} added, {updated} updated, "
+            f"{len(stale)} removed"
+        )
+        return {"added": added, "updated": updated, "removed": len(stale)}
+
+    @staticmethod
+    def _differs(current: dict, listed: dict) -> bool:
+        """Compare the fields both the index and the listing know"""
+        if current.get("size") != listed.get("size"):
+            return True
+        for field in ("content_hash", "etag"):
+            if current.get(field) and listed.get(field):
+                if current[field] != listed[field]:
+                    return True
+        return False
+
+    def acquire_reconcile_lock(self, ttl: int) -> bool:
+        """Let only one worker reconcile per interval"""
+        if not self.available:
+            return False
+        try:
+            return bool(self.redis.client.set(f"{self.key}:lock", 1, nx=True, ex=ttl))
+        except Exception as e:
+            logger.error(f"Manifest lock error: {e}")
+            return False
+
+
+# Global storage manifest
+storage_manifest = StorageManifest(redis_cache)
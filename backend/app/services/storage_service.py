@@ -1,30 +1,283 @@
-from typing import Optional
+from typing import Dict, List, Optional
+import hashlib
 import logging
+import os
+import re
+import tempfile
+import time
+from datetime import datetime
 from supabase import create_client, Client
 
 from app.core.config import settings
+from app.core.constants import StorageConfig
+from app.services.storage_manifest import StorageManifest, storage_manifest
 
 logger = logging.getLogger(__name__)
 
+# resume_<id>_<template>[_<content key>].pdf; renders of one resume and
+# template share the part before the key
+RENDER_NAME = re.compile(r"(resume_\d+_[^_/]+)(?:_[0-9a-f]{16})?\.pdf")
 
-class StorageService:
-    """Service for managing PDF storage in Supabase"""
 
-    def __init__(self):
-        # Initialize Supabase client with credentials from environment
-        self.supabase: Client = create_client(
-            settings.supabase_url,
-            settings.service_role,  # Updated to match config
+def _render_family(filename: str) -> Optional[str]:
+    """The resume and template part of a stored render's name"""
+    match = RENDER_NAME.fullmatch(filename.rpartition("/")[2])
+    return match.group(1) if match else None
+
+
+class StorageBackend:
+    """Where stored PDFs physically live
+
+    Backends raise on failure; StorageService turns errors into return values
+    and keeps the manifest in step.
+    """
+
+    name = "base"
+
+    def upload(self, filename: str, content: bytes):
+        raise NotImplementedError
+
+    def download(self, filename: str) -> Optional[bytes]:
+        raise NotImplementedError
+
+    def exists(self, filename: str) -> bool:
+        raise NotImplementedError
+
+    def delete(self, filename: str):
+        raise NotImplementedError
+
+    def signed_url(self, filename: str, expires_in: int) -> Optional[str]:
+        raise NotImplementedError
+
+    def list_objects(self) -> Dict[str, dict]:
+        """Every stored PDF as filename -> manifest entry (slow)"""
+        raise NotImplementedError
+
+    def list_prefix(self, prefix: str) -> List[str]:
+        """Names of the objects directly under a prefix"""
+        raise NotImplementedError
+
+    def delete_many(self, filenames: List[str]):
+        for filename in filenames:
+            self.delete(filename)
+
+    def local_path(self, filename: str) -> Optional[str]:
+        """Filesystem path of a stored object, for backends that have one"""
+        return None
+
+
+class SupabaseBackend(StorageBackend):
+    """Objects in a Supabase storage bucket"""
+
+    name = "supabase"
+
+    def __init__(self, url: str, key: str, bucket_name: str):
+        self.supabase: Client = create_client(url, key)
+        self.bucket_name = bucket_name
+
+    @property
+    def bucket(self):
+        return self.supabase.storage.from_(self.bucket_name)
+
+    def upload(self, filename: str, content: bytes):
+        self.bucket.upload(
+            path=filename,
+            file=content,
+            # Re-renders of an edited resume replace the stored copy
+            file_options={"content-type": "application/pdf", "upsert": "true"},
+        )
+
+    def download(self, filename: str) -> Optional[bytes]:
+        return self.bucket.download(filename) or None
+
+    def exists(self, filename: str) -> bool:
+        # List only the object's own prefix
+        folder, _, name = filename.rpartition("/")
+        bucket = self.bucket
+        response = bucket.list(folder) if folder else bucket.list()
+        return any(file.get("name") == name for file in response)
+
+    def delete(self, filename: str):
+        self.bucket.remove([filename])
+
+    def delete_many(self, filenames: List[str]):
+        self.bucket.remove(list(filenames))
+
+    def signed_url(self, filename: str, expires_in: int) -> Optional[str]:
+        response = self.bucket.create_signed_url(filename, expires_in)
+        return response.get("signedURL") or response.get("signedUrl")
+
+    def list_objects(self) -> Dict[str, dict]:
+        bucket = self.bucket
+        objects = {}
+        for folder in bucket.list(StorageConfig.RESUME_PREFIX):
+            prefix = f"{StorageConfig.RESUME_PREFIX}/{folder['name']}"
+            for obj in self._list_all(bucket, prefix):
+                metadata = obj.get("metadata") or {}
+                # The eTag is MD5 or a multipart digest, not our SHA-256
+                objects[f"{prefix}/{obj['name']}"] = {
+                    "content_hash": None,
+                    "etag": metadata.get("eTag", "").strip('"') or None,
+                    "size": metadata.get("size", 0),
+                    "created_at": obj.get("created_at"),
+                }
+        return objects
+
+    def list_prefix(self, prefix: str) -> List[str]:
+        return [
+            f"{prefix}/{obj['name']}" if prefix else obj["name"]
+            for obj in self._list_all(self.bucket, prefix)
+        ]
+
+    @staticmethod
+    def _list_all(bucket, prefix: str) -> List[dict]:
+        """List a prefix page by page"""
+        page_size = StorageConfig.LIST_PAGE_SIZE
+        results, offset = [], 0
+        while True:
+            page = bucket.list(prefix, {"limit": page_size, "offset": offset})
+            results.extend(obj for obj in page if obj.get("metadata"))
+            if len(page) < page_size:
+                return results
+            offset += page_size
+
+
+class LocalDiskBackend(StorageBackend):
+    """Objects on local disk, sharded by a hash of their name
+
+    A file for ``resumes/7/x.pdf`` lives at ``<root>/ab/cd/resumes/7/x.pdf``,
+    so no directory grows without bound. Writes land in a temp file that is
+    renamed into place, so readers never see a partial PDF.
+    """
+
+    name = "local"
+
+    def __init__(self, root_dir: str):
+        self.root_dir = os.path.abspath(root_dir)
+        os.makedirs(self.root_dir, exist_ok=True)
+
+    def _path(self, filename: str) -> str:
+        digest = hashlib.sha256(filename.encode()).hexdigest()
+        shard = os.path.join(self.root_dir, digest[:2], digest[2:4])
+        path = os.path.normpath(os.path.join(shard, filename))
+        if not path.startswith(shard + os.sep):
+            raise ValueError(f"Invalid storage path: {filename}")
+        return path
+
+    def upload(self, filename: str, content: bytes):
+        path = self._path(filename)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def download(self, filename: str) -> Optional[bytes]:
+        try:
+            with open(self._path(filename), "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def exists(self, filename: str) -> bool:
+        return os.path.isfile(self._path(filename))
+
+    def delete(self, filename: str):
+        os.remove(self._path(filename))
+
+    def signed_url(self, filename: str, expires_in: int) -> Optional[str]:
+        if not self.exists(filename):
+            return None
+        expires = int(time.time()) + expires_in
+        return f"file://{self._path(filename)}?expires={expires}"
+
+    def _walk(self):
+        """Every stored object as (filename, path)"""
+        for root, _, files in os.walk(self.root_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                # Strip the two shard levels to recover the object name
+                parts = os.path.relpath(path, self.root_dir).split(os.sep)
+                yield "/".join(parts[2:]), path
+
+    def list_objects(self) -> Dict[str, dict]:
+        objects = {}
+        for filename, path in self._walk():
+            if not filename.startswith(StorageConfig.RESUME_PREFIX + "/"):
+                continue
+            with open(path, "rb") as f:
+                digest = hashlib.sha256(f.read()).hexdigest()
+            objects[filename] = {
+                "content_hash": digest,
+                "size": os.path.getsize(path),
+                "created_at": None,
+            }
+        return objects
+
+    def list_prefix(self, prefix: str) -> List[str]:
+        # Objects are sharded by name, so the whole tree is walked
+        return [
+            filename
+            for filename, _ in self._walk()
+            if filename.rpartition("/")[0] == prefix
+        ]
+
+    def local_path(self, filename: str) -> Optional[str]:
+        path = self._path(filename)
+        return path if os.path.isfile(path) else None
+
+
+def create_storage_backend() -> StorageBackend:
+    """Build the backend selected by settings"""
+    if settings.storage_backend == "local":
+        root_dir = settings.storage_dir or os.path.join(
+            tempfile.gettempdir(), "resumade-storage"
         )
-        self.bucket_name = settings.bucket_name  # Updated to match config
+        return LocalDiskBackend(root_dir)
+    return SupabaseBackend(
+        settings.supabase_url, settings.service_role, settings.bucket_name
+    )
+
+
+class StorageService:
+    """Service for managing stored PDFs"""
+
+    def __init__(
+        self,
+        backend: Optional[StorageBackend] = None,
+        manifest: Optional[StorageManifest] = None,
+    ):
+        self.backend = backend or create_storage_backend()
+        self.manifest: StorageManifest = manifest or storage_manifest
+
+    @staticmethod
+    def resume_prefix(resume_id: int) -> str:
+        """Prefix holding every stored PDF of a resume"""
+        return f"{StorageConfig.RESUME_PREFIX}/{resume_id}"
+
+    @classmethod
+    def generate_pdf_filename(
+        cls, resume_id: int, template: str, content_key: Optional[str] = None
+    ) -> str:
+        """Generate consistent filename for PDF storage
 
-    def generate_pdf_filename(self, resume_id: int, template: str) -> str:
-        """Generate consistent filename for PDF storage"""
-        return f"resume_{resume_id}_{template}.pdf"
+        Objects live under a per-resume prefix so any listing stays small.
+        With a content key the name identifies one exact rendering, so an
+        existing file is known to match the resume's current content.
+        """
+        prefix = cls.resume_prefix(resume_id)
+        if content_key:
+            return f"{prefix}/resume_{resume_id}_{template}_{content_key[:16]}.pdf"
+        return f"{prefix}/resume_{resume_id}_{template}.pdf"
 
     def upload_pdf(self, pdf_bytes: bytes, filename: str) -> bool:
         """
-        Upload PDF bytes to Supabase Storage
+        Upload PDF bytes to storage
 
         Args:
             pdf_bytes: PDF content as bytes
@@ -34,23 +287,77 @@ class StorageService:
             bool: True if upload successful, False otherwise
         """
         try:
-            # Upload PDF to Supabase storage bucket
-            self.supabase.storage.from_(self.bucket_name).upload(
-                path=filename,
-                file=pdf_bytes,
-                file_options={"content-type": "application/pdf"},
-            )
+            self.backend.upload(filename, pdf_bytes)
 
+            self.manifest.record(
+                filename, hashlib.sha256(pdf_bytes).hexdigest(), len(pdf_bytes)
+            )
             logger.info(f"PDF uploaded successfully: {filename}")
-            return True
 
         except Exception as e:
             logger.error(f"Failed to upload PDF {filename}: {str(e)}")
             return False
 
+        self.delete_superseded(filename)
+        return True
+
+    def delete_superseded(self, filename: str) -> int:
+        """
+        Delete earlier renders of the same resume and template as a new upload
+
+        Each edit changes the content key, so without this every export
+        after an edit would leave another object behind.
+
+        Args:
+            filename: The render that was just stored
+
+        Returns:
+            int: Number of objects deleted
+        """
+        prefix = filename.rpartition("/")[0]
+        family = _render_family(filename)
+        if not prefix or family is None:
+            return 0
+        try:
+            superseded = [
+                stored
+                for stored in self.backend.list_prefix(prefix)
+                if stored != filename and _render_family(stored) == family
+            ]
+            if superseded:
+                self.backend.delete_many(superseded)
+                self.manifest.remove(*superseded)
+                logger.info(f"Deleted {len(superseded)} superseded PDFs of {filename}")
+            return len(superseded)
+        except Exception as e:
+            logger.error(f"Failed to delete PDFs superseded by {filename}: {str(e)}")
+            return 0
+
+    def delete_resume_pdfs(self, resume_id: int) -> bool:
+        """
+        Delete every stored PDF of a resume
+
+        Args:
+            resume_id: ID of the deleted resume
+
+        Returns:
+            bool: True if deletion successful, False otherwise
+        """
+        try:
+            filenames = self.backend.list_prefix(self.resume_prefix(resume_id))
+            if filenames:
+                self.backend.delete_many(filenames)
+                self.manifest.remove(*filenames)
+            logger.info(f"Deleted {len(filenames)} stored PDFs of resume {resume_id}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to delete PDFs of resume {resume_id}: {str(e)}")
+            return False
+
     def download_pdf(self, filename: str) -> Optional[bytes]:
         """
-        Download PDF from Supabase Storage
+        Download PDF from storage
 
         Args:
             filename: PDF filename in storage
@@ -59,8 +366,7 @@ class StorageService:
             bytes: PDF content if found, None if not found or error
         """
         try:
-            # Download PDF from Supabase storage
-            response = self.supabase.storage.from_(self.bucket_name).download(filename)
+            response = self.backend.download(filename)
 
             if response:
                 logger.info(f"PDF downloaded successfully: {filename}")
@@ -75,7 +381,7 @@ class StorageService:
 
     def pdf_exists(self, filename: str) -> bool:
         """
-        Check if PDF exists in Supabase Storage
+        Check if PDF exists in storage
 
         Args:
             filename: PDF filename to check
@@ -83,12 +389,12 @@ class StorageService:
         Returns:
             bool: True if PDF exists, False otherwise
         """
-        try:
-            # List files in bucket to check if PDF exists
-            response = self.supabase.storage.from_(self.bucket_name).list()
+        known = self.manifest.contains(filename)
+        if known is not None:
+            return known
 
-            # Check if any file matches our filename
-            return any(file.get("name") == filename for file in response)
+        try:
+            return self.backend.exists(filename)
 
         except Exception as e:
             logger.error(f"Failed to check PDF existence {filename}: {str(e)}")
@@ -96,7 +402,7 @@ class StorageService:
 
     def delete_pdf(self, filename: str) -> bool:
         """
-        Delete PDF from Supabase Storage
+        Delete PDF from storage
 
         Args:
             filename: PDF filename to delete
@@ -105,8 +411,8 @@ class StorageService:
             bool: True if deletion successful, False otherwise
         """
         try:
-            # Delete PDF from Supabase storage
-            self.supabase.storage.from_(self.bucket_name).remove([filename])
+            self.backend.delete(filename)
+            self.manifest.remove(filename)
 
             logger.info(f"PDF deleted successfully: {filename}")
             return True
@@ -114,3 +420,96 @@ class StorageService:
         except Exception as e:
             logger.error(f"Failed to delete PDF {filename}: {str(e)}")
             return False
+
+    def create_signed_url(self, filename: str, expires_in: int) -> Optional[str]:
+        """
+        Create a short-lived URL for downloading a PDF directly from storage
+
+        Args:
+            filename: PDF filename in storage
+            expires_in: URL lifetime in seconds
+
+        Returns:
+            str: Signed URL, None on error
+        """
+        try:
+            url = self.backend.signed_url(filename, expires_in)
+        except Exception as e:
+            logger.error(f"Failed to sign URL for {filename}: {str(e)}")
+            url = None
+
+        if url is None:
+            # Most likely the object is gone; let the next upload re-index it
+            self.manifest.remove(filename)
+        return url
+
+    def local_path(self, filename: str) -> Optional[str]:
+        """
+        Filesystem path of a stored PDF, so it can be sent without reading it
+
+        Returns:
+            str: Path on local disk, None for remote backends or missing files
+        """
+        try:
+            return self.backend.local_path(filename)
+        except Exception as e:
+            logger.error(f"Failed to resolve local path for {filename}: {str(e)}")
+            return None
+
+    def list_stored_pdfs(self) -> Dict[str, dict]:
+        """
+        List every PDF under the per-resume prefixes (slow, for reconciliation)
+
+        Returns:
+            dict: filename -> manifest entry built from storage metadata
+        """
+        return self.backend.list_objects()
+
+    def delete_legacy_pdfs(self) -> int:
+        """
+        Delete renders stored at the bucket root before per-resume prefixes
+
+        They carry no content key, so they can never be served again.
+
+        Returns:
+            int: Number of objects deleted
+        """
+        legacy = [
+            filename
+            for filename in self.backend.list_prefix("")
+            if _render_family(filename) is not None
+        ]
+        if legacy:
+            self.backend.delete_many(legacy)
+            self.manifest.remove(*legacy)
+            logger.info(f"Deleted {len(legacy)} legacy root-level PDFs")
+        return len(legacy)
+
+    def reconcile_manifest(self) -> Optional[Dict[str, int]]:
+        """
+        Repair drift between the manifest and the bucket
+
+        Returns:
+            dict: Counts of repaired entries and deleted legacy objects,
+            None if skipped or failed
+        """
+        if not self.manifest.acquire_reconcile_lock(
+            StorageConfig.RECONCILE_INTERVAL_SECONDS
+        ):
+            return None
+        try:
+            legacy = self.delete_legacy_pdfs()
+            # Uploads recorded after this moment are kept whatever the listing says
+            listed_at = datetime.utcnow()
+            result = self.manifest.reconcile(self.list_stored_pdfs(), listed_at)
+            return {**result, "legacy_deleted": legacy}
+        except Exception as e:
+            logger.error(f"Failed to reconcile storage manifest: {str(e)}")
+            return None
+
+
+class LocalStorageService(StorageService):
+    """Storage service on local disk, for tests and single-node deployments"""
+
+    def __init__(self, root_dir: str, manifest: Optional[StorageManifest] = None):
+        super().__init__(LocalDiskBackend(root_dir), manifest or StorageManifest())
@@ -0,0 +1,162 @@
+"""Template catalog and sample previews, rendered once and served from memory"""
+
+import logging
+import threading
+from typing import Dict, Optional
+
+from app.core.compression import CachedBody, cached_body
+from app.schemas.response import APIResponse
+from app.services.pdf_service import PDFService
+from app.services.resume_document import ResumeDocument
+from app.services.template_registry import template_registry
+from app.services.template_stylesheets import template_stylesheets
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RESUME = {
+    "id": 0,
+    "title": "Sample Resume",
+    "personal_info": {
+        "full_name": "John Doe",
+        "email": "john.doe@email.com",
+        "phone": "(555) 123-4567",
+        "location": "New York, NY",
+        "linkedin": "https://linkedin.com/in/johndoe",
+        "website": "https://johndoe.com",
+        "summary": "Results-driven professional with 5+ years of experience in delivering innovative solutions. Proven track record of leading cross-functional teams and driving business growth through strategic initiatives.",
+    },
+    "experience": [
+        {
+            "company": "Tech Solutions Inc",
+            "position": "Senior Software Engineer",
+            "location": "New York, NY",
+            "start_date": "2021",
+            "end_date": "",
+            "current": True,
+            "description": "Led development of microservices architecture serving 1M+ users\nMentored team of 5 junior developers and improved deployment efficiency by 40%\nImplemented CI/CD pipelines reducing release time by 60%",
+        },
+        {
+            "company": "Digital Innovations",
+            "position": "Software Engineer",
+            "location": "Boston, MA",
+            "start_date": "2019",
+            "end_date": "2021",
+            "current": False,
+            "description": "Developed RESTful APIs and React applications\nCollaborated with product team to deliver features on time\nOptimized database queries improving performance by 35%",
+        },
+    ],
+    "education": [
+        {
+            "institution": "Massachusetts Institute of Technology",
+            "degree": "Bachelor of Science",
+            "field_of_study": "Computer Science",
+            "location": "Cambridge, MA",
+            "start_date": "2015",
+            "end_date": "2019",
+            "gpa": "3.8/4.0",
+        }
+    ],
+    "skills": [
+        {"name": "JavaScript", "level": "Expert"},
+        {"name": "Python", "level": "Advanced"},
+        {"name": "React", "level": "Expert"},
+        {"name": "Node.js", "level": "Advanced"},
+        {"name": "AWS", "level": "Intermediate"},
+        {"name": "Docker", "level": "Intermediate"},
+    ],
+    "certifications": [
+        {
+            "name": "AWS Certified Solutions Architect",
+            "issuer": "Amazon Web Services",
+            "date": "2022",
+        },
+        {
+            "name": "Professional Scrum Master",
+            "issuer": "Scrum.org",
+            "date": "2021",
+        },
+    ],
+    "projects": [
+        {
+            "name": "E-Commerce Platform",
+            "description": "Built scalable e-commerce platform handling 10K+ daily transactions with real-time inventory management",
+            "technologies": ["React", "Node.js", "MongoDB", "Stripe"],
+            "url": "https://github.com/johndoe/ecommerce",
+        },
+        {
+            "name": "Analytics Dashboard",
+            "description": "Created data visualization dashboard processing 1M+ events daily with custom reporting features",
+            "technologies": ["Python", "Django", "PostgreSQL", "D3.js"],
+            "url": "https://github.com/johndoe/analytics",
+        },
+    ],
+}
+
+
+class TemplateGallery:
+    """Sample previews keyed by template file hash, plus the categorized catalog"""
+
+    def __init__(self):
+        self._pdf_service: Optional[PDFService] = None
+        # template file -> (file hash, rendered preview)
+        self._previews: Dict[str, tuple] = {}
+        self._catalog: Optional[CachedBody] = None
+        self._lock = threading.Lock()
+
+    @property
+    def pdf_service(self) -> PDFService:
+        # Created on first use so importing the gallery opens no storage client
+        if self._pdf_service is None:
+            self._pdf_service = PDFService()
+        return self._pdf_service
+
+    def build(self) -> int:
+        """Render every sample preview and the catalog"""
+        for template in PDFService.TEMPLATES:
+            self.preview(template)
+        self.catalog()
+        logger.info(f"Built template gallery with {len(self._previews)} previews")
+        return len(self._previews)
+
+    def _render_preview(self, template: str) -> CachedBody:
+        sample = ResumeDocument.of(dict(SAMPLE_RESUME, template_name=template))
+        html_content = template_stylesheets.externalize(
+            self.pdf_service.render_resume_html(sample, template)
+        )
+        return cached_body(html_content.encode("utf-8"))
+
+    def preview(self, template: str) -> CachedBody:
+        """Get the sample preview of a template, re-rendering if its file changed"""
+        template_file = self.pdf_service._get_template_file(template)
+        version = template_registry.version(template_file)
+
+        cached = self._previews.get(template_file)
+        if cached is not None and cached[0] == version:
+            return cached[1]
+
+        body = self._render_preview(template)
+        with self._lock:
+            self._previews[template_file] = (version, body)
+        return body
+
+    def catalog(self) -> CachedBody:
+        """Get the templates/list response body"""
+        if self._catalog is None:
+            templates = PDFService.get_available_templates()
+
+            # Organize templates by category
+            categorized = {}
+            for template in templates:
+                categorized.setdefault(template["category"], []).append(template)
+
+            payload = APIResponse(
+                success=True,
+                message="Templates retrieved",
+                data={"categories": categorized, "all_templates": templates},
+            )
+            self._catalog = cached_body(payload.model_dump_json().encode("utf-8"))
+        return self._catalog
+
+
+# Global template gallery
+template_gallery = TemplateGallery()
@@ -0,0 +1,104 @@
+"""Process-wide registry of compiled resume templates"""
+
+import hashlib
+import logging
+import os
+import tempfile
+import threading
+from typing import Dict
+
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, Template
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "templates"
+)
+
+
+class TemplateRegistry:
+    """Compile each template once and hot-swap changed files in development"""
+
+    def __init__(self, template_dir: str, cache_dir: str, hot_reload: bool = False):
+        self.template_dir = template_dir
+        self.hot_reload = hot_reload
+
+        os.makedirs(cache_dir, exist_ok=True)
+        self.env = Environment(
+            loader=FileSystemLoader(template_dir),
+            bytecode_cache=FileSystemBytecodeCache(cache_dir),
+            auto_reload=hot_reload,
+        )
+
+        self._templates: Dict[str, Template] = {}
+        self._hashes: Dict[str, str] = {}
+        self._mtimes: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def _path(self, template_file: str) -> str:
+        return os.path.join(self.template_dir, template_file)
+
+    @staticmethod
+    def _hash_file(path: str) -> str:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+
+    def _load(self, template_file: str) -> Template:
+        """Compile a template (bytecode cache skips parsing for unchanged sources)"""
+        path = self._path(template_file)
+        mtime = os.path.getmtime(path)
+        digest = self._hash_file(path)
+        template = self.env.loader.load(self.env, template_file)
+
+        self._templates[template_file] = template
+        self._hashes[template_file] = digest
+        self._mtimes[template_file] = mtime
+        return template
+
+    def compile_all(self) -> int:
+        """Compile every template in the template directory"""
+        with self._lock:
+            for template_file in sorted(os.listdir(self.template_dir)):
+                if template_file.endswith(".html"):
+                    self._load(template_file)
+        logger.info(f"Compiled {len(self._templates)} resume templates")
+        return len(self._templates)
+
+    def _is_stale(self, template_file: str) -> bool:
+        """Check whether a template file's content changed since it was compiled"""
+        path = self._path(template_file)
+        mtime = os.path.getmtime(path)
+        if mtime == self._mtimes[template_file]:
+            return False
+
+        self._mtimes[template_file] = mtime
+        return self._hash_file(path) != self._hashes[template_file]
+
+    def get(self, template_file: str) -> Template:
+        """Get the compiled template for a template file"""
+        template = self._templates.get(template_file)
+        if template is not None and not (
+            self.hot_reload and self._is_stale(template_file)
+        ):
+            return template
+
+        with self._lock:
+            if template is not None:
+                logger.info(f"Template changed on disk, reloading: {template_file}")
+            return self._load(template_file)
+
+    def version(self, template_file: str) -> str:
+        """Get the content hash of the compiled template"""
+        self.get(template_file)
+        return self._hashes[template_file]
+
+
+# Global template registry
+template_registry = TemplateRegistry(
+    TEMPLATE_DIR,
+    settings.template_cache_dir
+    or os.path.join(tempfile.gettempdir(), "resumade-jinja-cache"),
+    hot_reload=settings.debug,
+)
@@ -0,0 +1,66 @@
+"""Template stylesheets served as fingerprinted files for HTML previews"""
+
+import hashlib
+import threading
+from typing import Dict, Optional
+
+from app.core.compression import CachedBody, cached_body
+from app.core.constants import PreviewConfig
+from app.services.pdf_stylesheets import STYLE_BLOCK, split_stylesheet
+
+# Route of the stylesheet endpoint; previews are served from the API origin
+STYLESHEET_URL = "/api/resumes/templates/styles/{}.css"
+
+
+class TemplateStylesheets:
+    """Static template CSS keyed by content fingerprint
+
+    Previews link to the static CSS of their template instead of inlining
+    it, keeping only the small customization block in the page. The URL
+    changes whenever the CSS does, so browsers can cache it forever.
+    """
+
+    def __init__(self, max_stylesheets: int = PreviewConfig.MAX_STYLESHEETS):
+        self.max_stylesheets = max_stylesheets
+        self._stylesheets: Dict[str, CachedBody] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def fingerprint(css: str) -> str:
+        return hashlib.sha256(css.encode("utf-8")).hexdigest()[:20]
+
+    def register(self, css: str) -> str:
+        """Store static CSS and return its fingerprint"""
+        fingerprint = self.fingerprint(css)
+        if fingerprint not in self._stylesheets:
+            with self._lock:
+                # Template edits leave stale entries behind; start over when full
+                if len(self._stylesheets) >= self.max_stylesheets:
+                    self._stylesheets.clear()
+                self._stylesheets[fingerprint] = cached_body(
+                    css.encode("utf-8"), f'"{fingerprint}"'
+                )
+        return fingerprint
+
+    def get(self, fingerprint: str) -> Optional[CachedBody]:
+        """Get stylesheet content by fingerprint"""
+        return self._stylesheets.get(fingerprint)
+
+    def externalize(self, html_content: str) -> str:
+        """Replace a rendered page's inline static CSS with a stylesheet link"""
+        match = STYLE_BLOCK.search(html_content)
+        if not match:
+            return html_content
+
+        _, static_css, override_css = split_stylesheet(match.group(0))
+        head = ""
+        if override_css:
+            # Keep the customization block ahead of the static rules, as in the template
+            head = f"<style>{override_css}</style>"
+        href = STYLESHEET_URL.format(self.register(static_css))
+        head += f'<link rel="stylesheet" href="{href}">'
+        return html_content[: match.start()] + head + html_content[match.end() :]
+
+
+# Global template stylesheet registry
+template_stylesheets = TemplateStylesheets()
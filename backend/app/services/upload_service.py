@@ -0,0 +1,164 @@
+"""Background uploader that keeps storage round trips off the request path"""
+
+import hashlib
+import logging
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+from app.core.constants import UploadConfig
+from app.core.metrics import LATENCY_BUCKETS
+from app.services.storage_service import StorageService
+
+logger = logging.getLogger(__name__)
+
+upload_queue_depth = Gauge(
+    "resumade_upload_queue_depth",
+    "Uploads waiting for the background uploader",
+    multiprocess_mode="livesum",
+)
+upload_latency = Histogram(
+    "resumade_upload_seconds",
+    "Storage upload latency per attempt",
+    ["result"],
+    buckets=LATENCY_BUCKETS,
+)
+uploads_total = Counter("resumade_uploads_total", "Upload outcomes", ["result"])
+
+
+class BackgroundUploader:
+    """Bounded upload queue drained by a worker thread, with retries and dedup"""
+
+    def __init__(
+        self,
+        storage_factory: Callable[[], StorageService] = StorageService,
+        max_queue: int = UploadConfig.MAX_QUEUE_SIZE,
+        max_retries: int = UploadConfig.MAX_RETRIES,
+        backoff_base: float = UploadConfig.BACKOFF_BASE_SECONDS,
+        backoff_max: float = UploadConfig.BACKOFF_MAX_SECONDS,
+        dedup_size: int = UploadConfig.DEDUP_CACHE_SIZE,
+    ):
+        self.storage_factory = storage_factory
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.dedup_size = dedup_size
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue)
+        self._storage: Optional[StorageService] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        # filename -> content hash of the last upload queued or stored there
+        self._uploaded: OrderedDict[str, str] = OrderedDict()
+
+    @property
+    def depth(self) -> int:
+        """Number of uploads waiting in the queue"""
+        return self._queue.qsize()
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="storage-uploader", daemon=True
+                )
+                self._thread.start()
+
+    def _is_duplicate(self, filename: str, digest: str) -> bool:
+        """Check and record that this exact content is already stored at filename"""
+        with self._lock:
+            if self._uploaded.get(filename) == digest:
+                self._uploaded.move_to_end(filename)
+                return True
+            self._uploaded[filename] = digest
+            if len(self._uploaded) > self.dedup_size:
+                self._uploaded.popitem(last=False)
+            return False
+
+    def _forget(self, filename: str, digest: str):
+        with self._lock:
+            if self._uploaded.get(filename) == digest:
+                del self._uploaded[filename]
+
+    def enqueue(self, content: bytes, filename: str) -> bool:
+        """Queue an upload without blocking; returns False if it was not queued"""
+        digest = hashlib.sha256(content).hexdigest()
+        if self._is_duplicate(filename, digest):
+            uploads_total.labels(result="deduplicated").inc()
+            return False
+
+        try:
+            self._queue.put_nowait((content, filename, digest))
+            upload_queue_depth.set(self.depth)
+        except queue.Full:
+            self._forget(filename, digest)
+            uploads_total.labels(result="dropped").inc()
+            logger.warning(f"Upload queue full, dropping upload of {filename}")
+            return False
+
+        self._ensure_worker()
+        return True
+
+    def _upload(self, content: bytes, filename: str, digest: str):
+        """Upload one file, retrying with exponential backoff"""
+        if self._storage is None:
+            self._storage = self.storage_factory()
+
+        for attempt in range(self.max_retries + 1):
+            start = time.perf_counter()
+            try:
+                ok = self._storage.upload_pdf(content, filename)
+            except Exception as e:
+                logger.error(f"Upload of {filename} raised: {str(e)}")
+                ok = False
+            upload_latency.labels(result="success" if ok else "error").observe(
+                time.perf_counter() - start
+            )
+
+            if ok:
+                uploads_total.labels(result="success").inc()
+                return
+            if attempt < self.max_retries:
+                time.sleep(min(self.backoff_base * 2**attempt, self.backoff_max))
+
+        self._forget(filename, digest)
+        uploads_total.labels(result="failed").inc()
+        logger.error(f"Giving up on upload of {filename}")
+
+    def _run(self):
+        while True:
+            item = self._queue.get()
+            upload_queue_depth.set(self.depth)
+            try:
+                if item is None:
+                    return
+                self._upload(*item)
+            except Exception as e:
+                logger.error(f"Background uploader error: {str(e)}")
+            finally:
+                self._queue.task_done()
+
+    def join(self):
+        """Block until every queued upload has been attempted"""
+        self._queue.join()
+
+    def shutdown(self, timeout: float = UploadConfig.SHUTDOWN_TIMEOUT_SECONDS):
+        """Stop the worker after it drains the queue, waiting at most timeout"""
+        with self._lock:
+            thread = self._thread
+        if thread is None or not thread.is_alive():
+            return
+        try:
+            self._queue.put(None, timeout=timeout)
+        except queue.Full:
+            logger.warning("Upload queue still full at shutdown")
+            return
+        thread.join(timeout)
+
+
+# Global background uploader
+background_uploader = BackgroundUploader()
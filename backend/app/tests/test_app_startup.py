@@ -0,0 +1,25 @@
+"""Tests for application startup and shutdown"""
+
+from unittest.mock import patch
+
+from fastapi.testclient import TestClient
+
+from app.main import app
+
+
+def test_app_starts_without_storage_configured():
+    """Test startup builds the gallery without creating a storage client"""
+    with (
+        patch("app.core.config.settings.storage_backend", "supabase"),
+        patch("app.core.config.settings.supabase_url", ""),
+        patch("app.main.render_pool.start"),
+        patch("app.main.build_font_cache", return_value=False),
+    ):
+        with TestClient(app) as client:
+            assert client.get("/health").status_code == 200
+            preview = client.get(
+                "/api/resumes/templates/preview", params={"template": "modern-tech"}
+            )
+
+    assert preview.status_code == 200
+    assert "John" in preview.text
@@ -0,0 +1,86 @@
+"""Tests for the export artifact cache"""
+
+from unittest.mock import MagicMock
+
+from app.core.artifact_cache import ArtifactCache, artifact_key
+
+
+def _cache(tmp_path, **overrides):
+    options = {"memory_max_bytes": 1000, "disk_max_bytes": 10_000}
+    options.update(overrides)
+    return ArtifactCache(str(tmp_path / "artifacts"), **options)
+
+
+def test_artifact_key_is_canonical():
+    """Test keys ignore dict ordering but not content"""
+    key1 = artifact_key("pdf", {"a": 1, "b": [1, 2]})
+    key2 = artifact_key("pdf", {"b": [1, 2], "a": 1})
+    key3 = artifact_key("docx", {"a": 1, "b": [1, 2]})
+
+    assert key1 == key2
+    assert key1 != key3
+
+
+def test_set_and_get_bytes(tmp_path):
+    """Test binary content round-trips through the cache"""
+    cache = _cache(tmp_path)
+    cache.set("k" * 64, b"%PDF-1.7 bytes")
+
+    assert cache.get("k" * 64) == b"%PDF-1.7 bytes"
+    assert cache.get("missing") is None
+
+
+def test_disk_tier_survives_new_instance(tmp_path):
+    """Test artifacts persist on disk across processes"""
+    _cache(tmp_path).set("abc123", b"docx bytes")
+
+    assert _cache(tmp_path).get("abc123") == b"docx bytes"
+
+
+def test_memory_tier_evicts_least_recently_used(tmp_path):
+    """Test the in-process tier stays within its byte budget"""
+    cache = _cache(tmp_path, memory_max_bytes=400)
+    cache.set("a1", b"x" * 100)
+    cache.set("b2", b"x" * 100)
+    cache.get("a1")
+    cache.set("c3", b"x" * 100)
+    cache.set("d4", b"x" * 100)
+    cache.set("e5", b"x" * 100)
+
+    assert "a1" in cache._memory
+    assert "b2" not in cache._memory
+    assert cache._memory_bytes <= 400
+
+
+def test_disk_tier_evicts_when_over_budget(tmp_path):
+    """Test the disk tier removes old files when it grows too large"""
+    cache = _cache(tmp_path, disk_max_bytes=250)
+    for i in range(5):
+        cache.set(f"key{i}", b"y" * 100)
+
+    assert cache._scan_disk_bytes() <= 250
+
+
+def test_redis_tier_skips_large_items(tmp_path):
+    """Test oversized artifacts are not pushed to Redis"""
+    redis = MagicMock()
+    cache = _cache(tmp_path, redis=redis, redis_max_item_bytes=10)
+
+    cache.set("small", b"12345")
+    cache.set("large", b"x" * 100)
+
+    redis.client.setex.assert_called_once()
+    assert redis.client.setex.call_args[0][0] == "artifact:small"
+
+
+def test_redis_hit_is_promoted(tmp_path):
+    """Test Redis hits are written to the faster tiers"""
+    redis = MagicMock()
+    redis.client.get.return_value = b"from redis"
+    cache = _cache(tmp_path, redis=redis)
+
+    assert cache.get("remote") == b"from redis"
+
+    redis.client.get.return_value = None
+    assert cache.get("remote") == b"from redis"
+    assert _cache(tmp_path).get("remote") == b"from redis"
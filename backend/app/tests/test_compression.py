@@ -0,0 +1,98 @@
+"""Tests for negotiated response compression"""
+
+import gzip
+
+import brotli
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import PlainTextResponse, Response, StreamingResponse
+from fastapi.testclient import TestClient
+from starlette.requests import Request
+
+from app.core.compression import CompressionMiddleware, cached_body, negotiate
+from app.endpoints.resumes import _gallery_response
+
+TEXT = "Senior Software Engineer at Acme\n" * 200
+
+
+@pytest.fixture
+def compressed_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware)
+
+    @app.get("/text")
+    def text():
+        return PlainTextResponse(TEXT)
+
+    @app.get("/small")
+    def small():
+        return PlainTextResponse("tiny")
+
+    @app.get("/pdf")
+    def pdf():
+        return Response(TEXT.encode(), media_type="application/pdf")
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            (line + "\n" for line in TEXT.splitlines()), media_type="text/plain"
+        )
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip, deflate, br", "br"),
+        ("gzip", "gzip"),
+        ("br;q=0.5, gzip;q=0.8", "gzip"),
+        ("br;q=0, *", "gzip"),
+        ("identity", None),
+        ("", None),
+    ],
+)
+def test_negotiate(header, expected):
+    """Test Accept-Encoding negotiation prefers brotli and honours q-values"""
+    assert negotiate(header) == expected
+
+
+@pytest.mark.parametrize("encoding", ["gzip", "br"])
+def test_text_responses_are_compressed(compressed_client, encoding):
+    """Test text bodies above the threshold are compressed"""
+    response = compressed_client.get("/text", headers={"Accept-Encoding": encoding})
+
+    assert response.headers["content-encoding"] == encoding
+    assert "Accept-Encoding" in response.headers["vary"]
+    assert int(response.headers["content-length"]) < len(TEXT)
+    assert response.text == TEXT
+
+
+def test_small_and_binary_responses_pass_through(compressed_client):
+    """Test bodies under the threshold and PDFs are sent as is"""
+    for path in ("/small", "/pdf"):
+        response = compressed_client.get(path, headers={"Accept-Encoding": "gzip"})
+        assert "content-encoding" not in response.headers
+
+
+def test_streamed_responses_are_compressed(compressed_client):
+    """Test streamed text is compressed chunk by chunk"""
+    response = compressed_client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == TEXT
+
+
+def test_cached_bodies_are_precompressed():
+    """Test cached bodies carry ready-made variants with distinct ETags"""
+    body = cached_body(TEXT.encode())
+    assert brotli.decompress(body.encodings["br"]) == TEXT.encode()
+    assert gzip.decompress(body.encodings["gzip"]) == TEXT.encode()
+
+    request = Request({"type": "http", "headers": [(b"accept-encoding", b"gzip, br")]})
+    response = _gallery_response(request, body, "text/plain")
+
+    assert response.headers["content-encoding"] == "br"
+    assert response.body == body.encodings["br"]
+    assert response.headers["etag"] != body.etag
+    assert cached_body(b"tiny").encodings == {}
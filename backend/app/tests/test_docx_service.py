@@ -1,3 +1,8 @@
+import zipfile
+from io import BytesIO
+
+import pytest
+
 from app.services.docx_service import DOCXService
 
 
@@ -68,3 +73,40 @@ def test_generate_minimal_docx():
 
     assert isinstance(docx_bytes, bytes)
     assert len(docx_bytes) > 0
+
+
+@pytest.mark.parametrize(
+    "resume_data",
+    [
+        {},
+        {
+            "personal_info": {
+                "full_name": "Jane & Co <Ltd>",
+                "email": "jane@example.com",
+                "linkedin": "https://linkedin.com/in/jane",
+                "summary": " Leads teams\tacross time zones\nand ships ",
+            },
+            "experience": [
+                {
+                    "position": "Engineer",
+                    "description": "Line one\r\nLine two",
+                    "achievements": ["Cut costs", ""],
+                }
+            ],
+            "education": [{"degree": "BSc", "gpa": 3.9, "end_date": None}],
+            "skills": [{"name": "Python"}, {"name": "Go"}],
+            "projects": [{"name": "", "description": ""}],
+            "certifications": [{"name": "AWS", "date": None}],
+        },
+    ],
+)
+def test_lean_writer_matches_python_docx(resume_data):
+    """Test every package part is identical to python-docx's output"""
+    reference = BytesIO()
+    DOCXService._build_document(resume_data).save(reference)
+    expected = zipfile.ZipFile(reference)
+    actual = zipfile.ZipFile(BytesIO(DOCXService.generate_resume_docx(resume_data)))
+
+    assert sorted(actual.namelist()) == sorted(expected.namelist())
+    for name in expected.namelist():
+        assert actual.read(name) == expected.read(name), name
@@ -2,6 +2,8 @@
 
 from unittest.mock import patch
 
+from app.services.upload_service import background_uploader
+
 SAMPLE_RESUME = {
     "title": "Test Resume",
     "template": "modern",
@@ -113,6 +115,7 @@ def test_export_uploads_to_supabase(mock_upload, client):
     response = client.get(f"/api/resumes/{resume_id}/export?format=pdf")
 
     assert response.status_code == 200
+    background_uploader.join()
     mock_upload.assert_called_once()
 
 
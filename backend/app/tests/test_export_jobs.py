@@ -0,0 +1,201 @@
+"""Tests for asynchronous export jobs"""
+
+import asyncio
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from fastapi import HTTPException
+from fastapi.responses import FileResponse
+
+from app.core.constants import RenderConfig, ResponseMessages
+from app.core.render_pool import PoolSaturatedError
+from app.endpoints.exports import download_export
+from app.services.export_job_service import (
+    ExportJobService,
+    ExportJobStatus,
+    ExportJobStore,
+)
+from app.services.storage_service import LocalStorageService
+
+RESUME = SimpleNamespace(id=7, title="Test", personal_info={"full_name": "Jane"})
+
+
+def _service():
+    return ExportJobService(ExportJobStore(redis=None))
+
+
+def _mock_export_service(export):
+    service = MagicMock()
+    service.export = export
+    service.cache_key.return_value = "abc123"
+    service.store_pdf.return_value = None
+    return service
+
+
+def test_store_falls_back_to_memory_without_redis():
+    """Test jobs are kept in process memory when Redis is unavailable"""
+    store = ExportJobStore(redis=SimpleNamespace(client=None))
+    store.save({"id": "job1", "status": ExportJobStatus.QUEUED})
+
+    assert store.update("job1", status=ExportJobStatus.RUNNING)["status"] == "running"
+    assert store.get("job1")["status"] == "running"
+    assert store.get("missing") is None
+
+
+def test_memory_fallback_expires_and_is_bounded():
+    """Test jobs kept without Redis expire with the job TTL and evict the oldest"""
+    store = ExportJobStore(redis=None, ttl=60, max_entries=2)
+    for job_id in ("job1", "job2", "job3"):
+        store.save({"id": job_id, "status": ExportJobStatus.QUEUED})
+
+    assert store.get("job1") is None
+    assert store.get("job3")["status"] == ExportJobStatus.QUEUED
+
+    with patch("app.services.export_job_service.time.monotonic", return_value=1e12):
+        assert store.get("job3") is None
+
+
+def test_submit_creates_queued_job():
+    """Test submitting returns a queued job immediately"""
+    service = _service()
+    job = service.submit(RESUME, "pdf", "modern-tech", user_id=3)
+
+    assert job["status"] == ExportJobStatus.QUEUED
+    assert service.store.get(job["id"])["resume_id"] == 7
+
+
+def test_run_marks_job_done_with_timings():
+    """Test a successful job records its artifact key and timings"""
+    service = _service()
+    job = service.submit(RESUME, "txt", "modern-tech", user_id=None)
+    export_service = _mock_export_service(AsyncMock(return_value=b"content"))
+
+    with patch(
+        "app.services.export_job_service.ExportService", return_value=export_service
+    ):
+        asyncio.run(service.run(job["id"], RESUME))
+
+    job = service.store.get(job["id"])
+    assert job["status"] == ExportJobStatus.DONE
+    assert job["artifact_key"] == "abc123"
+    assert job["render_seconds"] is not None
+    assert job["queue_seconds"] is not None
+
+
+def test_run_records_failure():
+    """Test a failing export marks the job as failed"""
+    service = _service()
+    job = service.submit(RESUME, "pdf", "modern-tech", user_id=None)
+    export_service = _mock_export_service(AsyncMock(side_effect=ValueError("boom")))
+
+    with patch(
+        "app.services.export_job_service.ExportService", return_value=export_service
+    ):
+        asyncio.run(service.run(job["id"], RESUME))
+
+    job = service.store.get(job["id"])
+    assert job["status"] == ExportJobStatus.FAILED
+    assert job["error"] == "boom"
+
+
+def test_run_waits_when_pool_saturated():
+    """Test jobs retry instead of failing when the render pool is full"""
+    service = _service()
+    job = service.submit(RESUME, "pdf", "modern-tech", user_id=None)
+    export = AsyncMock(side_effect=[PoolSaturatedError("full"), b"%PDF"])
+    export_service = _mock_export_service(export)
+
+    with (
+        patch(
+            "app.services.export_job_service.ExportService",
+            return_value=export_service,
+        ),
+        patch(
+            "app.services.export_job_service.ExportJobConfig.SATURATED_RETRY_SECONDS", 0
+        ),
+    ):
+        asyncio.run(service.run(job["id"], RESUME))
+
+    assert export.await_count == 2
+    assert service.store.get(job["id"])["status"] == ExportJobStatus.DONE
+
+
+def test_run_marks_lost_render_workers_retryable():
+    """Test a job whose render worker died is failed with a retry hint"""
+    service = _service()
+    job = service.submit(RESUME, "pdf", "modern-tech", user_id=None)
+    export = AsyncMock(side_effect=BrokenProcessPool("worker died"))
+
+    with patch(
+        "app.services.export_job_service.ExportService",
+        return_value=_mock_export_service(export),
+    ):
+        asyncio.run(service.run(job["id"], RESUME))
+
+    job = service.store.get(job["id"])
+    assert job["status"] == ExportJobStatus.FAILED
+    assert job["error"] == ResponseMessages.RENDER_INTERRUPTED
+    assert job["retry_after"] == RenderConfig.RETRY_AFTER_SECONDS
+
+
+def test_download_of_retryable_job_is_unavailable():
+    """Test downloading a job that lost its worker answers 503 with Retry-After"""
+    service = _service()
+    job = service.submit(RESUME, "pdf", "modern-tech", user_id=None)
+    service.store.update(
+        job["id"],
+        status=ExportJobStatus.FAILED,
+        error=ResponseMessages.RENDER_INTERRUPTED,
+        retry_after=5,
+    )
+
+    with patch("app.endpoints.exports.ExportJobService", return_value=service):
+        with pytest.raises(HTTPException) as raised:
+            asyncio.run(download_export(job["id"], current_user=None))
+
+    assert raised.value.status_code == 503
+    assert raised.value.headers == {"Retry-After": "5"}
+
+
+def test_run_stores_finished_pdfs():
+    """Test a finished PDF job records where the PDF was stored"""
+    service = _service()
+    job = service.submit(RESUME, "pdf", "modern-tech", user_id=None)
+    export_service = _mock_export_service(AsyncMock(return_value=b"%PDF"))
+    export_service.store_pdf.return_value = "resumes/7/resume_7_modern-tech.pdf"
+
+    with patch(
+        "app.services.export_job_service.ExportService", return_value=export_service
+    ):
+        asyncio.run(service.run(job["id"], RESUME))
+
+    export_service.store_pdf.assert_called_once_with(RESUME, "modern-tech", b"%PDF")
+    job = service.store.get(job["id"])
+    assert job["stored_filename"] == "resumes/7/resume_7_modern-tech.pdf"
+
+
+def test_download_serves_stored_pdf_without_the_artifact(tmp_path):
+    """Test any worker can serve a finished PDF job from storage"""
+    storage = LocalStorageService(str(tmp_path))
+    filename = "resumes/7/resume_7_modern-tech.pdf"
+    storage.upload_pdf(b"%PDF", filename)
+    service = _service()
+    job = service.submit(RESUME, "pdf", "modern-tech", user_id=None)
+    service.store.update(
+        job["id"],
+        status=ExportJobStatus.DONE,
+        artifact_key="not-on-this-worker",
+        stored_filename=filename,
+    )
+
+    with (
+        patch("app.endpoints.exports.ExportJobService", return_value=service),
+        patch("app.endpoints.exports.StorageService", return_value=storage),
+    ):
+        response = asyncio.run(download_export(job["id"], current_user=None))
+
+    assert isinstance(response, FileResponse)
+    with open(response.path, "rb") as f:
+        assert f.read() == b"%PDF"
@@ -0,0 +1,88 @@
+"""Tests for the streaming text exporters"""
+
+import json
+import re
+
+from app.services import exporters
+from app.services.export_service import ExportService
+
+RESUME = {
+    "personal_info": {
+        "full_name": "Jane Doe",
+        "email": "jane@example.com",
+        "linkedin": "linkedin.com/in/jane",
+        "summary": "Backend engineer",
+    },
+    "experience": [
+        {
+            "position": "Developer",
+            "company": "Acme",
+            "start_date": "2020",
+            "current": True,
+            "description": "Built APIs",
+            "achievements": ["Cut latency 40%"],
+        }
+    ],
+    "skills": [{"name": "Python", "level": "Expert"}, {"name": "SQL"}],
+    "projects": [{"name": "Résumé", "description": "Builder", "link": "x.dev"}],
+}
+
+
+def test_formats_are_registered():
+    """Test every format module registers itself and is accepted by the endpoint"""
+    assert {"txt", "md", "json"} <= set(exporters.EXPORTERS)
+    for fmt in ("pdf", "docx", "txt", "md", "json"):
+        assert re.match(ExportService.FORMAT_PATTERN, fmt)
+    assert not re.match(ExportService.FORMAT_PATTERN, "html")
+
+
+def test_txt_export():
+    """Test the plain text layout"""
+    text = exporters.render(RESUME, "txt").decode("utf-8")
+
+    assert text.startswith("JANE DOE\n========\n\nEmail: jane@example.com\n")
+    assert "PROFESSIONAL SUMMARY\n--------------------\nBackend engineer" in text
+    assert "Developer | Acme\n2020 - Present\nBuilt APIs" in text
+    assert "Python (Expert)\nSQL" in text
+    assert text.endswith("Résumé\nBuilder\nURL: x.dev\n")
+
+
+def test_markdown_export():
+    """Test the Markdown layout"""
+    text = exporters.render(RESUME, "md").decode("utf-8")
+
+    assert text.startswith("# Jane Doe\n\n**Email:** jane@example.com | ")
+    assert "## Experience\n\n### Developer | Acme\n\n*2020 - Present*" in text
+    assert "- Cut latency 40%" in text
+    assert "- Python (Expert)\n- SQL" in text
+
+
+def test_json_resume_export():
+    """Test the JSON Resume mapping"""
+    document = json.loads(exporters.render(RESUME, "json"))
+
+    assert document["basics"]["name"] == "Jane Doe"
+    assert document["basics"]["profiles"] == [
+        {"network": "LinkedIn", "url": "linkedin.com/in/jane"}
+    ]
+    assert document["work"] == [
+        {
+            "name": "Acme",
+            "position": "Developer",
+            "startDate": "2020",
+            "summary": "Built APIs",
+            "highlights": ["Cut latency 40%"],
+        }
+    ]
+    assert document["projects"][0]["name"] == "Résumé"
+    assert document["education"] == []
+
+
+def test_stream_is_chunked():
+    """Test streamed output is batched into chunks and matches the full render"""
+    resume = dict(RESUME, skills=[{"name": f"Skill {i}"} for i in range(5000)])
+    chunks = list(exporters.stream(resume, "txt"))
+
+    assert len(chunks) > 1
+    assert all(len(chunk) < 2 * 16 * 1024 for chunk in chunks)
+    assert b"".join(chunks) == exporters.render(resume, "txt")
@@ -0,0 +1,50 @@
+"""Tests for the bundled font pack configuration"""
+
+import xml.etree.ElementTree as ET
+
+from app.core import fonts
+
+
+def test_fontconfig_aliases_use_bundled_families():
+    """Test every alias in fonts.conf resolves to a family in the manifest"""
+    bundled = {family["family"] for family in fonts.load_manifest()["families"]}
+    root = ET.parse(fonts.FONTCONFIG_FILE).getroot()
+
+    targets = {
+        family.text
+        for alias in root.iter("alias")
+        for tag in ("accept", "prefer")
+        for target in alias.findall(tag)
+        for family in target.iter("family")
+    }
+
+    assert targets
+    assert targets <= bundled
+
+
+def test_configure_falls_back_without_font_files(tmp_path, monkeypatch):
+    """Test system fonts stay in use when the pack has not been fetched"""
+    monkeypatch.delenv("FONTCONFIG_FILE", raising=False)
+    monkeypatch.setattr(fonts, "FONT_FILES_DIR", str(tmp_path))
+
+    assert fonts.configure_fontconfig() is False
+    assert "FONTCONFIG_FILE" not in fonts.os.environ
+
+
+def test_configure_uses_private_fontconfig(tmp_path, monkeypatch):
+    """Test fontconfig is pointed at the pack once every face is present"""
+    monkeypatch.delenv("FONTCONFIG_FILE", raising=False)
+    monkeypatch.setattr(fonts, "FONT_FILES_DIR", str(tmp_path))
+    for name in fonts.expected_font_files():
+        (tmp_path / name).write_bytes(b"")
+
+    assert fonts.configure_fontconfig() is True
+    assert fonts.os.environ["FONTCONFIG_FILE"] == fonts.FONTCONFIG_FILE
+
+
+def test_explicit_fontconfig_file_wins(monkeypatch):
+    """Test an operator-provided FONTCONFIG_FILE is left alone"""
+    monkeypatch.setenv("FONTCONFIG_FILE", "/etc/fonts/custom.conf")
+
+    assert fonts.configure_fontconfig() is False
+    assert fonts.os.environ["FONTCONFIG_FILE"] == "/etc/fonts/custom.conf"
@@ -0,0 +1,69 @@
+"""Tests for the Prometheus metrics endpoint"""
+
+import subprocess
+import sys
+from unittest.mock import patch
+
+import pytest
+
+# Increments a counter in a fresh process writing to a multiprocess directory
+RECORD = """
+from prometheus_client import Counter
+Counter("jobs_total", "Jobs", ["result"]).labels(result="ok").inc(int(sys.argv[1]))
+"""
+RENDER = """
+from app.core.metrics import render_latest
+sys.stdout.write(render_latest().decode())
+"""
+
+
+def _run(code: str, metrics_dir, *args) -> str:
+    env = {"PROMETHEUS_MULTIPROC_DIR": str(metrics_dir), "PATH": ""}
+    result = subprocess.run(
+        [sys.executable, "-c", "import sys\n" + code, *args],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return result.stdout
+
+
+@pytest.fixture
+def token():
+    with patch("app.main.settings.metrics_token", "scrape-secret"):
+        yield "scrape-secret"
+
+
+def test_metrics_disabled_without_a_token(client):
+    """Test /metrics is not served unless a metrics token is configured"""
+    with patch("app.main.settings.metrics_token", ""):
+        response = client.get("/metrics")
+
+    assert response.status_code == 404
+
+
+def test_metrics_require_the_token(client, token):
+    """Test scrapes without the right bearer token are refused"""
+    assert client.get("/metrics").status_code == 401
+    response = client.get("/metrics", headers={"Authorization": "Bearer wrong"})
+    assert response.status_code == 401
+
+
+def test_metrics_render_with_the_token(client, token):
+    """Test an authorized scrape gets the Prometheus text format"""
+    response = client.get("/metrics", headers={"Authorization": f"Bearer {token}"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    assert "# TYPE resumade_uploads_total counter" in response.text
+
+
+def test_multiprocess_scrape_sums_every_worker(tmp_path):
+    """Test one worker's scrape reports samples recorded by the others"""
+    _run(RECORD, tmp_path, "2")
+    _run(RECORD, tmp_path, "3")
+
+    output = _run(RENDER, tmp_path)
+
+    assert 'jobs_total{result="ok"} 5.0' in output
@@ -0,0 +1,199 @@
+"""Tests for the sandboxed PDF import pipeline"""
+
+import asyncio
+import hashlib
+from concurrent.futures.process import BrokenProcessPool
+from io import BytesIO
+from types import SimpleNamespace
+
+import pytest
+from fastapi import UploadFile
+
+from app.core.constants import ImportConfig, RenderConfig, ResponseMessages
+from app.core.render_pool import PoolCpuLimitError
+from app.endpoints.resumes import _import_unavailable
+from app.services.pdf_import import ImportResultStore, import_pdf, read_upload
+from app.services.pdf_parser_service import PDFImportError, PDFParserService
+
+
+def _pdf(pages):
+    """Minimal PDF with one line of Helvetica text per page"""
+    count = len(pages)
+    kids = " ".join(f"{3 + 2 * i} 0 R" for i in range(count))
+    objects = [
+        "<< /Type /Catalog /Pages 2 0 R >>",
+        f"<< /Type /Pages /Kids [{kids}] /Count {count} >>",
+    ]
+    for i, text in enumerate(pages):
+        stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET"
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+            f"/Contents {4 + 2 * i} 0 R /Resources << /Font << /F1 "
+            f"{3 + 2 * count} 0 R >> >> >>"
+        )
+        objects.append(f"<< /Length {len(stream)} >>\nstream\n{stream}\nendstream")
+    objects.append("<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+
+    out = b"%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += f"{number} 0 obj\n{body}\nendobj\n".encode()
+    xref = len(out)
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n".encode()
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets).encode()
+    out += (
+        f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\n"
+        f"startxref\n{xref}\n%%EOF\n"
+    ).encode()
+    return out
+
+
+def _upload(content: bytes) -> UploadFile:
+    return UploadFile(file=BytesIO(content), filename="resume.pdf")
+
+
+def test_text_is_extracted_page_by_page():
+    """Test every page's text is read from bytes or a file"""
+    text = PDFParserService._extract_text_from_pdf(_pdf(["Jane Doe", "Skills"]))
+
+    assert "Jane Doe" in text
+    assert "Skills" in text
+
+
+def test_extraction_stops_once_enough_text_is_read():
+    """Test later pages are skipped once the text budget is reached"""
+    text = PDFParserService._extract_text_from_pdf(
+        _pdf(["First page", "Second page"]), max_chars=5
+    )
+
+    assert "First page" in text
+    assert "Second page" not in text
+
+
+def test_too_many_pages_are_rejected():
+    """Test PDFs over the page limit are refused"""
+    with pytest.raises(PDFImportError):
+        PDFParserService._extract_text_from_pdf(_pdf(["Page"] * 3), max_pages=2)
+    # Passed through as is, not wrapped like parse failures
+    with pytest.raises(PDFImportError):
+        PDFParserService.parse_resume_pdf(_pdf(["Page"] * (ImportConfig.MAX_PAGES + 1)))
+
+
+def test_upload_is_read_and_hashed():
+    """Test the received upload is read once and fingerprinted"""
+    content = _pdf(["Jane Doe"])
+    received = asyncio.run(read_upload(_upload(content)))
+
+    assert received.content == content
+    assert received.sha256 == hashlib.sha256(content).hexdigest()
+
+
+@pytest.mark.parametrize(
+    "content, max_bytes",
+    [
+        (b"%PDF-1.4\n" + b"0" * 200_000, 100_000),  # Over the limit
+        (b"<html>not a pdf</html>", 100_000),
+        (b"", 100_000),
+    ],
+)
+def test_rejected_uploads(content, max_bytes):
+    """Test oversized and non-PDF uploads are refused"""
+    with pytest.raises(PDFImportError):
+        asyncio.run(read_upload(_upload(content), max_bytes=max_bytes))
+
+
+def _counting_pool(monkeypatch):
+    """Run imports in-process, counting how many reach the pool"""
+    calls = []
+
+    async def run(func, *args):
+        calls.append(args)
+        return func(*args)
+
+    monkeypatch.setattr("app.services.pdf_import.import_pool", SimpleNamespace(run=run))
+    return calls
+
+
+def test_repeated_uploads_are_parsed_once(monkeypatch):
+    """Test the same bytes are served from the store the second time"""
+    calls = _counting_pool(monkeypatch)
+    store = ImportResultStore()
+    content = _pdf(["Jane Doe"])
+
+    first = asyncio.run(import_pdf(_upload(content), store))
+    first["personal_info"]["full_name"] = "Changed"
+    second = asyncio.run(import_pdf(_upload(content), store))
+    asyncio.run(import_pdf(_upload(_pdf(["John Roe"])), store))
+
+    assert len(calls) == 2
+    assert second["personal_info"]["full_name"] == "Jane Doe"
+
+
+def _failing_pool(monkeypatch, error):
+    async def run(func, *args):
+        raise error
+
+    monkeypatch.setattr("app.services.pdf_import.import_pool", SimpleNamespace(run=run))
+
+
+def test_imports_over_their_cpu_budget_are_too_complex(monkeypatch):
+    """Test an upload that used up its CPU time is rejected as too complex"""
+    _failing_pool(monkeypatch, PoolCpuLimitError("Job exceeded its CPU time limit"))
+
+    with pytest.raises(PDFImportError, match=ResponseMessages.IMPORT_TOO_COMPLEX):
+        asyncio.run(import_pdf(_upload(_pdf(["Jane Doe"])), ImportResultStore()))
+
+
+def test_imports_lost_with_a_worker_ask_clients_to_retry(monkeypatch):
+    """Test an upload lost with a dead worker maps to a 503, not a rejection"""
+    _failing_pool(monkeypatch, BrokenProcessPool("worker died"))
+
+    with pytest.raises(BrokenProcessPool) as lost:
+        asyncio.run(import_pdf(_upload(_pdf(["Jane Doe"])), ImportResultStore()))
+    error = _import_unavailable(lost.value)
+
+    assert error.status_code == 503
+    assert error.detail == ResponseMessages.IMPORT_INTERRUPTED
+    assert error.headers == {"Retry-After": str(RenderConfig.RETRY_AFTER_SECONDS)}
+
+
+class _SharedRedis:
+    """Stands in for the Redis cache shared by every worker"""
+
+    def __init__(self):
+        self.client = object()
+        self.items = {}
+
+    def get(self, key):
+        return self.items.get(key)
+
+    def set(self, key, value, ttl):
+        self.items[key] = value
+        return True
+
+
+def test_parser_version_is_part_of_the_key():
+    """Test results stored by another parser version are not returned"""
+    redis = _SharedRedis()
+    ImportResultStore(redis, version=1).save("abc", {"skills": []})
+
+    assert ImportResultStore(redis, version=1).get("abc") == {"skills": []}
+    assert ImportResultStore(redis, version=2).get("abc") is None
+
+
+def test_local_results_expire_and_are_capped(monkeypatch):
+    """Test entries past their TTL are dropped and the oldest are evicted"""
+    now = [1000.0]
+    monkeypatch.setattr("app.services.pdf_import.time.monotonic", lambda: now[0])
+    store = ImportResultStore(ttl=60, max_entries=2)
+
+    store.save("a", {"n": 1})
+    store.save("b", {"n": 2})
+    store.get("a")
+    store.save("c", {"n": 3})
+    assert store.get("b") is None  # Least recently used
+    assert store.get("a") == {"n": 1}
+
+    now[0] += 61
+    assert store.get("c") is None
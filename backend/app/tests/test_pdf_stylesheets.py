@@ -0,0 +1,45 @@
+"""Tests for splitting template stylesheets into static and customization parts"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.pdf_service import PDFService
+from app.services.pdf_stylesheets import split_stylesheet
+from app.services.template_registry import template_registry
+
+
+def _render(template_file, customization):
+    resume = SimpleNamespace(
+        title="Resume",
+        personal_info={"full_name": "Jane Doe", "email": "jane@example.com"},
+        experience=[],
+        education=[],
+        skills=[{"name": "Python"}],
+        certifications=[],
+        projects=[],
+        customization=customization,
+    )
+    return template_registry.get(template_file).render(
+        resume=resume, section_order=["summary", "skills"], custom_sections=[]
+    )
+
+
+@pytest.mark.parametrize("template_file", sorted(set(PDFService.TEMPLATES.values())))
+def test_static_css_shared_across_customizations(template_file):
+    """Test only the :root block changes between customized resumes"""
+    default = split_stylesheet(_render(template_file, None))
+    custom = split_stylesheet(
+        _render(template_file, {"primary_color": "#ff0000", "font_size": "12"})
+    )
+
+    assert default[1] == custom[1]
+    assert default[1].strip()
+    assert "#ff0000" in custom[2] and "#ff0000" not in custom[1]
+    assert custom[2].startswith(":root")
+    assert "<style>" not in custom[0]
+
+
+def test_split_without_style_block():
+    """Test HTML without a stylesheet is passed through unchanged"""
+    assert split_stylesheet("<p>Hi</p>") == ("<p>Hi</p>", "", "")
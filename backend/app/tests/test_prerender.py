@@ -0,0 +1,71 @@
+"""Tests for speculative renders after resume edits"""
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from app.services.prerender_service import SpeculativeRenderer
+
+RESUME = SimpleNamespace(id=3, title="Resume", template="modern-tech", personal_info={})
+
+
+def _renderer(pool_has_capacity=True):
+    pool = MagicMock()
+    pool.has_capacity.return_value = pool_has_capacity
+    return SpeculativeRenderer(pool=pool, debounce_seconds=0.05)
+
+
+def _run(renderer, schedule):
+    """Start the renderer on a loop, schedule edits and wait for renders"""
+    export = AsyncMock(return_value=b"%PDF")
+
+    async def scenario():
+        renderer.start()
+        schedule()
+        await asyncio.sleep(0.2)
+        renderer.shutdown()
+
+    with patch("app.services.prerender_service.ExportService") as service:
+        service.return_value.export = export
+        asyncio.run(scenario())
+    return export
+
+
+def test_rapid_edits_render_once():
+    """Test a burst of autosaves from one user is coalesced into one render"""
+    renderer = _renderer()
+
+    def edit_three_times():
+        for _ in range(3):
+            renderer.schedule(RESUME, user_id=1)
+
+    export = _run(renderer, edit_three_times)
+
+    export.assert_awaited_once()
+    assert export.await_args.args[1:] == ("pdf", "modern-tech")
+
+
+def test_users_are_rendered_separately():
+    """Test edits by different users are not coalesced together"""
+    renderer = _renderer()
+    other = SimpleNamespace(**{**vars(RESUME), "id": 4})
+
+    def edit_both():
+        renderer.schedule(RESUME, user_id=1)
+        renderer.schedule(other, user_id=2)
+
+    assert _run(renderer, edit_both).await_count == 2
+
+
+def test_busy_pool_skips_speculative_work():
+    """Test nothing is rendered when interactive exports need the pool"""
+    renderer = _renderer(pool_has_capacity=False)
+
+    export = _run(renderer, lambda: renderer.schedule(RESUME, user_id=1))
+
+    export.assert_not_awaited()
+
+
+def test_schedule_is_a_noop_before_start():
+    """Test edits are ignored when no event loop is bound"""
+    assert _renderer().schedule(RESUME, user_id=1) is False
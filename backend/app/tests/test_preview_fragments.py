@@ -0,0 +1,65 @@
+"""Tests for section-fragment live preview rendering"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.pdf_service import PDFService
+from app.services.preview_fragments import FragmentRenderer
+from app.services.template_registry import template_registry
+
+
+def _resume(**overrides):
+    fields = dict(
+        id=0,
+        title="Resume",
+        personal_info={"full_name": "Jane Doe", "summary": "Engineer"},
+        experience=[{"position": "Developer", "company": "Acme"}],
+        education=[{"degree": "BSc", "institution": "MIT"}],
+        skills=[{"name": "Python", "level": "Expert"}],
+        certifications=[{"name": "AWS", "issuer": "Amazon"}],
+        projects=[{"name": "Site", "technologies": ["Vue"]}],
+        customization={},
+        custom_sections=[{"title": "Talks", "items": [{"title": "PyCon"}]}],
+    )
+    fields.update(overrides)
+    return SimpleNamespace(**fields)
+
+
+def _render(renderer, template_file, resume):
+    return renderer.render(template_file, PDFService._template_context(resume))
+
+
+@pytest.mark.parametrize("template_file", sorted(set(PDFService.TEMPLATES.values())))
+def test_fragments_match_full_render(template_file):
+    """Test assembled pages are identical to rendering the whole template"""
+    resume = _resume()
+    full = template_registry.get(template_file).render(
+        **PDFService._template_context(resume)
+    )
+    renderer = FragmentRenderer()
+
+    assert _render(renderer, template_file, resume) == full
+    # Second render comes entirely from cached fragments
+    assert _render(renderer, template_file, resume) == full
+
+
+def test_only_changed_section_is_rerendered():
+    """Test editing one section leaves the other fragments cached"""
+    renderer = FragmentRenderer()
+    _render(renderer, "modern-tech.html", _resume())
+    cached = set(renderer._fragments)
+
+    edited = _resume(skills=[{"name": "Go", "level": "Advanced"}])
+    html = _render(renderer, "modern-tech.html", edited)
+
+    assert "Go" in html
+    assert len(set(renderer._fragments) - cached) == 1
+
+
+def test_fragment_cache_is_bounded():
+    """Test the least recently used fragments are evicted"""
+    renderer = FragmentRenderer(max_fragments=3)
+    _render(renderer, "modern-tech.html", _resume())
+
+    assert len(renderer._fragments) == 3
@@ -0,0 +1,141 @@
+"""Tests for the live preview WebSocket channel"""
+
+import time
+from unittest.mock import patch
+
+import pytest
+from starlette.websockets import WebSocketDisconnect
+
+from app.core.constants import PreviewConfig
+
+from app.services.preview_fragments import FragmentRenderer
+from app.services.preview_session import (
+    FRAGMENT_START,
+    PreviewSession,
+    merge_patch,
+    preview_sessions,
+)
+
+RESUME = {
+    "template_name": "modern-tech",
+    "personal_info": {"full_name": "Jane Doe", "summary": "Engineer"},
+    "experience": [{"position": "Developer", "company": "Acme"}],
+    "skills": [{"name": "Python", "level": "Expert"}],
+}
+
+
+def _session():
+    session = PreviewSession(FragmentRenderer())
+    session.reset(RESUME)
+    return session
+
+
+def test_merge_patch_merges_objects_and_replaces_lists():
+    """Test RFC 7396 semantics"""
+    patched = merge_patch(
+        RESUME, {"personal_info": {"summary": None}, "skills": [{"name": "Go"}]}
+    )
+
+    assert patched["personal_info"] == {"full_name": "Jane Doe"}
+    assert patched["skills"] == [{"name": "Go"}]
+    assert RESUME["personal_info"]["summary"] == "Engineer"
+
+
+def test_first_render_sends_delimited_document():
+    """Test the initial render is a whole document with marked fragments"""
+    message = _session().render()
+
+    assert message["type"] == "document"
+    assert message["version"] == 1
+    assert FRAGMENT_START.format("experience") in message["html"]
+
+
+def test_patch_sends_only_changed_fragments():
+    """Test editing one section pushes just that section"""
+    session = _session()
+    session.render()
+
+    session.apply({"skills": [{"name": "Go", "level": "Advanced"}]})
+    message = session.render()
+
+    assert message["type"] == "fragments"
+    assert list(message["fragments"]) == ["skills"]
+    assert "Go" in message["fragments"]["skills"]
+    assert session.render() is None
+
+
+def test_template_change_resends_document():
+    """Test changes outside the fragments send the whole document"""
+    session = _session()
+    session.render()
+
+    session.apply({"template_name": "professional-blue"})
+
+    assert session.render()["type"] == "document"
+
+
+def test_websocket_round_trip(client):
+    """Test init and patch messages over the socket"""
+    with client.websocket_connect("/api/resumes/preview/ws") as ws:
+        ws.send_json({"type": "init", "resume": RESUME})
+        assert ws.receive_json()["type"] == "document"
+
+        ws.send_json({"type": "patch", "patch": {"experience": []}})
+        message = ws.receive_json()
+        assert message["type"] == "fragments"
+        assert list(message["fragments"]) == ["experience"]
+
+        ws.send_json({"type": "bogus"})
+        assert ws.receive_json()["type"] == "error"
+
+
+def test_websocket_rejects_payloads_that_are_not_objects(client):
+    """Test non-object init and patch payloads get an error frame, not a dropped socket"""
+    with client.websocket_connect("/api/resumes/preview/ws") as ws:
+        ws.send_json({"type": "init", "resume": []})
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"type": "init", "resume": [1, 2]})
+        assert ws.receive_json()["type"] == "error"
+        ws.send_json({"type": "patch", "patch": "text"})
+        assert ws.receive_json()["type"] == "error"
+
+        ws.send_json({"type": "init", "resume": RESUME})
+        assert ws.receive_json()["type"] == "document"
+
+
+def test_websocket_rejects_sessions_over_cap(client):
+    """Test connections beyond the per-worker cap are turned away"""
+    limit = preview_sessions.limit
+    preview_sessions.limit = 0
+    try:
+        with pytest.raises(WebSocketDisconnect):
+            with client.websocket_connect("/api/resumes/preview/ws") as ws:
+                ws.receive_json()
+    finally:
+        preview_sessions.limit = limit
+
+
+def test_websocket_limits_message_bytes_not_characters(client):
+    """Test a message under the limit in characters but over it in bytes is refused"""
+    name = "é" * (PreviewConfig.MAX_MESSAGE_BYTES // 2)
+    with client.websocket_connect("/api/resumes/preview/ws") as ws:
+        ws.send_json({"type": "patch", "patch": {"personal_info": {"full_name": name}}})
+        with pytest.raises(WebSocketDisconnect) as closed:
+            ws.receive_json()
+
+    assert closed.value.code == 1009
+
+
+def test_websocket_renders_each_session_at_most_once_per_interval(client):
+    """Test an edit right after a render waits out the session's render interval"""
+    interval = 0.5
+    with patch.object(PreviewConfig, "MIN_RENDER_INTERVAL_SECONDS", interval):
+        with client.websocket_connect("/api/resumes/preview/ws") as ws:
+            started = time.monotonic()
+            ws.send_json({"type": "init", "resume": RESUME})
+            assert ws.receive_json()["type"] == "document"
+
+            ws.send_json({"type": "patch", "patch": {"experience": []}})
+            assert ws.receive_json()["type"] == "fragments"
+
+            assert time.monotonic() - started >= interval
@@ -0,0 +1,57 @@
+"""Tests for per-stage render instrumentation"""
+
+import logging
+from unittest.mock import patch
+
+from app.core.metrics import sample_value
+from app.core.render_metrics import RenderTrace, resume_size
+
+STAGES = "resumade_render_stage_seconds_count"
+SIZES = "resumade_render_output_bytes_count"
+
+
+def test_trace_records_stages_and_size():
+    """Test every stage, the total and the output size are observed"""
+    labels = {"format": "pdf", "template": "academic-research"}
+    before = {
+        stage: sample_value(STAGES, stage=stage, **labels)
+        for stage in ("template", "layout", "total")
+    }
+    sizes_before = sample_value(SIZES, **labels)
+    trace = RenderTrace("pdf", "academic-research")
+    with trace.stage("template"):
+        pass
+    trace.add("layout", 0.2)
+    trace.finish(b"x" * 2048)
+
+    for stage, count in before.items():
+        assert sample_value(STAGES, stage=stage, **labels) == count + 1
+    assert sample_value(SIZES, **labels) == sizes_before + 1
+
+
+def test_non_pdf_formats_share_one_template_label():
+    """Test DOCX and TXT renders are not split by template"""
+    assert RenderTrace("docx", "modern-tech").template == "default"
+    assert RenderTrace("pdf", "modern-tech").template == "modern-tech"
+
+
+def test_unknown_templates_share_one_label():
+    """Test names from request parameters cannot add label values"""
+    assert RenderTrace("pdf", "<script>").template == "unknown"
+    assert RenderTrace("pdf", None).template == "unknown"
+
+
+def test_slow_render_is_logged_with_resume_size(caplog):
+    """Test slow renders log a breakdown including the resume size"""
+    resume = {"personal_info": {"full_name": "Jane"}, "experience": [{"a": 1}]}
+    trace = RenderTrace("docx", resume=resume)
+    trace.add("build", 3)
+
+    with patch("app.core.render_metrics.RenderConfig.SLOW_RENDER_SECONDS", 0):
+        with caplog.at_level(logging.WARNING, logger="app.core.render_metrics"):
+            trace.finish(b"docx")
+
+    record = caplog.records[-1]
+    assert record.render["build_seconds"] == 3
+    assert record.render["resume_bytes"] == resume_size(resume)
+    assert "Slow render format=docx" in record.getMessage()
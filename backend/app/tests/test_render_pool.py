@@ -0,0 +1,180 @@
+"""Tests for the out-of-process render pool"""
+
+import asyncio
+import resource
+import time
+
+import pytest
+
+from app.core.render_pool import (
+    ProcessWorkerPool,
+    PoolCpuLimitError,
+    PoolSaturatedError,
+    PoolTimeoutError,
+    _call_with_cpu_limit,
+)
+from app.services.pdf_parser_service import parse_resume_upload
+
+
+def _spin():
+    while True:
+        pass
+
+
+def _make_pool(**overrides):
+    options = {
+        "name": "test",
+        "max_workers": 1,
+        "max_queue": 0,
+        "timeout": 10,
+        "max_tasks_per_child": 2,
+    }
+    options.update(overrides)
+    return ProcessWorkerPool(**options)
+
+
+def test_run_returns_worker_result():
+    """Test jobs run in a worker process and return their result"""
+    pool = _make_pool()
+    try:
+        assert asyncio.run(pool.run(pow, 2, 10)) == 1024
+        assert pool.in_flight == 0
+    finally:
+        pool.shutdown()
+
+
+def test_workers_are_recycled():
+    """Test the pool keeps working after workers hit their task limit"""
+    pool = _make_pool(max_tasks_per_child=1)
+
+    async def run_many():
+        return [await pool.run(pow, 3, n) for n in range(4)]
+
+    try:
+        assert asyncio.run(run_many()) == [1, 3, 9, 27]
+    finally:
+        pool.shutdown()
+
+
+def test_saturated_pool_rejects_jobs():
+    """Test backpressure when all workers and queue slots are taken"""
+    pool = _make_pool()
+
+    async def run_concurrently():
+        first = asyncio.ensure_future(pool.run(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(PoolSaturatedError):
+            await pool.run(pow, 2, 2)
+        await first
+
+    try:
+        asyncio.run(run_concurrently())
+        assert pool.has_capacity()
+    finally:
+        pool.shutdown()
+
+
+def test_timeout_restarts_pool():
+    """Test hung jobs time out and the pool recovers"""
+    pool = _make_pool(timeout=0.5)
+
+    async def run_with_timeout():
+        with pytest.raises(PoolTimeoutError):
+            await pool.run(time.sleep, 5)
+        return await pool.run(pow, 2, 3)
+
+    try:
+        assert asyncio.run(run_with_timeout()) == 8
+    finally:
+        pool.shutdown()
+
+
+def _sleep_and_return(seconds, value):
+    time.sleep(seconds)
+    return value
+
+
+def test_jobs_killed_with_a_hung_job_are_retried():
+    """Test a timeout only fails the hung job, not others on the same executor"""
+    pool = _make_pool(max_workers=2, timeout=3)
+
+    async def run_alongside_hung_job():
+        hung = asyncio.ensure_future(pool.run(time.sleep, 30))
+        # Still running when the hung job times out and the executor is killed
+        await asyncio.sleep(1.5)
+        result = await pool.run(_sleep_and_return, 2, "done")
+        with pytest.raises(PoolTimeoutError):
+            await hung
+        return result
+
+    try:
+        pool.start()
+        assert asyncio.run(run_alongside_hung_job()) == "done"
+    finally:
+        pool.shutdown()
+
+
+def test_cpu_limit_is_lifted_after_each_job():
+    """Test the per-job CPU limit does not outlive the job"""
+    before = resource.getrlimit(resource.RLIMIT_CPU)
+
+    assert _call_with_cpu_limit(60, pow, 2, 3) == 8
+    assert resource.getrlimit(resource.RLIMIT_CPU) == before
+
+
+def test_cpu_limit_stops_runaway_job():
+    """Test a job over its CPU budget fails alone and its worker keeps serving"""
+    pool = _make_pool(cpu_limit_seconds=1)
+
+    async def run_runaway():
+        with pytest.raises(PoolCpuLimitError):
+            await pool.run(_spin)
+        executor = pool._executor
+        return await pool.run(pow, 2, 3), pool._executor is executor
+
+    try:
+        assert asyncio.run(run_runaway()) == (8, True)
+    finally:
+        pool.shutdown()
+
+
+def _loaded(module):
+    import sys
+
+    return module in sys.modules
+
+
+def test_spawned_workers_import_their_preload():
+    """Test spawned workers import preload modules, not the server's"""
+    pool = _make_pool(preload=["colorsys"], start_method="spawn")
+
+    async def check():
+        return await pool.run(_loaded, "colorsys"), await pool.run(
+            _loaded, "weasyprint"
+        )
+
+    try:
+        assert asyncio.run(check()) == (True, False)
+    finally:
+        pool.shutdown()
+
+
+def test_import_workers_do_not_load_server_services():
+    """Test the PDF parser imports without the app's services, storage or cache"""
+    # Imported here so the worker does not import the test module's dependencies
+    from app.tests.test_pdf_import import _pdf
+
+    pool = _make_pool(start_method="spawn")
+
+    async def check():
+        result = await pool.run(parse_resume_upload, _pdf(["Jane Doe"]))
+        assert "personal_info" in result
+        return [
+            await pool.run(_loaded, module)
+            for module in ("app.services.pdf_service", "app.core.cache")
+        ]
+
+    try:
+        assert asyncio.run(check()) == [False, False]
+    finally:
+        pool.shutdown()
@@ -0,0 +1,56 @@
+"""Tests for date recognition in resume imports"""
+
+from datetime import date
+
+import pytest
+from dateutil import parser as date_parser
+
+from app.services.resume_dates import _parse_date, date_text, parse_date_range
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "Jan 2020",
+        "January, 2020",
+        "sept. 2019",
+        "2018 Oct",
+        "03/2018",
+        "3/2018",
+        "2021",
+        "June 5, 2017",
+        "Spring 2016",
+    ],
+)
+def test_matches_dateutil(text):
+    """Test recognized layouts give the same year and month as fuzzy dateutil"""
+    expected = date_parser.parse(text, fuzzy=True).strftime("%Y-%m")
+    assert date_text(text) == expected
+
+
+def test_missing_month_comes_from_today():
+    """Test a bare year takes today's month, as dateutil's default does"""
+    assert _parse_date("2020", date(2026, 1, 15)) == date(2020, 1, 1)
+    assert _parse_date("2020", date(2026, 7, 15)) == date(2020, 7, 1)
+
+
+def test_undated_text_falls_back_to_a_year():
+    """Test text dateutil cannot read yields a bare year or nothing"""
+    assert date_text("Present") == ""
+    assert date_text("Class of 2019 honours", "%Y") == "2019"
+
+
+@pytest.mark.parametrize(
+    "text, expected",
+    [
+        ("Jan 2020 - Present", ("2020-01", "Present", True)),
+        ("Mar 2018 – Dec 2019", ("2018-03", "2019-12", False)),
+        ("06/2015 - 08/2017", ("2015-06", "2017-08", False)),
+        ("Oct 2019 - Nov 2021", ("2019-10", "2021-11", False)),
+        ("Sept. 2019 – Present", ("2019-09", "Present", True)),
+        ("September 2018 to June 2020", ("2018-09", "2020-06", False)),
+    ],
+)
+def test_parse_date_range(text, expected):
+    """Test common date ranges"""
+    assert parse_date_range(text) == expected
@@ -0,0 +1,85 @@
+"""Tests for the shared normalized resume representation"""
+
+import copy
+import json
+import pickle
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.ats import ATSService
+from app.services import exporters
+from app.services.resume_document import Record, ResumeDocument
+
+RESUME_DATA = {
+    "id": 7,
+    "template_name": "modern-tech",
+    "title": "Resume",
+    "personal_info": {"full_name": "Jane Doe", "summary": "Built APIs"},
+    "experience": [
+        {"position": "Developer", "company": "Acme", "achievements": ["Led"]}
+    ],
+    "skills": [{"name": "Python"}],
+    "projects": None,
+}
+
+
+def test_sources_build_the_same_document():
+    """Test dicts and ORM-like objects share one content hash"""
+    from_dict = ResumeDocument.of(RESUME_DATA)
+    from_object = ResumeDocument.of(
+        SimpleNamespace(
+            id=7,
+            template="modern-tech",
+            **{
+                k: v for k, v in RESUME_DATA.items() if k not in ("id", "template_name")
+            },
+        )
+    )
+
+    assert from_dict.content_hash == from_object.content_hash
+    assert from_dict.template == from_object.template == "modern-tech"
+    assert ResumeDocument.of(from_dict) is from_dict
+
+
+def test_sections_are_normalized_and_read_only():
+    """Test missing sections are empty and records cannot be changed"""
+    document = ResumeDocument.of(RESUME_DATA)
+
+    assert document.projects == ()
+    assert document.education == ()
+    assert document.customization == {}
+    assert document.experience[0]["achievements"] == ("Led",)
+    with pytest.raises(TypeError):
+        document.experience[0]["position"] = "Manager"
+    with pytest.raises(AttributeError):
+        document.title = "Other"
+
+
+def test_records_behave_like_plain_data():
+    """Test records survive JSON encoding, copying and pickling"""
+    record = ResumeDocument.of(RESUME_DATA).experience[0]
+
+    assert json.loads(json.dumps(record))["company"] == "Acme"
+    assert copy.deepcopy(record) == record
+    assert isinstance(pickle.loads(pickle.dumps(record)), Record)
+
+
+def test_text_holds_values_not_keys():
+    """Test keyword text is built from values only"""
+    text = ResumeDocument.of(RESUME_DATA).text
+
+    assert "jane doe" in text
+    assert "python" in text
+    assert "full_name" not in text
+
+
+def test_consumers_accept_documents():
+    """Test scorers and exporters give the same result for dict and document"""
+    document = ResumeDocument.of(RESUME_DATA)
+
+    assert (
+        ATSService.calculate_ats_score(document)["score"]
+        == ATSService.calculate_ats_score(RESUME_DATA)["score"]
+    )
+    assert b"JANE DOE" in exporters.render(document, "txt")
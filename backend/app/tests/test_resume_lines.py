@@ -0,0 +1,73 @@
+"""Tests for single-pass resume line tagging"""
+
+from app.services.pdf_parser_service import PDFParserService
+from app.services.resume_lines import Line, tag_lines
+
+
+def test_blank_lines_are_dropped_and_text_stripped():
+    """Test only non-empty, stripped lines are tagged"""
+    lines = tag_lines("  Jane Doe \n\n   \nSkills\n")
+
+    assert [line.text for line in lines] == ["Jane Doe", "Skills"]
+    assert [line.words for line in lines] == [2, 1]
+
+
+def test_headers_are_short_lines_with_a_keyword():
+    """Test section keywords only mark lines of four words or fewer"""
+    assert Line("WORK EXPERIENCE").section == "experience"
+    assert Line("Technical Skills").section == "skills"
+    assert Line("Licenses & Credentials").section == "certifications"
+    assert Line("Led work on five teams").section is None
+    assert Line("Jane Doe").section is None
+
+
+def test_sections_are_tried_in_order():
+    """Test a header naming two sections belongs to the first one tried"""
+    assert Line("Academic Work").section == "experience"
+    assert Line("Personal Projects").section == "projects"
+
+
+def test_features_are_read_from_the_line():
+    """Test the date, degree and link tags"""
+    dated = Line("Jan 2020 - Present")
+    assert dated.has_year and dated.has_range_separator
+    assert dated.has_short_range_separator
+
+    assert not Line("Toronto office lead").has_range_separator
+    assert Line("2018 to 2020").has_short_range_separator
+    assert Line("2018 To 2020").has_short_range_separator
+    assert Line("2021 until present").has_range_separator
+    assert not Line("Current team of 12, hired 2021").has_range_separator
+
+    assert Line("Bachelor of Science").is_degree
+    assert not Line("Computer Science").is_degree
+    assert Line("Code: https://github.com/x/y").url == "https://github.com/x/y"
+    assert Line("Mail jane@example.com").email == "jane@example.com"
+    assert Line("No contact here").email == ""
+
+
+def test_find_sections_groups_lines_by_header():
+    """Test lines before the first header are left out of every section"""
+    sections = PDFParserService._find_sections(
+        tag_lines("Jane Doe\nExperience\nEngineer\nAcme\nSkills\nPython\nEducation")
+    )
+
+    assert {
+        name: [line.text for line in lines] for name, lines in sections.items()
+    } == {
+        "experience": ["Engineer", "Acme"],
+        "skills": ["Python"],
+    }
+
+
+def test_sentences_starting_with_current_stay_in_their_entry():
+    """Test a capitalized "Current" in a description does not start an entry"""
+    lines = tag_lines(
+        "2019 - 2023\nSoftware Engineer\nAcme\nLed the platform team\n"
+        "Current team of 12, hired 2021"
+    )
+
+    experience = PDFParserService._extract_experience(lines)
+
+    assert len(experience) == 1
+    assert "Current team of 12" in experience[0]["description"]
@@ -0,0 +1,136 @@
+"""Tests for serving stored exports through signed storage URLs"""
+
+import os
+from concurrent.futures.process import BrokenProcessPool
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from starlette.requests import Request
+
+from app.core.constants import RenderConfig
+from app.endpoints.resumes import _render_unavailable, _stored_artifact_response
+from app.services.export_service import ExportService
+from app.services.storage_service import LocalStorageService
+
+RESUME = SimpleNamespace(
+    id=5,
+    title="Resume",
+    personal_info={"full_name": "Jane Doe"},
+    experience=[],
+    education=[],
+    skills=[],
+    certifications=[],
+    projects=[],
+)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return LocalStorageService(str(tmp_path / "bucket"))
+
+
+@pytest.fixture
+def export_service(storage):
+    with patch("app.services.pdf_service.StorageService", return_value=storage):
+        yield ExportService()
+
+
+def _request(accept):
+    return Request({"type": "http", "headers": [(b"accept", accept.encode())]})
+
+
+def test_local_storage_round_trip(storage):
+    """Test the filesystem stand-in behaves like the Supabase bucket"""
+    assert storage.upload_pdf(b"%PDF-1.7", "resume_1_modern.pdf") is True
+    assert storage.pdf_exists("resume_1_modern.pdf")
+    assert storage.download_pdf("resume_1_modern.pdf") == b"%PDF-1.7"
+    assert storage.create_signed_url("resume_1_modern.pdf", 60).startswith("file://")
+    assert storage.delete_pdf("resume_1_modern.pdf") is True
+    assert storage.create_signed_url("resume_1_modern.pdf", 60) is None
+
+
+def test_stored_pdf_url_requires_current_content(export_service, storage):
+    """Test a signed URL is only issued for a PDF of the current content"""
+    assert export_service.stored_pdf_url(RESUME, "modern-tech") is None
+
+    key = export_service.cache_key(RESUME, "pdf", "modern-tech")
+    filename = storage.generate_pdf_filename(RESUME.id, "modern-tech", key)
+    storage.upload_pdf(b"%PDF-1.7", filename)
+
+    assert "expires=" in export_service.stored_pdf_url(RESUME, "modern-tech")
+
+    edited = SimpleNamespace(**{**vars(RESUME), "title": "Edited"})
+    assert export_service.stored_pdf_url(edited, "modern-tech") is None
+
+
+def test_store_pdf_uploads_the_current_content_once(export_service, storage):
+    """Test storing a PDF puts it where stored_pdf_url looks and skips re-uploads"""
+    filename = export_service.store_pdf(RESUME, "modern-tech", b"%PDF-1.7")
+
+    assert "expires=" in export_service.stored_pdf_url(RESUME, "modern-tech")
+    with patch.object(storage, "upload_pdf") as upload:
+        assert export_service.store_pdf(RESUME, "modern-tech", b"%PDF-1.7") == filename
+    upload.assert_not_called()
+
+
+def test_guest_resumes_are_never_looked_up(export_service):
+    """Test guest renders (id 0) never get a stored URL"""
+    guest = SimpleNamespace(**{**vars(RESUME), "id": 0})
+
+    assert export_service.stored_pdf_url(guest, "modern-tech") is None
+
+
+def test_stored_artifact_response_negotiates():
+    """Test browsers are redirected while API clients get JSON"""
+    redirect = _stored_artifact_response(_request("*/*"), "https://cdn/x.pdf")
+    assert redirect.status_code == 307
+    assert redirect.headers["location"] == "https://cdn/x.pdf"
+
+    payload = _stored_artifact_response(
+        _request("application/json"), "https://cdn/x.pdf"
+    )
+    assert payload.data["url"] == "https://cdn/x.pdf"
+    assert payload.data["expires_in"] > 0
+
+
+def test_local_backend_shards_objects(storage, tmp_path):
+    """Test stored files are spread over hashed subdirectories"""
+    filename = storage.generate_pdf_filename(9, "modern-tech")
+    storage.upload_pdf(b"%PDF-1.7", filename)
+
+    path = storage.local_path(filename)
+    relative = os.path.relpath(path, tmp_path / "bucket").split(os.sep)
+    assert len(relative[0]) == 2 and len(relative[1]) == 2
+    assert "/".join(relative[2:]) == filename
+    assert list(storage.list_stored_pdfs()) == [filename]
+
+
+def test_stored_pdf_path_for_local_backend(export_service, storage):
+    """Test PDFs on local disk can be sent as files instead of redirects"""
+    assert export_service.stored_pdf_path(RESUME, "modern-tech") is None
+
+    key = export_service.cache_key(RESUME, "pdf", "modern-tech")
+    filename = storage.generate_pdf_filename(RESUME.id, "modern-tech", key)
+    storage.upload_pdf(b"%PDF-1.7", filename)
+
+    with open(export_service.stored_pdf_path(RESUME, "modern-tech"), "rb") as f:
+        assert f.read() == b"%PDF-1.7"
+
+
+def test_unknown_templates_share_the_default_key(export_service):
+    """Test unknown template names cannot create extra cache entries or objects"""
+    default_key = export_service.cache_key(RESUME, "pdf", "professional-blue")
+
+    assert export_service.cache_key(RESUME, "pdf", "no-such-template") == default_key
+    assert export_service._stored_pdf_filename(
+        RESUME, "no-such-template"
+    ) == export_service._stored_pdf_filename(RESUME, "professional-blue")
+
+
+def test_lost_render_workers_ask_clients_to_retry():
+    """Test a render that lost its worker maps to 503 with Retry-After"""
+    error = _render_unavailable(BrokenProcessPool("worker died"))
+
+    assert error.status_code == 503
+    assert error.headers == {"Retry-After": str(RenderConfig.RETRY_AFTER_SECONDS)}
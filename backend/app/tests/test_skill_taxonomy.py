@@ -0,0 +1,50 @@
+"""Tests for the compiled skill matcher"""
+
+from app.services.pdf_parser_service import PDFParserService
+from app.services.resume_lines import tag_lines
+from app.services.skill_taxonomy import skill_matcher
+
+
+def test_skills_section_is_classified():
+    """Test known, partial and technology-like items are kept, noise is not"""
+    text = (
+        "Python, JavaScript • Java 17; and | with\n"
+        "Node.js, C#, Stakeholder Management, a, x, @@@ weird !!"
+    )
+
+    assert skill_matcher.classify(text) == [
+        "Python",
+        "JavaScript",
+        "Java 17",
+        "Node.js",
+        "C#",
+        "Stakeholder Management",
+    ]
+
+
+def test_partial_matches_and_synonyms():
+    """Test containment both ways and synonyms mapped to their skill"""
+    assert skill_matcher.classify("java") == ["java"]  # Part of "javascript"
+    assert skill_matcher.classify("aws lambda") == ["aws lambda"]  # Contains "aws"
+    assert skill_matcher.classify("k8s, golang") == ["Kubernetes", "Go"]
+    assert skill_matcher.classify("JS, JavaScript, Postgres") == [
+        "JavaScript",
+        "PostgreSQL",
+    ]
+    assert skill_matcher.classify("zzz") == []
+
+
+def test_duplicates_are_dropped_case_insensitively():
+    """Test the first spelling of a repeated skill is kept"""
+    assert skill_matcher.classify("Python, python, PYTHON, SQL") == ["Python", "SQL"]
+
+
+def test_extract_skills_uses_the_matcher():
+    """Test the parser joins the section lines and sets a default level"""
+    skills = PDFParserService._extract_skills(tag_lines("Python, Docker,\nKubernetes"))
+
+    assert skills == [
+        {"name": "Python", "level": "Intermediate"},
+        {"name": "Docker", "level": "Intermediate"},
+        {"name": "Kubernetes", "level": "Intermediate"},
+    ]
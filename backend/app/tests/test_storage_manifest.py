@@ -0,0 +1,173 @@
+"""Tests for the storage object manifest"""
+
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.storage_manifest import StorageManifest
+from app.services.storage_service import LocalStorageService
+
+
+class FakeHashClient:
+    """Just enough of the Redis hash commands for the manifest"""
+
+    def __init__(self):
+        self.hashes = {}
+        self.keys = set()
+
+    def hset(self, key, field, value):
+        self.hashes.setdefault(key, {})[field] = value
+
+    def hget(self, key, field):
+        return self.hashes.get(key, {}).get(field)
+
+    def hexists(self, key, field):
+        return field in self.hashes.get(key, {})
+
+    def hdel(self, key, *fields):
+        for field in fields:
+            self.hashes.get(key, {}).pop(field, None)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def set(self, key, value, nx=False, ex=None):
+        if nx and key in self.keys:
+            return None
+        self.keys.add(key)
+        return True
+
+
+@pytest.fixture
+def manifest():
+    return StorageManifest(
+        SimpleNamespace(client=FakeHashClient()), key="test:manifest"
+    )
+
+
+@pytest.fixture
+def storage(tmp_path, manifest):
+    return LocalStorageService(str(tmp_path / "bucket"), manifest)
+
+
+def test_filename_uses_per_resume_prefix(storage):
+    """Test stored objects are grouped under their resume"""
+    filename = storage.generate_pdf_filename(42, "modern", "ab" * 16)
+
+    assert filename.startswith("resumes/42/")
+    assert filename.endswith("resume_42_modern_" + "ab" * 8 + ".pdf")
+
+
+def test_upload_and_delete_maintain_manifest(storage, manifest):
+    """Test the index follows uploads and deletes"""
+    filename = storage.generate_pdf_filename(7, "modern")
+    storage.upload_pdf(b"%PDF-1.7", filename)
+
+    entry = manifest.get(filename)
+    assert entry["size"] == len(b"%PDF-1.7")
+    assert manifest.contains(filename) is True
+
+    storage.delete_pdf(filename)
+    assert manifest.contains(filename) is False
+
+
+def test_manifest_unavailable_defers_to_storage():
+    """Test lookups report unknown rather than missing without Redis"""
+    manifest = StorageManifest(SimpleNamespace(client=None))
+
+    assert manifest.contains("resumes/1/resume_1_modern.pdf") is None
+
+
+def test_reconcile_repairs_drift(storage, manifest):
+    """Test reconciliation adds missing entries and drops stale ones"""
+    kept = storage.generate_pdf_filename(1, "modern")
+    storage.upload_pdf(b"%PDF-1.7 kept", kept)
+    manifest.record("resumes/2/resume_2_modern.pdf", "deadbeef", 10)
+    manifest.remove(kept)
+
+    result = storage.reconcile_manifest()
+
+    assert result == {"added": 1, "updated": 0, "removed": 1, "legacy_deleted": 0}
+    assert manifest.contains(kept) is True
+    assert manifest.contains("resumes/2/resume_2_modern.pdf") is False
+    # Another worker within the interval skips the bucket walk
+    assert storage.reconcile_manifest() is None
+
+
+def test_upload_deletes_superseded_renders(storage, manifest):
+    """Test a new render replaces older ones of the same resume and template"""
+    old = storage.generate_pdf_filename(3, "modern-tech", "aa" * 16)
+    legacy = storage.generate_pdf_filename(3, "modern-tech")
+    other_template = storage.generate_pdf_filename(3, "modern", "bb" * 16)
+    other_resume = storage.generate_pdf_filename(30, "modern-tech", "cc" * 16)
+    for filename in (old, legacy, other_template, other_resume):
+        storage.upload_pdf(b"%PDF-1.7 old", filename)
+
+    new = storage.generate_pdf_filename(3, "modern-tech", "dd" * 16)
+    assert storage.upload_pdf(b"%PDF-1.7 new", new) is True
+
+    assert not storage.pdf_exists(old)
+    assert not storage.pdf_exists(legacy)
+    assert manifest.contains(old) is False
+    for filename in (new, other_template, other_resume):
+        assert storage.pdf_exists(filename)
+
+
+def test_delete_resume_pdfs_clears_its_prefix(storage, manifest):
+    """Test deleting a resume removes all of its stored PDFs only"""
+    mine = [
+        storage.generate_pdf_filename(4, "modern", "aa" * 16),
+        storage.generate_pdf_filename(4, "modern-tech", "bb" * 16),
+    ]
+    theirs = storage.generate_pdf_filename(44, "modern", "aa" * 16)
+    for filename in mine + [theirs]:
+        storage.upload_pdf(b"%PDF-1.7", filename)
+
+    assert storage.delete_resume_pdfs(4) is True
+
+    assert not any(storage.pdf_exists(filename) for filename in mine)
+    assert storage.pdf_exists(theirs)
+
+
+def test_reconcile_keeps_entries_recorded_during_the_listing(manifest):
+    """Test an upload indexed after the listing started is not dropped"""
+    listed_at = datetime.utcnow()
+    manifest.record("resumes/1/resume_1_modern.pdf", "a" * 64, 10)
+    manifest.record(
+        "resumes/2/resume_2_modern.pdf",
+        "b" * 64,
+        10,
+        (listed_at - timedelta(hours=1)).isoformat(),
+    )
+
+    result = manifest.reconcile({}, listed_at - timedelta(seconds=1))
+
+    assert result["removed"] == 1
+    assert manifest.contains("resumes/1/resume_1_modern.pdf") is True
+    assert manifest.contains("resumes/2/resume_2_modern.pdf") is False
+
+
+def test_listing_etags_are_not_content_hashes(manifest):
+    """Test listed eTags are kept apart from the SHA-256 of uploads"""
+    name = "resumes/1/resume_1_modern.pdf"
+    manifest.record(name, "a" * 64, 10, "2020-01-01T00:00:00")
+    listed = {"content_hash": None, "etag": "md5", "size": 10, "created_at": None}
+
+    # Same size and no comparable hash: the uploaded entry stays as it is
+    assert manifest.reconcile({name: listed})["updated"] == 0
+    assert manifest.get(name)["content_hash"] == "a" * 64
+
+    manifest.reconcile({name: dict(listed, size=11)})
+    assert manifest.get(name)["content_hash"] is None
+    assert manifest.get(name)["etag"] == "md5"
+
+
+def test_reconcile_deletes_legacy_root_level_pdfs(storage):
+    """Test renders from before per-resume prefixes are cleaned up"""
+    storage.upload_pdf(b"%PDF-1.7", "resume_9_modern.pdf")
+    storage.upload_pdf(b"%PDF-1.7", "notes.txt")
+
+    assert storage.reconcile_manifest()["legacy_deleted"] == 1
+    assert not storage.pdf_exists("resume_9_modern.pdf")
+    assert storage.backend.exists("notes.txt")
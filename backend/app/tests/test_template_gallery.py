@@ -0,0 +1,64 @@
+"""Tests for the precomputed template gallery"""
+
+from unittest.mock import patch
+
+from starlette.requests import Request
+
+from app.endpoints.resumes import _gallery_response
+from app.services.pdf_service import PDFService
+from app.services.template_gallery import TemplateGallery
+
+
+def _request(if_none_match=None):
+    headers = [(b"if-none-match", if_none_match.encode())] if if_none_match else []
+    return Request({"type": "http", "headers": headers})
+
+
+def test_build_renders_every_template_once():
+    """Test previews are rendered at build time and reused afterwards"""
+    gallery = TemplateGallery()
+    assert gallery.build() == len(set(PDFService.TEMPLATES.values()))
+
+    with patch.object(gallery, "_render_preview") as render:
+        for template in PDFService.TEMPLATES:
+            assert b"John Doe" in gallery.preview(template).content
+        render.assert_not_called()
+
+
+def test_preview_rerenders_when_template_file_changes():
+    """Test previews are keyed by the template file hash"""
+    gallery = TemplateGallery()
+    first = gallery.preview("modern-tech")
+
+    with patch(
+        "app.services.template_gallery.template_registry.version",
+        return_value="edited",
+    ):
+        assert gallery.preview("modern-tech") == first
+        assert gallery._previews["modern-tech.html"][0] == "edited"
+
+
+def test_catalog_groups_templates_by_category():
+    """Test the catalog body is built once with templates grouped by category"""
+    gallery = TemplateGallery()
+    catalog = gallery.catalog()
+
+    assert gallery.catalog() is catalog
+    assert b'"categories"' in catalog.content
+    assert b'"modern-tech"' in catalog.content
+
+
+def test_gallery_response_revalidates_with_etag():
+    """Test matching If-None-Match gets 304 and long-lived caching headers"""
+    body = TemplateGallery().catalog()
+
+    full = _gallery_response(_request(), body, "application/json")
+    assert full.status_code == 200
+    assert full.headers["etag"] == body.etag
+    assert "max-age=" in full.headers["cache-control"]
+
+    revalidated = _gallery_response(
+        _request(f'"other", {body.etag}'), body, "application/json"
+    )
+    assert revalidated.status_code == 304
+    assert revalidated.body == b""
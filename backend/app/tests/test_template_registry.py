@@ -0,0 +1,64 @@
+"""Tests for the compiled template registry"""
+
+import os
+import time
+
+from app.services.template_registry import TEMPLATE_DIR, TemplateRegistry
+
+
+def _write(path, content):
+    with open(path, "w") as f:
+        f.write(content)
+    # Make sure the mtime moves even on coarse-grained filesystems
+    stat = os.stat(path)
+    os.utime(path, (stat.st_atime, time.time() + 1))
+
+
+def test_compile_all_templates(tmp_path):
+    """Test every shipped template compiles once and is reused"""
+    registry = TemplateRegistry(TEMPLATE_DIR, str(tmp_path))
+
+    assert registry.compile_all() == 14
+    assert registry.get("modern-tech.html") is registry.get("modern-tech.html")
+    assert len(registry.version("modern-tech.html")) == 64
+
+
+def test_bytecode_cache_written(tmp_path):
+    """Test compiled bytecode is persisted to the cache directory"""
+    cache_dir = tmp_path / "cache"
+    registry = TemplateRegistry(TEMPLATE_DIR, str(cache_dir))
+    registry.get("professional-blue.html")
+
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_changed_template_hot_swaps_in_dev(tmp_path):
+    """Test changed template files are reloaded when hot reload is on"""
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    path = template_dir / "sample.html"
+    _write(path, "v1 {{ name }}")
+
+    registry = TemplateRegistry(str(template_dir), str(tmp_path), hot_reload=True)
+    first_version = registry.version("sample.html")
+    assert registry.get("sample.html").render(name="x") == "v1 x"
+
+    _write(path, "v2 {{ name }}")
+
+    assert registry.get("sample.html").render(name="x") == "v2 x"
+    assert registry.version("sample.html") != first_version
+
+
+def test_changed_template_ignored_in_production(tmp_path):
+    """Test compiled templates are never reloaded without hot reload"""
+    template_dir = tmp_path / "templates"
+    template_dir.mkdir()
+    path = template_dir / "sample.html"
+    _write(path, "v1")
+
+    registry = TemplateRegistry(str(template_dir), str(tmp_path))
+    assert registry.get("sample.html").render() == "v1"
+
+    _write(path, "v2")
+
+    assert registry.get("sample.html").render() == "v1"
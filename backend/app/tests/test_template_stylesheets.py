@@ -0,0 +1,83 @@
+"""Tests for fingerprinted template stylesheets in HTML previews"""
+
+from types import SimpleNamespace
+
+from app.services.pdf_service import PDFService
+from app.services.pdf_stylesheets import split_stylesheet
+from app.services.template_gallery import SAMPLE_RESUME
+from app.services.template_registry import template_registry
+from app.services.template_stylesheets import (
+    STYLESHEET_URL,
+    TemplateStylesheets,
+    template_stylesheets,
+)
+
+
+def _html(template="modern-tech", **customization):
+    sample = SimpleNamespace(
+        template=template, customization=customization, **SAMPLE_RESUME
+    )
+    return template_registry.get(PDFService._get_template_file(template)).render(
+        **PDFService._template_context(sample)
+    )
+
+
+def test_externalized_page_links_static_css():
+    """Test only the customization block stays inline"""
+    html = _html(primary_color="#ff0000")
+    _, static_css, override_css = split_stylesheet(html)
+    stylesheets = TemplateStylesheets()
+
+    page = stylesheets.externalize(html)
+    fingerprint = stylesheets.fingerprint(static_css)
+
+    assert STYLESHEET_URL.format(fingerprint) in page
+    assert static_css not in page
+    assert override_css in page
+    assert stylesheets.get(fingerprint).content == static_css.encode("utf-8")
+    assert len(page) < len(html)
+
+
+def test_customization_does_not_change_fingerprint():
+    """Test resumes sharing a template share its stylesheet URL"""
+    stylesheets = TemplateStylesheets()
+    stylesheets.externalize(_html(primary_color="#ff0000"))
+    stylesheets.externalize(_html(primary_color="#00ff00"))
+
+    assert len(stylesheets._stylesheets) == 1
+
+
+def test_pdf_input_is_unchanged():
+    """Test the externalized pieces recombine into what WeasyPrint renders"""
+    html = _html()
+    stylesheets = TemplateStylesheets()
+    page = stylesheets.externalize(html)
+    fingerprint = stylesheets.fingerprint(split_stylesheet(html)[1])
+
+    inlined = page.replace(
+        f'<link rel="stylesheet" href="{STYLESHEET_URL.format(fingerprint)}">',
+        "",
+    )
+    assert split_stylesheet(html)[0] == split_stylesheet(inlined)[0]
+    assert (
+        stylesheets.get(fingerprint).content.decode("utf-8")
+        == split_stylesheet(html)[1]
+    )
+
+
+def test_stylesheet_endpoint_is_immutable(client):
+    """Test stylesheets are served with long-lived caching and revalidation"""
+    page = template_stylesheets.externalize(_html())
+    fingerprint = template_stylesheets.fingerprint(split_stylesheet(_html())[1])
+    url = STYLESHEET_URL.format(fingerprint)
+    assert url in page
+
+    response = client.get(url)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/css")
+    assert "immutable" in response.headers["cache-control"]
+
+    cached = client.get(url, headers={"If-None-Match": response.headers["etag"]})
+    assert cached.status_code == 304
+
+    assert client.get(STYLESHEET_URL.format("0" * 20)).status_code == 404
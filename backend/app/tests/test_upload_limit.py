@@ -0,0 +1,69 @@
+"""Tests for request body limits enforced while uploads arrive"""
+
+import pytest
+from fastapi import FastAPI, File, UploadFile
+from fastapi.testclient import TestClient
+
+from app.core.upload_limit import UploadLimitMiddleware
+
+
+@pytest.fixture
+def client():
+    app = FastAPI()
+    app.add_middleware(UploadLimitMiddleware, limits={"/upload": 1000})
+    received = []
+
+    @app.post("/upload")
+    async def upload(file: UploadFile = File(...)):
+        received.append(await file.read())
+        return {"size": len(received[-1])}
+
+    @app.post("/other")
+    async def other(file: UploadFile = File(...)):
+        return {"size": len(await file.read())}
+
+    client = TestClient(app)
+    client.received = received
+    return client
+
+
+def test_uploads_within_the_limit_pass(client):
+    """Test small bodies reach the endpoint unchanged"""
+    response = client.post("/upload", files={"file": ("a.pdf", b"x" * 100)})
+
+    assert response.status_code == 200
+    assert response.json() == {"size": 100}
+
+
+def test_declared_length_over_the_limit_is_refused(client):
+    """Test a large Content-Length is refused before the endpoint runs"""
+    response = client.post("/upload", files={"file": ("a.pdf", b"x" * 5000)})
+
+    assert response.status_code == 413
+    assert client.received == []
+
+
+def test_streamed_body_over_the_limit_is_refused(client):
+    """Test bodies without a Content-Length are cut off at the limit"""
+    body = b"--b\r\nContent-Disposition: form-data; name=file; filename=a.pdf\r\n\r\n"
+
+    def chunks():
+        yield body
+        for _ in range(10):
+            yield b"x" * 500
+
+    response = client.post(
+        "/upload",
+        content=chunks(),
+        headers={"Content-Type": "multipart/form-data; boundary=b"},
+    )
+
+    assert response.status_code == 413
+    assert client.received == []
+
+
+def test_other_paths_are_not_limited(client):
+    """Test only the configured paths are limited"""
+    response = client.post("/other", files={"file": ("a.pdf", b"x" * 5000)})
+
+    assert response.status_code == 200
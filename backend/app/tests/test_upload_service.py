@@ -0,0 +1,77 @@
+"""Tests for the background storage uploader"""
+
+from unittest.mock import MagicMock
+
+from app.core.metrics import sample_value
+from app.services.upload_service import BackgroundUploader
+
+
+def _uploader(storage, **overrides):
+    options = {"max_retries": 2, "backoff_base": 0, "max_queue": 10}
+    options.update(overrides)
+    return BackgroundUploader(storage_factory=lambda: storage, **options)
+
+
+def test_upload_runs_in_background():
+    """Test queued uploads reach storage"""
+    storage = MagicMock()
+    storage.upload_pdf.return_value = True
+    uploader = _uploader(storage)
+
+    assert uploader.enqueue(b"%PDF-1", "resume_1_modern.pdf") is True
+    uploader.join()
+
+    storage.upload_pdf.assert_called_once_with(b"%PDF-1", "resume_1_modern.pdf")
+
+
+def test_upload_retries_with_backoff():
+    """Test failed uploads are retried until they succeed"""
+    storage = MagicMock()
+    storage.upload_pdf.side_effect = [False, Exception("timeout"), True]
+    uploader = _uploader(storage)
+
+    uploader.enqueue(b"%PDF-1", "resume_1_modern.pdf")
+    uploader.join()
+
+    assert storage.upload_pdf.call_count == 3
+
+
+def test_identical_content_is_deduplicated():
+    """Test the same bytes at the same path are uploaded only once"""
+    storage = MagicMock()
+    storage.upload_pdf.return_value = True
+    uploader = _uploader(storage)
+    before = sample_value("resumade_uploads_total", result="deduplicated")
+
+    uploader.enqueue(b"%PDF-1", "resume_1_modern.pdf")
+    assert uploader.enqueue(b"%PDF-1", "resume_1_modern.pdf") is False
+    uploader.enqueue(b"%PDF-2", "resume_1_modern.pdf")
+    uploader.join()
+
+    assert storage.upload_pdf.call_count == 2
+    assert sample_value("resumade_uploads_total", result="deduplicated") == before + 1
+
+
+def test_failed_upload_can_be_queued_again():
+    """Test content is not deduplicated after all retries failed"""
+    storage = MagicMock()
+    storage.upload_pdf.return_value = False
+    uploader = _uploader(storage, max_retries=1)
+
+    uploader.enqueue(b"%PDF-1", "resume_1_modern.pdf")
+    uploader.join()
+
+    assert storage.upload_pdf.call_count == 2
+    assert uploader.enqueue(b"%PDF-1", "resume_1_modern.pdf") is True
+    uploader.join()
+
+
+def test_full_queue_drops_upload():
+    """Test enqueue never blocks when the queue is full"""
+    uploader = _uploader(MagicMock(), max_queue=1)
+    # Keep the worker from draining the queue
+    uploader._ensure_worker = lambda: None
+
+    assert uploader.enqueue(b"a", "resume_1_a.pdf") is True
+    assert uploader.enqueue(b"b", "resume_2_b.pdf") is False
+    assert uploader.depth == 1
@@ -0,0 +1,86 @@
+"""Benchmark the lean DOCX writer against python-docx's object layer
+
+Usage (from backend/):
+    python -m benchmarks.docx_writer [--runs N]
+"""
+
+import argparse
+import statistics
+import time
+from io import BytesIO
+
+from app.services.docx_service import DOCXService
+from benchmarks.sample_data import sample_resume
+
+SECTIONS = (
+    "personal_info",
+    "experience",
+    "education",
+    "skills",
+    "certifications",
+    "projects",
+)
+
+
+def _resume_data(resume) -> dict:
+    return {section: getattr(resume, section) for section in SECTIONS}
+
+
+def small_resume() -> dict:
+    return {
+        "personal_info": {"full_name": "Jane Doe", "email": "jane.doe@example.com"},
+        "experience": [{"position": "Engineer", "company": "Acme"}],
+    }
+
+
+def maximal_resume() -> dict:
+    """Every section filled well past what a real resume holds"""
+    data = _resume_data(sample_resume())
+    data["experience"] = [
+        dict(exp, achievements=[f"Achievement {i}" for i in range(5)])
+        for exp in data["experience"] * 5
+    ]
+    data["education"] = data["education"] * 4
+    data["skills"] = data["skills"] * 8
+    data["certifications"] = data["certifications"] * 10
+    data["projects"] = data["projects"] * 10
+    return data
+
+
+def python_docx(resume_data: dict) -> bytes:
+    buffer = BytesIO()
+    DOCXService._build_document(resume_data).save(buffer)
+    return buffer.getvalue()
+
+
+def _time_ms(func, resume_data: dict, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(resume_data)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'resume':<12}{'python-docx ms':>16}{'lean ms':>10}{'saved':>9}")
+    for name, resume_data in (
+        ("small", small_resume()),
+        ("maximal", maximal_resume()),
+    ):
+        # Warm up both paths so the base package is prepared before timing
+        python_docx(resume_data)
+        DOCXService.generate_resume_docx(resume_data)
+
+        baseline = _time_ms(python_docx, resume_data, args.runs)
+        lean = _time_ms(DOCXService.generate_resume_docx, resume_data, args.runs)
+        saved = (baseline - lean) / baseline * 100
+        print(f"{name:<12}{baseline:>16.1f}{lean:>10.1f}{saved:>8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark pre-parsed stylesheets against plain WeasyPrint renders
+
+Usage (from backend/):
+    python -m benchmarks.pdf_stylesheets [--runs N]
+"""
+
+import argparse
+import statistics
+import time
+
+from weasyprint import HTML
+
+from app.services.pdf_service import PDFService
+from app.services.pdf_stylesheets import render_pdf_with_stylesheets, split_stylesheet
+from app.services.template_registry import template_registry
+from benchmarks.sample_data import sample_resume
+
+CUSTOMIZATIONS = [
+    None,
+    {"primary_color": "#1d4ed8", "font_size": "11"},
+    {
+        "primary_color": "#be123c",
+        "secondary_color": "#f59e0b",
+        "font_family": "Georgia",
+    },
+]
+
+
+def _time_ms(func, runs: int) -> float:
+    samples = []
+    for i in range(runs):
+        start = time.perf_counter()
+        func(i)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'template':<28}{'baseline ms':>14}{'pre-parsed ms':>16}{'saved':>9}")
+    totals = [0.0, 0.0]
+    for name, template_file in PDFService.TEMPLATES.items():
+        template = template_registry.get(template_file)
+        pages = [
+            template.render(
+                resume=resume,
+                section_order=resume.section_order,
+                custom_sections=resume.custom_sections,
+            )
+            for resume in (sample_resume(c) for c in CUSTOMIZATIONS)
+        ]
+        parts = [split_stylesheet(html) for html in pages]
+
+        # Warm up both paths so only steady-state renders are measured
+        HTML(string=pages[0]).write_pdf()
+        render_pdf_with_stylesheets(*parts[0])
+
+        baseline = _time_ms(
+            lambda i: HTML(string=pages[i % len(pages)]).write_pdf(), args.runs
+        )
+        preparsed = _time_ms(
+            lambda i: render_pdf_with_stylesheets(*parts[i % len(parts)]), args.runs
+        )
+        totals[0] += baseline
+        totals[1] += preparsed
+        saved = (baseline - preparsed) / baseline * 100
+        print(f"{name:<28}{baseline:>14.1f}{preparsed:>16.1f}{saved:>8.1f}%")
+
+    saved = (totals[0] - totals[1]) / totals[0] * 100
+    print(f"{'total':<28}{totals[0]:>14.1f}{totals[1]:>16.1f}{saved:>8.1f}%")
+
+
+if __name__ == "__main__":
+    main()
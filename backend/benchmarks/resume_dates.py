@@ -0,0 +1,97 @@
+"""Benchmark the date-range recognizer against fuzzy dateutil parsing
+
+Usage (from backend/):
+    python -m benchmarks.resume_dates [--runs N]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+
+from dateutil import parser as date_parser
+
+from app.services.resume_dates import _parse_date, parse_date_range
+
+MONTHS = ("Jan", "February", "Mar", "Sept", "Oct", "December")
+ENDS = ("Present", "Current", "Dec 2023", "2024", "06/2022")
+
+
+def dateutil_date_range(text: str):
+    """The range parser before the recognizer, with every part sent to dateutil"""
+    text = text.strip()
+    text_lower = text.lower()
+    is_current = (
+        "present" in text_lower or "current" in text_lower or "now" in text_lower
+    )
+    parts = re.split(r"\s*[-–—to]\s*", text, maxsplit=1, flags=re.IGNORECASE)
+
+    def month(part):
+        try:
+            return date_parser.parse(part, fuzzy=True).strftime("%Y-%m")
+        except Exception:
+            year_match = re.search(r"\b(19|20)\d{2}\b", part)
+            return year_match.group() if year_match else ""
+
+    start_date = month(parts[0])
+    end_date = ""
+    if len(parts) > 1:
+        end_date = "Present" if is_current else month(parts[1])
+    elif is_current:
+        end_date = "Present"
+    return start_date, end_date, is_current
+
+
+def date_lines(count: int, seed: int = 0) -> list:
+    """Dated lines in the layouts resumes use"""
+    rng = random.Random(seed)
+    lines = []
+    for _ in range(count):
+        year = rng.randint(2005, 2023)
+        start = rng.choice(
+            (
+                f"{rng.choice(MONTHS)} {year}",
+                f"{year}",
+                f"{rng.randint(1, 12):02d}/{year}",
+            )
+        )
+        lines.append(f"{start} {rng.choice(('-', '–', 'to'))} {rng.choice(ENDS)}")
+    return lines
+
+
+def _time_ms(func, lines: list, runs: int, cold: bool) -> float:
+    samples = []
+    for _ in range(runs):
+        if cold:
+            _parse_date.cache_clear()
+        start = time.perf_counter()
+        for line in lines:
+            func(line)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    lines = date_lines(200)
+    assert [dateutil_date_range(line) for line in lines] == [
+        parse_date_range(line) for line in lines
+    ]
+
+    baseline = _time_ms(dateutil_date_range, lines, args.runs, cold=False)
+    print(f"{'200 date ranges':<28}{'ms':>8}{'speedup':>10}")
+    print(f"{'dateutil':<28}{baseline:>8.2f}")
+    for label, cold in (
+        ("recognizer, cold cache", True),
+        ("recognizer, warm cache", False),
+    ):
+        elapsed = _time_ms(parse_date_range, lines, args.runs, cold=cold)
+        print(f"{label:<28}{elapsed:>8.2f}{baseline / elapsed:>9.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Representative resume used by the benchmarks"""
+
+from types import SimpleNamespace
+
+
+def sample_resume(customization=None) -> SimpleNamespace:
+    """Build a mid-sized resume with every standard section filled in"""
+    return SimpleNamespace(
+        id=0,
+        title="Benchmark Resume",
+        template="professional-blue",
+        personal_info={
+            "full_name": "Jane Doe",
+            "email": "jane.doe@example.com",
+            "phone": "(555) 123-4567",
+            "location": "New York, NY",
+            "linkedin": "https://linkedin.com/in/janedoe",
+            "website": "https://janedoe.dev",
+            "summary": "Software engineer with 8 years of experience building "
+            "web platforms, data pipelines and developer tooling.",
+        },
+        experience=[
+            {
+                "company": f"Company {i}",
+                "position": "Senior Software Engineer",
+                "location": "Remote",
+                "start_date": f"Jan {2016 + i}",
+                "end_date": f"Dec {2017 + i}",
+                "current": False,
+                "description": "Led a team of five engineers\n"
+                "Cut p95 API latency by 40% with query tuning\n"
+                "Built CI/CD pipelines used by 30 services",
+            }
+            for i in range(4)
+        ],
+        education=[
+            {
+                "institution": "State University",
+                "degree": "Bachelor of Science",
+                "field_of_study": "Computer Science",
+                "location": "Boston, MA",
+                "start_date": "2011",
+                "end_date": "2015",
+                "gpa": "3.7/4.0",
+            }
+        ],
+        skills=[
+            {"name": name, "level": "Advanced"}
+            for name in ["Python", "JavaScript", "React", "PostgreSQL", "Docker", "AWS"]
+        ],
+        certifications=[
+            {"name": "AWS Solutions Architect", "issuer": "Amazon", "date": "2022"}
+        ],
+        projects=[
+            {
+                "name": "Open Source CLI",
+                "description": "Command-line tool for managing cloud resources",
+                "technologies": ["Python", "Click"],
+                "url": "https://github.com/janedoe/cli",
+            }
+        ],
+        customization=customization,
+        section_order=[
+            "summary",
+            "experience",
+            "education",
+            "skills",
+            "certifications",
+            "projects",
+        ],
+        custom_sections=[],
+    )
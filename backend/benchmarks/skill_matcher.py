@@ -0,0 +1,97 @@
+"""Benchmark the compiled skill matcher against the linear vocabulary scan
+
+Usage (from backend/):
+    python -m benchmarks.skill_matcher [--runs N]
+"""
+
+import argparse
+import random
+import re
+import statistics
+import time
+
+from app.services.skill_taxonomy import KNOWN_SKILLS, NOISE_WORDS, skill_matcher
+
+FILLER = ("Stakeholder alignment", "Mentoring", "Code review", "on-call", "and")
+
+
+def linear_is_valid_skill(skill: str) -> bool:
+    """The per-item check before the matcher was compiled"""
+    skill_lower = skill.lower().strip()
+    if skill_lower in NOISE_WORDS:
+        return False
+    if len(skill) < 2 or len(skill) > 50:
+        return False
+    special_char_count = sum(
+        1 for c in skill if not c.isalnum() and c not in [" ", ".", "+", "#", "-", "/"]
+    )
+    if special_char_count > 2:
+        return False
+    if skill_lower in KNOWN_SKILLS:
+        return True
+    for known_skill in KNOWN_SKILLS:
+        if known_skill in skill_lower or skill_lower in known_skill:
+            return True
+    if re.search(r"\d+\.?\d*", skill) or "." in skill or "+" in skill or "#" in skill:
+        return True
+    if skill[0].isupper() and 3 <= len(skill) <= 30:
+        return True
+    return False
+
+
+def linear_scan(text: str) -> list:
+    skills, seen = [], set()
+    for item in re.split(r"[,;•·\n\t|]", text):
+        item = item.strip()
+        if item and linear_is_valid_skill(item) and item.lower() not in seen:
+            seen.add(item.lower())
+            skills.append(item)
+    return skills
+
+
+def skills_section(items: int, seed: int = 0) -> str:
+    """A skills section of known skills, versions, misses and filler"""
+    rng = random.Random(seed)
+    vocabulary = sorted(KNOWN_SKILLS)
+    words = []
+    for i in range(items):
+        kind = rng.random()
+        if kind < 0.5:
+            words.append(rng.choice(vocabulary).title())
+        elif kind < 0.7:
+            words.append(f"{rng.choice(vocabulary)} {rng.randint(1, 20)}")
+        elif kind < 0.85:
+            words.append(rng.choice(FILLER))
+        else:
+            words.append(f"tool{i}")
+    return " • ".join(", ".join(words[i : i + 8]) for i in range(0, items, 8))
+
+
+def _time_ms(func, text: str, runs: int) -> float:
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        func(text)
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'items':<10}{'linear ms':>12}{'compiled ms':>14}{'speedup':>10}")
+    for items in (50, 500, 5000):
+        text = skills_section(items)
+        assert linear_scan(text) == skill_matcher.classify(text)
+
+        baseline = _time_ms(linear_scan, text, args.runs)
+        compiled = _time_ms(skill_matcher.classify, text, args.runs)
+        print(
+            f"{items:<10}{baseline:>12.2f}{compiled:>14.2f}{baseline / compiled:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
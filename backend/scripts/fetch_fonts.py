@@ -0,0 +1,158 @@
+"""Download the bundled font pack and build its fontconfig cache
+
+Every face is pinned in app/fonts/manifest.json by package version and
+SHA-256. Run at image build time (from backend/):
+    python scripts/fetch_fonts.py --frozen
+
+Without --frozen, families that have no version yet (or whose version was
+cleared to upgrade them) are resolved and pinned first, and the manifest
+is rewritten; commit it so later fetches are verified. --lock only pins:
+    python scripts/fetch_fonts.py --lock
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import urllib.request
+from typing import Optional
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.core.fonts import (  # noqa: E402
+    FONT_FILES_DIR,
+    MANIFEST_FILE,
+    build_font_cache,
+    font_faces,
+    font_filename,
+    load_manifest,
+)
+
+
+def file_digest(path: str) -> str:
+    with open(path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def download(url: str, path: str, expected: Optional[str] = None) -> str:
+    """Download to a temp file beside path and move it into place
+
+    An interrupted or mismatched download never reaches path. Returns the
+    SHA-256 of the file.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as f, urllib.request.urlopen(url) as response:
+            f.write(response.read())
+        digest = file_digest(tmp_path)
+        if expected and digest != expected:
+            raise ValueError(
+                f"{os.path.basename(path)} does not match its pinned SHA-256"
+            )
+        os.replace(tmp_path, path)
+        return digest
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def resolve_version(manifest: dict, family: dict) -> str:
+    with urllib.request.urlopen(manifest["resolve"].format(id=family["id"])) as r:
+        return json.load(r)["version"]
+
+
+def write_manifest(manifest: dict):
+    families = ",\n".join(f"    {json.dumps(f)}" for f in manifest["families"])
+    header = {k: v for k, v in manifest.items() if k != "families"}
+    lines = [f"  {json.dumps(k)}: {json.dumps(v)}," for k, v in header.items()]
+    with open(MANIFEST_FILE, "w") as f:
+        f.write("{\n" + "\n".join(lines) + '\n  "families": [\n')
+        f.write(families + "\n  ]\n}\n")
+
+
+def unpinned(manifest: dict) -> list:
+    """Names of manifest families without a version or a digest for every face"""
+    return [
+        family["family"]
+        for family in manifest["families"]
+        if not family.get("version")
+        or any(
+            font_filename(family["id"], weight, style) not in family.get("sha256", {})
+            for weight, style in font_faces(family)
+        )
+    ]
+
+
+def lock(manifest: dict):
+    """Pin unversioned families and record the digest of every face"""
+    for family in manifest["families"]:
+        if not family.get("version"):
+            family["version"] = resolve_version(manifest, family)
+            family["sha256"] = {}
+        for weight, style in font_faces(family):
+            name = font_filename(family["id"], weight, style)
+            if name in family["sha256"]:
+                continue
+            url = manifest["source"].format(
+                id=family["id"], version=family["version"], weight=weight, style=style
+            )
+            print(f"Locking {family['family']} {family['version']} {weight} {style}")
+            family["sha256"][name] = download(url, os.path.join(FONT_FILES_DIR, name))
+    write_manifest(manifest)
+
+
+def fetch(manifest: dict):
+    """Download every face whose file is missing or does not match its pin"""
+    for family in manifest["families"]:
+        for weight, style in font_faces(family):
+            name = font_filename(family["id"], weight, style)
+            expected = family.get("sha256", {}).get(name)
+            if not family.get("version") or not expected:
+                sys.exit(f"{name} is not pinned; run scripts/fetch_fonts.py --lock")
+
+            path = os.path.join(FONT_FILES_DIR, name)
+            if os.path.exists(path) and file_digest(path) == expected:
+                continue
+            url = manifest["source"].format(
+                id=family["id"], version=family["version"], weight=weight, style=style
+            )
+            print(f"Fetching {family['family']} {weight} {style}")
+            try:
+                download(url, path, expected)
+            except ValueError as e:
+                sys.exit(str(e))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--lock", action="store_true", help="pin versions and record digests"
+    )
+    parser.add_argument(
+        "--frozen", action="store_true", help="refuse families that are not pinned"
+    )
+    args = parser.parse_args()
+
+    manifest = load_manifest()
+    os.makedirs(FONT_FILES_DIR, exist_ok=True)
+    if args.lock:
+        lock(manifest)
+    else:
+        families = unpinned(manifest)
+        if families and not args.frozen:
+            lock(manifest)
+            print(
+                f"Pinned {', '.join(families)}; commit {MANIFEST_FILE} "
+                "so later fetches are verified"
+            )
+        fetch(manifest)
+
+    if not build_font_cache():
+        sys.exit("Font cache was not built")
+
+
+if __name__ == "__main__":
+    main()